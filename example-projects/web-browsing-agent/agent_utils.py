@@ -1,4 +1,3 @@
-import requests
 from pydantic import BaseModel
 import os
 from dotenv import load_dotenv
@@ -8,6 +7,12 @@ from google import genai
 from openai import OpenAI
 from colorama import Fore, Back, Style
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import sys
+
+# Shared helpers (HTTP cache, pooled HTTP client, HTML-to-text, passage index) live in shared/utils at the repo root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+from passage_index import search_article
 
 load_dotenv()
 
@@ -22,18 +27,20 @@ client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
 def generate_call_id(prefix="call_"):
     return f"{prefix}{uuid.uuid4()}"
 
-def search_wikipedia(query):
+def search_wikipedia(query, question=None):
     from urllib.parse import quote
+    # Articles are split into passages and indexed (BM25) the first time they're fetched;
+    # searching an article that's already indexed doesn't touch the network
+    found = search_article(query, question)
     query = quote(query)
-    url = f"https://en.wikipedia.org/api/rest_v1/page/mobile-html/{query}"
-    print(Fore.YELLOW + f'Fetching url: {url}....' + Style.DIM)
-    print()
-    response = requests.get(url)
-    if response.status_code == 200:
-        summary = response.text
+    if found is not None:
+        print(Fore.YELLOW + f'Fetched url: {found.url} ({"downloaded" if found.fetched else "indexed"})' + Style.DIM)
+        print()
+        # Only the passages that best match the question (and their links), not the whole article
+        summary = found.prompt_text()
         response = client.models.generate_content(
         model="gemini-3.5-flash",
-        contents=f"You are responsible for extracting the answer from the wikipedia article. The query is: {query}. You must extract the answer from the wikipedia article, do not make up any information. If the answer is not found, return the answer as 'No answer found'. Also return the links to the wikipedia article or any related articles found in the extracted text. The wikipedia article is: {summary}",
+        contents=f"You are responsible for extracting the answer from the wikipedia article. The query is: {query}. The user's question is: {question}. You must extract the answer from the passages of the wikipedia article, do not make up any information. If the answer is not found, return the answer as 'No answer found'. Also return the links to the wikipedia article or any related articles found in the extracted text. The passages of the wikipedia article are: {summary}",
         config={
             "response_mime_type": "application/json",
             "response_schema": SearchResult
@@ -41,9 +48,28 @@ def search_wikipedia(query):
         )
         return response.text
     else:
-        print(Fore.RED + f"Invalid search query. No articles found. Status code: {response.status_code}" + Style.DIM)
+        print(Fore.RED + "Invalid search query. No articles found." + Style.DIM)
         return "Invalid search query. No articles found."
 
+# Most tool calls from one model turn that run at the same time
+MAX_PARALLEL_TOOL_CALLS = 8
+
+def search_in_parallel(tool_calls, question=None):
+    """Run one turn's encyclopedia_search calls at the same time (each is a Wikipedia lookup + a Gemini call).
+
+    Returns a dict of tool_call.id -> search results, so the turn takes as long as
+    its slowest search instead of the sum of all of them.
+    """
+    searches = [tool_call for tool_call in tool_calls if tool_call.function.name == "encyclopedia_search"]
+    if not searches:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_TOOL_CALLS, len(searches))) as pool:
+        futures = {
+            tool_call.id: pool.submit(search_wikipedia, json.loads(tool_call.function.arguments).get("query"), question)
+            for tool_call in searches
+        }
+        return {call_id: future.result() for call_id, future in futures.items()}
+
 def chat_turns_to_string(messages: list[dict]):
     return "\n".join([f"{message['role']}: {message['content']}" for message in messages])
 
@@ -65,6 +91,8 @@ def generate_reflection(messages: list[dict]):
 
 def integrate_api_calls_with_gemini(model: str = "gemini-3.5-flash", max_iterations: int = 5, query: str = None, messages: list[dict] = None, query_style: str = None):
     count = 0
+    # Passages are ranked by the user's question (`query` is reused for each search below)
+    question = query
     client = OpenAI(
         api_key=os.environ['GEMINI_API_KEY'],
         base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
@@ -184,15 +212,21 @@ def integrate_api_calls_with_gemini(model: str = "gemini-3.5-flash", max_iterati
         if response.choices[0].message.tool_calls:
             tool_calls = response.choices[0].message.tool_calls
             for tool_call in tool_calls:
-                args = json.loads(tool_call.function.arguments)
                 tool_call.id = generate_call_id()
+            # Calls after an answer are never used, so only search up to the first answer_question
+            names = [tool_call.function.name for tool_call in tool_calls]
+            if "answer_question" in names:
+                tool_calls = tool_calls[:names.index("answer_question") + 1]
+            search_results = search_in_parallel(tool_calls, question)
+            for tool_call in tool_calls:
+                args = json.loads(tool_call.function.arguments)
                 if tool_call.function.name == "encyclopedia_search":
                     query = args.get("query")
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
                         "name": tool_call.function.name,
-                        "content": f"Encyclopedia search: {query}, Results: {search_wikipedia(query)}"
+                        "content": f"Encyclopedia search: {query}, Results: {search_results[tool_call.id]}"
                     })
                 elif tool_call.function.name == "answer_question":
                     answer = args.get("answer", "")
@@ -1,285 +1,103 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
+import copy
 import os
 import sys
 import uuid
-import json
-import random
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # Add the parent directory to the path so we can import from class1
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'class1'))
+# Shared helpers (word index, etc.) live in shared/utils at the repo root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+
+from game import (
+    BATCH_LIMIT, GUESS, HINT, WordleGameSession, batch_validate, cache_reply, cached_reply, dictionary,
+    get_llm_client, get_word_of_the_day, hint_cache, llm_stats, restore_games, sse_event, stream_text,
+)
+from session_store import create_session_store
+from static_assets import StaticAssets
+from tracing import METRICS_CONTENT_TYPE, finish_trace, metrics_text, span, start_trace
 
 load_dotenv('../class1/.env')
 
 app = Flask(__name__)
 CORS(app, origins=['http://localhost:5001', 'http://127.0.0.1:5001', '*'])
 
-# Global storage for active games (in production, use a proper database)
-active_games = {}
-
-class WordleGameSession:
-    def __init__(self, game_id, word_of_the_day, model="gemini-3.5-flash"):
-        self.game_id = game_id
-        self.word_of_the_day = word_of_the_day
-        self.model = model
-        self.messages = [
-            {"role": "system", "content": f"You are a Wordle game that the user plays via chat. The word the user is trying to guess is: {word_of_the_day}, they have 6 guesses! Call validate_word() when you receive a user's guess. Call end_game() when the game is over (won, lost, or after 6 guesses). You are responsible for driving the game loop. Each round the system will validate the guess and give them the hint (using color emojis, green 🟩 corresponds to letter in correct position, yellow 🟨 corresponds to letter in incorrect position, and gray ⬜ corresponds to letter not in the word) that you should display."},
-            {"role": "user", "content": "[system] Start a new Wordle game"},
-        ]
-        self.curr_guess = ""
-        self.hints_messages = []
-        self.client = OpenAI(
-            api_key=os.environ['GEMINI_API_KEY'],
-            base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
-        )
-        self.game_over = False
-        self.attempts = 0
-        self.max_attempts = 6
-        self.won = False
-        
-    def get_initial_message(self):
-        """Get the initial AI response to start the game"""
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=self.messages,
-                temperature=0.0
-            )
-            
-            if response.choices[0].message.content:
-                ai_message = response.choices[0].message.content
-                self.messages.append({
-                    "role": "assistant", 
-                    "content": ai_message
-                })
-                return ai_message
-            else:
-                return "Welcome to Wordle! I'm thinking of a 5-letter word. You have 6 attempts to guess it!"
-                
-        except Exception as e:
-            print(f"Error getting initial message: {e}")
-            return "Welcome to Wordle! I'm thinking of a 5-letter word. You have 6 attempts to guess it!"
-    
-    def process_guess(self, guess):
-        """Process a user's guess and return the AI response"""
-        if self.game_over:
-            return {
-                "success": False,
-                "error": "Game is already over",
-                "game_over": True
-            }
-            
-        if len(guess) != 5:
-            return {
-                "success": False,
-                "error": "Guess must be exactly 5 letters"
-            }
-                
-        try:
-            # Add user's guess to messages
-            self.messages.append({
-                "role": "user",
-                "content": f"My guess is: {guess.upper()}"
-            })
-            
-            # Get AI response with function calling
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=self.messages,
-                temperature=0.0,
-                tools=[
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": "validate_word",
-                            "description": "Validate the user's guess for the Wordle game and provide feedback",
-                            "parameters": {
-                                "type": "object",
-                                "properties": {
-                                    "guess": {"type": "string", "description": "The user's 5-letter guess"}
-                                },
-                                "required": ["guess"]
-                            }
-                        }
-                    },
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": "end_game",
-                            "description": "Call this function to end the game",
-                            "parameters": {
-                                "type": "object",
-                                "properties": {
-                                    "reason": {"type": "string", "description": "The reason for ending the game", "enum": ["WON", "LOST", "QUIT"]},
-                                    "answer": {"type": "string", "description": "The correct answer"}
-                                },
-                                "required": ["reason", "answer"]
-                            }
-                        }
-                    },
-                ]
-            )
-            
-            ai_message = ""
-            feedback = None
-            
-            # Handle tool calls
-            if response.choices[0].message.tool_calls:
-                tool_calls = response.choices[0].message.tool_calls
-                
-                # Add assistant message with tool calls
-                if response.choices[0].message.content:
-                    ai_message = response.choices[0].message.content
-                    
-                self.messages.append({
-                    "role": "assistant",
-                    "content": response.choices[0].message.content or "",
-                    "tool_calls": tool_calls
-                })
-                
-                for tool_call in tool_calls:
-                    tool_call.id = self.generate_call_id()
-                    
-                    if tool_call.function.name == "validate_word":
-                        feedback = self.validate_word(guess, self.word_of_the_day)
-                        # Only increment attempts for valid words (feedback is not None and not empty)
-                        if feedback["feedback"] is not None and len(feedback["feedback"]) > 0:
-                            self.attempts += 1
-                            self.curr_guess = guess
-                        self.messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "name": "validate_word",
-                            "content": feedback["message"]
-                        })
-                        
-                    elif tool_call.function.name == "end_game":
-                        args = json.loads(tool_call.function.arguments)
-                        reason = args.get("reason", "QUIT")
-                        
-                        if reason == "WON":
-                            self.won = True
-                        
-                        self.game_over = True
-                        
-                        self.messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "name": "end_game", 
-                            "content": f"Game ended: {reason}. Answer was: {self.word_of_the_day}"
-                        })
-                
-                # Get final AI response after tool calls
-                if not self.game_over or len([tc for tc in tool_calls if tc.function.name == "end_game"]) > 0:
-                    final_response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=self.messages,
-                        temperature=0.0
-                    )
-                    
-                    if final_response.choices[0].message.content:
-                        ai_message = final_response.choices[0].message.content
-                        self.messages.append({
-                            "role": "assistant",
-                            "content": ai_message
-                        })
-            
-            elif response.choices[0].message.content:
-                ai_message = response.choices[0].message.content
-                self.messages.append({
-                    "role": "assistant",
-                    "content": ai_message
-                })
-            
-            # Check if game should end due to max attempts
-            if self.attempts >= self.max_attempts and not self.game_over:
-                self.game_over = True
-                ai_message += f" Game Over! The word was: {self.word_of_the_day}"
-            
-            return {
-                "success": True,
-                "message": ai_message,
-                "feedback": feedback["feedback"] if feedback else None,
-                "game_over": self.game_over,
-                "won": self.won,
-                "answer": self.word_of_the_day if self.game_over else None,
-                "attempts": self.attempts
-            }
-            
-        except Exception as e:
-            print(f"Error processing guess: {e}")
-            return {
-                "success": False,
-                "error": f"Error processing guess: {str(e)}"
-            }
-    
-    def validate_word(self, guess, correct_word):
-        """Validate a guess and return feedback"""
-        if not guess or len(guess.strip()) != 5:
-            return {
-                "message": "Invalid Input, word must be exactly 5 letters long",
-                "feedback": None
-            }
-
-        guess = guess.strip().lower()
-        correct_word = correct_word.strip().lower()
-        if guess not in dictionary:
-            return {
-                "message": f"Invalid Input, word not in the dictionary!",
-                "feedback": None
-            }
-        if guess == correct_word:
-            return {
-                "message": f"Correct! You guessed the word {correct_word}",
-                "feedback": ["🟩", "🟩", "🟩", "🟩", "🟩"]
-            }
-        else:
-            result = []
-            for i in range(5):
-                if guess[i] == correct_word[i]:
-                    result.append("🟩")
-                elif guess[i] in correct_word:
-                    result.append("🟨")
-                else:
-                    result.append("⬜")
-            
-            return {
-                "message": f'Hint: {" ".join(result)}',
-                "feedback": result
-            }
-    
-    def generate_call_id(self, prefix="call_"):
-        return f"{prefix}{uuid.uuid4()}"
-
-def get_word_of_the_day(filename="../class1/wordle.txt"):
-    """Get a random word from the word list"""
-    try:
-        with open(filename, "r") as file:
-            words = [line.strip() for line in file if line.strip()]
-            word_of_the_day = random.choice(words).upper()
-            print(f"Word of the day: {word_of_the_day}")
-            return word_of_the_day
-    except Exception as e:
-        print(f"Error reading word file: {e}")
-        # Fallback words if file can't be read
-        fallback_words = ["ABOUT", "ABOVE", "ABUSE", "ACTOR", "ACUTE", "ADMIT", "ADOPT", "ADULT", "AFTER", "AGAIN"]
-        return random.choice(fallback_words)
+# Active games live in a session store (in-memory LRU or SQLite, picked with
+# WORDLE_SESSION_BACKEND) that evicts idle and finished games automatically.
+# With WORDLE_EVENT_LOG set, unfinished games are reloaded after a restart
+active_games = create_session_store()
+restore_games(active_games)
+
+# index.html, style.css and script.js: fingerprinted, precompressed, ETagged
+static_assets = StaticAssets()
+
+# Finished games are kept briefly so the page can still show the final state
+FINISHED_GAME_TTL = float(os.environ.get('WORDLE_FINISHED_TTL', '300'))
+
+def finished_ttl(game_session):
+    """Session TTL after a guess: short once the game is over, unchanged otherwise"""
+    return FINISHED_GAME_TTL if game_session.game_over else None
+
+# "fast" scores guesses locally and answers immediately; the LLM only writes
+# flavor text in the background. "llm" sends every guess through the model.
+REFEREE_MODE = os.environ.get('WORDLE_REFEREE', 'fast').lower()
+
+# Background workers for the flavor-text LLM calls in fast referee mode
+flavor_pool = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('WORDLE_FLAVOR_WORKERS', '4')),
+    thread_name_prefix='wordle-flavor'
+)
+
+def record_flavor_text(game_id, game_session, attempt, messages):
+    """Generate flavor text for one guess and save it on the stored game (runs in flavor_pool)"""
+    text = game_session.generate_flavor_text(messages)
+    active_games.update(game_id, lambda stored: stored.set_flavor_text(attempt, text))
+
+def take_hint(game_id):
+    """Work out a hint for a game: (game, hint), hint None once the game is over
+
+    The hint engine runs on the stored game without holding the store's lock;
+    only the narrowed candidates are saved back, for the next hint to start from.
+    """
+    with span("session"):
+        game_session = active_games.get(game_id) if game_id else None
+    if game_session is None or game_session.game_over:
+        return game_session, None
+    hint, candidates, narrowed = game_session.plan_hint()
+    if narrowed > game_session.narrowed:
+        with span("session"):
+            active_games.update(game_id, lambda stored: stored.keep_candidates(candidates, narrowed))
+    return game_session, hint
+
+@app.before_request
+def begin_trace():
+    g.trace_token = start_trace()
+
+@app.after_request
+def add_server_timing(response):
+    """Report where the request's time went (Server-Timing header, see tracing.py)"""
+    timing = finish_trace(g.pop('trace_token', None), request.endpoint)
+    if timing:
+        response.headers['Server-Timing'] = timing
+    return response
+
+def static_response(filename):
+    status, headers, body = static_assets.respond(
+        filename, request.headers.get('If-None-Match'), request.headers.get('Accept-Encoding'))
+    return Response(body, status=status, headers=headers)
 
 @app.route('/')
 def index():
     """Serve the main HTML page"""
-    return send_from_directory('.', 'index.html')
+    return static_response(static_assets.index)
 
 @app.route('/<path:filename>')
 def serve_static(filename):
-    """Serve static files"""
-    # Add security headers and proper content types
-    response = send_from_directory('.', filename)
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'DENY'
-    return response
+    """Serve the whitelisted UI files (304 when the browser's copy is current)"""
+    return static_response(filename)
 
 @app.route('/api/new_game', methods=['POST'])
 def new_game():
@@ -291,10 +109,10 @@ def new_game():
         
         # Create new game session
         game_session = WordleGameSession(game_id, word_of_the_day)
-        active_games[game_id] = game_session
         
         # Get initial AI message
         initial_message = game_session.get_initial_message()
+        active_games.put(game_id, game_session)
         
         return jsonify({
             "success": True,
@@ -314,25 +132,45 @@ def new_game():
 def submit_guess():
     """Submit a guess for the Wordle game"""
     try:
-        data = request.get_json()
-        game_id = data.get('game_id')
-        guess = data.get('guess', '').upper()
+        with span("parse"):
+            data = request.get_json()
+            game_id = data.get('game_id')
+            guess = data.get('guess', '').upper()
         
-        if not game_id or game_id not in active_games:
+        outcome = {}
+        if REFEREE_MODE == 'fast':
+            # Score and store in one step, so two requests can't both play the same attempt
+            def play(stored):
+                outcome["result"] = stored.referee_guess(guess)
+            with span("session"):
+                game_session = active_games.update(game_id, play, ttl=finished_ttl) if game_id else None
+        else:
+            with span("session"):
+                game_session = active_games.get(game_id) if game_id else None
+            if game_session is not None:
+                # The model's turn is too slow to hold the store's lock: play it on a
+                # copy and store that only if no other request changed the game meanwhile
+                game_session = copy.deepcopy(game_session)
+                outcome["result"] = game_session.process_guess(guess)
+                with span("session"):
+                    if not active_games.replace(game_id, game_session, ttl=finished_ttl):
+                        return jsonify({
+                            "success": False,
+                            "error": "The game changed while the AI was answering, please try again"
+                        }), 409
+        if game_session is None:
             return jsonify({
                 "success": False,
                 "error": "Invalid game ID"
             }), 400
+        result = outcome["result"]
+
+        if result.get("flavor_pending"):
+            flavor_pool.submit(record_flavor_text, game_id, game_session,
+                               game_session.attempts, list(game_session.messages))
             
-        game_session = active_games[game_id]
-        result = game_session.process_guess(guess)
-        
-        # Clean up completed games
-        if result.get("game_over"):
-            # Keep the game for a bit in case user wants to see final state
-            pass
-            
-        return jsonify(result)
+        with span("serialize"):
+            return jsonify(result)
         
     except Exception as e:
         print(f"Error submitting guess: {e}")
@@ -342,65 +180,117 @@ def submit_guess():
         }), 500
 
 
+def event_stream(events):
+    """A server-sent events response (not buffered by proxies)"""
+    return Response(stream_with_context(events), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+def stream_commentary(request_kwargs, priority=GUESS):
+    """Forward the model's reply as "token" events; returns the full text (None on error)"""
+    text = ""
+    try:
+        for token in stream_text(request_kwargs, get_llm_client(), priority):
+            text += token
+            yield sse_event("token", {"text": token})
+    except Exception as e:
+        print(f"Error streaming from the model: {e}")
+        yield sse_event("error", {"error": str(e)})
+        return None
+    return text
+
+@app.route('/api/submit_guess/stream', methods=['POST'])
+def submit_guess_stream():
+    """Submit a guess and stream the answer as server-sent events
+
+    "feedback" arrives right away (same JSON as /api/submit_guess, scored
+    locally), then the AI's commentary as "token" events, then "done". In
+    llm referee mode the model has to call validate_word before anything can
+    be shown, so this answers with the plain JSON of /api/submit_guess.
+    """
+    if REFEREE_MODE != 'fast':
+        return submit_guess()
+
+    data = request.get_json(silent=True) or {}
+    game_id = data.get('game_id')
+    guess = data.get('guess', '').upper()
+
+    outcome = {}
+    def play(stored):
+        outcome["result"] = stored.referee_guess(guess)
+    game_session = active_games.update(game_id, play, ttl=finished_ttl) if game_id else None
+    if game_session is None:
+        return jsonify({
+            "success": False,
+            "error": "Invalid game ID"
+        }), 400
+
+    result = outcome["result"]
+    result.pop("flavor_pending", None)
+
+    def events():
+        yield sse_event("feedback", result)
+        text = None
+        if result.get("feedback"):
+            attempt = game_session.attempts
+            text = yield from stream_commentary(game_session.flavor_text_request(list(game_session.messages)))
+            if text:
+                active_games.update(game_id, lambda stored: stored.set_flavor_text(attempt, text))
+        yield sse_event("done", {"message": text})
+
+    return event_stream(events())
+
+@app.route('/api/flavor/<game_id>', methods=['GET'])
+def get_flavor(game_id):
+    """Get the AI's commentary on the latest guess (fast referee mode)"""
+    game_session = active_games.get(game_id)
+    if game_session is None:
+        return jsonify({
+            "success": False,
+            "error": "Game not found"
+        }), 404
+
+    return jsonify({
+        "success": True,
+        "attempt": game_session.flavor_attempt,
+        "ready": game_session.flavor_attempt >= game_session.attempts and game_session.flavor_text is not None,
+        "message": game_session.flavor_text
+    })
+
+
 @app.route('/api/get_hint', methods=['POST'])
 def get_hint():
-    """Get a hint for the current game using Gemini AI"""
+    """Get a hint for the current game from the local hint engine
+
+    Send {"rephrase": true} to have Gemini reword the hint more creatively.
+    """
     try:
-        data = request.get_json()
-        game_id = data.get('game_id')
+        with span("parse"):
+            data = request.get_json()
+            game_id = data.get('game_id')
         
-        if not game_id or game_id not in active_games:
+        game_session, hint = take_hint(game_id)
+        if game_session is None:
             return jsonify({
                 "success": False,
                 "error": "Invalid game ID"
             }), 400
-            
-        game_session = active_games[game_id]
         
-        if game_session.game_over:
+        if hint is None:
             return jsonify({
                 "success": False,
                 "error": "Game is already over"
             })
         
-        word = game_session.word_of_the_day
-        attempts = game_session.attempts
-        
-        # Initialize hints_messages if not already done
-        if not hasattr(game_session, 'hints_messages') or not game_session.hints_messages:
-            game_session.hints_messages = [{
-                "role": "system",
-                "content": f"You are a helpful assistant that gives hints for Wordle games. The target word is '{word}'. The user's current guess is '{game_session.curr_guess}'. Give creative, helpful hints without revealing the word directly. Vary your hint style - you can mention letter count, provide riddles that give hints about the word and its meaning, word characteristics, rhymes, definitions. Or provide several candidiate words based on how many attempts the user has made. Don't repeat previous hints."
-            }]
+        if data.get('rephrase'):
+            # The model call happens outside the store's lock; only its reply is saved
+            llm_request = game_session.rephrase_hint_request(hint)
+            hint["hint"] = game_session.rephrase_hint(hint)
+            with span("session"):
+                active_games.update(game_id, lambda stored: stored.remember_hint(llm_request, hint["hint"]))
         
-        # Create the hint request message
-        hint_request = f"Give me a helpful hint for the Wordle game. The word is '{word}' (5 letters). The user has made {attempts} attempts so far. Please provide a creative, helpful hint without revealing the word directly. Make it progressively more helpful if they've made more attempts."
-        
-        # Add the current hint request
-        game_session.hints_messages.append({
-            "role": "user", 
-            "content": hint_request
-        })
-        
-        # Get AI-generated hint
-        response = game_session.client.chat.completions.create(
-            model=game_session.model,
-            messages=game_session.hints_messages,
-            temperature=0.7  # Higher temperature for more creative hints
-        )
-        
-        hint_text = response.choices[0].message.content
-        
-        # Add AI response to hints history
-        game_session.hints_messages.append({
-            "role": "assistant",
-            "content": hint_text
-        })
-        
-        return jsonify({
-            "success": True,
-            "hint": f"💡 {hint_text}"
-        })
+        hint["hint"] = f"💡 {hint['hint']}"
+        with span("serialize"):
+            return jsonify({"success": True, **hint})
         
     except Exception as e:
         print(f"Error getting hint: {e}")
@@ -409,17 +299,82 @@ def get_hint():
             "error": str(e)
         }), 500
 
+@app.route('/api/get_hint/stream', methods=['POST'])
+def get_hint_stream():
+    """Stream a hint as server-sent events
+
+    "hint" arrives right away (same JSON as /api/get_hint). With
+    {"rephrase": true}, Gemini's rewording follows as "token" events. Ends with "done".
+    """
+    data = request.get_json(silent=True) or {}
+    game_id = data.get('game_id')
+
+    game_session, hint = take_hint(game_id)
+    if game_session is None:
+        return jsonify({
+            "success": False,
+            "error": "Invalid game ID"
+        }), 400
+
+    if hint is None:
+        return jsonify({
+            "success": False,
+            "error": "Game is already over"
+        })
+
+    def events():
+        yield sse_event("hint", {"success": True, **hint, "hint": f"💡 {hint['hint']}"})
+        text = None
+        if data.get('rephrase'):
+            llm_request = game_session.rephrase_hint_request(hint)
+            text = cached_reply(llm_request)
+            if text is not None:
+                yield sse_event("token", {"text": text})
+            else:
+                text = yield from stream_commentary(llm_request, HINT)
+                cache_reply(llm_request, text)
+            if text:
+                active_games.update(game_id, lambda stored: stored.remember_hint(llm_request, text))
+        yield sse_event("done", {"message": text})
+
+    return event_stream(events())
+
+@app.route('/api/batch_validate', methods=['POST'])
+def batch_validate_route():
+    """Score many guesses at once: {"pairs": [["crane", "slate"], ...]}
+
+    Returns "patterns" (base-3 codes, null for invalid words) and "feedback"
+    (emoji; send "emoji": false to skip it) in the same order.
+    """
+    with span("parse"):
+        data = request.get_json(silent=True) or {}
+        pairs = data.get('pairs')
+    if isinstance(pairs, list) and len(pairs) > BATCH_LIMIT:
+        return jsonify({
+            "success": False,
+            "error": f"At most {BATCH_LIMIT} pairs per request"
+        }), 413
+    try:
+        result = batch_validate(pairs, emoji=data.get('emoji', True))
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+
+    with span("serialize"):
+        return jsonify({"success": True, "count": len(pairs), **result})
+
 @app.route('/api/game_status/<game_id>', methods=['GET'])
 def game_status(game_id):
     """Get the current status of a game"""
     try:
-        if game_id not in active_games:
+        game_session = active_games.get(game_id)
+        if game_session is None:
             return jsonify({
                 "success": False,
                 "error": "Game not found"
             }), 404
-            
-        game_session = active_games[game_id]
         
         return jsonify({
             "success": True,
@@ -436,15 +391,26 @@ def game_status(game_id):
             "error": str(e)
         }), 500
 
-dictionary = []
+@app.route('/api/stats', methods=['GET'])
+def stats():
+    """Server metrics: live sessions, evictions, cache hits"""
+    return jsonify({
+        "success": True,
+        "sessions": active_games.stats(),
+        "hint_cache": hint_cache.stats() if hint_cache is not None else None,
+        "llm": llm_stats()
+    })
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Per-stage and per-endpoint latency histograms (Prometheus text format)"""
+    return Response(metrics_text(), content_type=METRICS_CONTENT_TYPE)
+
 if __name__ == '__main__':
     print("Starting Wordle Web Server...")
     print("Make sure you have GEMINI_API_KEY set in class1/.env")
     print("Visit http://localhost:5001 to play!")
-    filename = "../class1/wordle.txt"
-    with open(filename, "r") as file:
-        dictionary = [line.strip() for line in file if line.strip()]
     print(f"Total words: {len(dictionary)}")
-    print(f"First 10 words: {dictionary[:10]}")
-    print(f"Last 10 words: {dictionary[-10:]}")
+    print(f"First 10 words: {list(dictionary.words[:10])}")
+    print(f"Last 10 words: {list(dictionary.words[-10:])}")
     app.run(debug=True, port=5001)
\ No newline at end of file
@@ -0,0 +1,387 @@
+"""
+Async (ASGI) version of the Wordle server.
+
+Serves the same pages and /api/* routes as app.py, but every LLM call is
+awaited on an async client instead of blocking a worker thread, so a single
+process can keep thousands of games waiting on the model at once. The game
+itself is the shared WordleGameSession from game.py.
+
+Run it with uvicorn (from this folder):
+
+    uvicorn asgi_app:app --port 5001
+"""
+
+import asyncio
+import copy
+import os
+import sys
+import uuid
+
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+# Shared helpers (word index, etc.) live in shared/utils at the repo root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+
+from game import (
+    BACKGROUND, BATCH_LIMIT, GUESS, HINT, WordleGameSession, batch_validate, cache_reply, cached_reply,
+    get_async_llm_client, get_word_of_the_day, hint_cache, llm_stats, restore_games, run_async, sse_event,
+    stream_text_async,
+)
+from session_store import MemorySessionStore, create_session_store
+from static_assets import StaticAssets
+from tracing import METRICS_CONTENT_TYPE, ServerTimingMiddleware, metrics_text, span
+
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', 'class1', '.env'))
+
+# Same knobs as app.py
+active_games = create_session_store()
+restore_games(active_games)
+# The in-memory store answers at once; any other store does disk I/O (and may
+# wait on another process's write lock), which must not block the event loop
+STORE_BLOCKS = not isinstance(active_games, MemorySessionStore)
+static_assets = StaticAssets()
+FINISHED_GAME_TTL = float(os.environ.get('WORDLE_FINISHED_TTL', '300'))
+
+
+def finished_ttl(game_session):
+    """Session TTL after a guess: short once the game is over, unchanged otherwise"""
+    return FINISHED_GAME_TTL if game_session.game_over else None
+
+
+async def store_call(method, *args, **kwargs):
+    """Call a session-store method, in a worker thread when the store blocks"""
+    if STORE_BLOCKS:
+        return await run_in_threadpool(method, *args, **kwargs)
+    return method(*args, **kwargs)
+
+
+REFEREE_MODE = os.environ.get('WORDLE_REFEREE', 'fast').lower()
+
+# Flavor-text tasks run in the background; keep references so they aren't garbage-collected
+_flavor_tasks = set()
+
+
+async def record_flavor_text(game_id, game_session, attempt, messages):
+    """Generate flavor text for one guess and save it on the stored game"""
+    text = await run_async(game_session.flavor_text_steps(messages), get_async_llm_client(), BACKGROUND)
+    await store_call(active_games.update, game_id, lambda stored: stored.set_flavor_text(attempt, text))
+
+
+async def take_hint(game_id):
+    """Work out a hint for a game: (game, hint), hint None once the game is over (see app.py)"""
+    with span("session"):
+        game_session = await store_call(active_games.get, game_id) if game_id else None
+    if game_session is None or game_session.game_over:
+        return game_session, None
+    # The hint engine is CPU-bound: run it in a worker thread, with no store lock held
+    hint, candidates, narrowed = await run_in_threadpool(game_session.plan_hint)
+    if narrowed > game_session.narrowed:
+        with span("session"):
+            await store_call(active_games.update, game_id, lambda stored: stored.keep_candidates(candidates, narrowed))
+    return game_session, hint
+
+
+def error(message, status_code=200):
+    return JSONResponse({"success": False, "error": message}, status_code=status_code)
+
+
+async def read_json(request):
+    try:
+        data = await request.json()
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def static_response(request, filename):
+    status, headers, body = static_assets.respond(
+        filename, request.headers.get('if-none-match'), request.headers.get('accept-encoding'))
+    return Response(body, status_code=status, headers=headers)
+
+
+async def index(request):
+    """Serve the main HTML page"""
+    return static_response(request, static_assets.index)
+
+
+async def serve_static(request):
+    """Serve the whitelisted UI files (304 when the browser's copy is current)"""
+    return static_response(request, request.path_params['filename'])
+
+
+async def new_game(request):
+    """Start a new Wordle game"""
+    try:
+        game_id = str(uuid.uuid4())
+        game_session = WordleGameSession(game_id, get_word_of_the_day())
+        initial_message = await run_async(game_session.initial_message_steps(), get_async_llm_client())
+        await store_call(active_games.put, game_id, game_session)
+
+        return JSONResponse({
+            "success": True,
+            "game_id": game_id,
+            "message": initial_message,
+            "word": game_session.word_of_the_day  # Remove this in production!
+        })
+
+    except Exception as e:
+        print(f"Error creating new game: {e}")
+        return error(str(e), 500)
+
+
+async def submit_guess(request):
+    """Submit a guess for the Wordle game"""
+    try:
+        with span("parse"):
+            data = await read_json(request)
+            game_id = data.get('game_id')
+            guess = data.get('guess', '').upper()
+
+        outcome = {}
+        if REFEREE_MODE == 'fast':
+            # Score and store in one step, so two requests can't both play the same attempt
+            def play(stored):
+                outcome["result"] = stored.referee_guess(guess)
+            with span("session"):
+                game_session = (await store_call(active_games.update, game_id, play, ttl=finished_ttl)
+                                if game_id else None)
+        else:
+            with span("session"):
+                game_session = await store_call(active_games.get, game_id) if game_id else None
+            if game_session is not None:
+                # Play the model's turn on a copy; store it only if the game didn't change meanwhile
+                game_session = copy.deepcopy(game_session)
+                outcome["result"] = await run_async(game_session.process_guess_steps(guess), get_async_llm_client())
+                with span("session"):
+                    if not await store_call(active_games.replace, game_id, game_session, ttl=finished_ttl):
+                        return error("The game changed while the AI was answering, please try again", 409)
+        if game_session is None:
+            return error("Invalid game ID", 400)
+        result = outcome["result"]
+
+        if result.get("flavor_pending"):
+            task = asyncio.create_task(record_flavor_text(
+                game_id, game_session, game_session.attempts, list(game_session.messages)))
+            _flavor_tasks.add(task)
+            task.add_done_callback(_flavor_tasks.discard)
+
+        with span("serialize"):
+            return JSONResponse(result)
+
+    except Exception as e:
+        print(f"Error submitting guess: {e}")
+        return error(str(e), 500)
+
+
+def event_stream(events):
+    """A server-sent events response (not buffered by proxies)"""
+    return StreamingResponse(events, media_type='text/event-stream',
+                             headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+async def stream_commentary(request_kwargs, reply, priority=GUESS):
+    """Forward the model's reply as "token" events, collecting the full text in reply (emptied on error)"""
+    try:
+        async for token in stream_text_async(request_kwargs, get_async_llm_client(), priority):
+            reply.append(token)
+            yield sse_event("token", {"text": token})
+    except Exception as e:
+        print(f"Error streaming from the model: {e}")
+        reply.clear()
+        yield sse_event("error", {"error": str(e)})
+
+
+async def submit_guess_stream(request):
+    """Submit a guess and stream the answer as server-sent events (see app.py)"""
+    if REFEREE_MODE != 'fast':
+        return await submit_guess(request)
+
+    data = await read_json(request)
+    game_id = data.get('game_id')
+    guess = data.get('guess', '').upper()
+
+    outcome = {}
+
+    def play(stored):
+        outcome["result"] = stored.referee_guess(guess)
+    game_session = await store_call(active_games.update, game_id, play, ttl=finished_ttl) if game_id else None
+    if game_session is None:
+        return error("Invalid game ID", 400)
+
+    result = outcome["result"]
+    result.pop("flavor_pending", None)
+
+    async def events():
+        yield sse_event("feedback", result)
+        reply = []
+        if result.get("feedback"):
+            attempt = game_session.attempts
+            async for event in stream_commentary(game_session.flavor_text_request(list(game_session.messages)), reply):
+                yield event
+            text = "".join(reply)
+            if text:
+                await store_call(active_games.update, game_id, lambda stored: stored.set_flavor_text(attempt, text))
+        yield sse_event("done", {"message": "".join(reply) or None})
+
+    return event_stream(events())
+
+
+async def get_flavor(request):
+    """Get the AI's commentary on the latest guess (fast referee mode)"""
+    game_session = await store_call(active_games.get, request.path_params['game_id'])
+    if game_session is None:
+        return error("Game not found", 404)
+
+    return JSONResponse({
+        "success": True,
+        "attempt": game_session.flavor_attempt,
+        "ready": game_session.flavor_attempt >= game_session.attempts and game_session.flavor_text is not None,
+        "message": game_session.flavor_text
+    })
+
+
+async def get_hint(request):
+    """Get a hint from the local hint engine ({"rephrase": true} asks Gemini to reword it)"""
+    try:
+        with span("parse"):
+            data = await read_json(request)
+            game_id = data.get('game_id')
+
+        game_session, hint = await take_hint(game_id)
+        if game_session is None:
+            return error("Invalid game ID", 400)
+
+        if hint is None:
+            return error("Game is already over")
+
+        if data.get('rephrase'):
+            # The model call happens outside the store's lock; only its reply is saved
+            llm_request = game_session.rephrase_hint_request(hint)
+            hint["hint"] = await run_async(game_session.rephrase_hint_steps(hint), get_async_llm_client(), HINT)
+            with span("session"):
+                await store_call(active_games.update, game_id,
+                                 lambda stored: stored.remember_hint(llm_request, hint["hint"]))
+
+        hint["hint"] = f"💡 {hint['hint']}"
+        with span("serialize"):
+            return JSONResponse({"success": True, **hint})
+
+    except Exception as e:
+        print(f"Error getting hint: {e}")
+        return error(str(e), 500)
+
+
+async def get_hint_stream(request):
+    """Stream a hint as server-sent events (see app.py)"""
+    data = await read_json(request)
+    game_id = data.get('game_id')
+
+    game_session, hint = await take_hint(game_id)
+    if game_session is None:
+        return error("Invalid game ID", 400)
+
+    if hint is None:
+        return error("Game is already over")
+
+    async def events():
+        yield sse_event("hint", {"success": True, **hint, "hint": f"💡 {hint['hint']}"})
+        reply = []
+        if data.get('rephrase'):
+            llm_request = game_session.rephrase_hint_request(hint)
+            text = cached_reply(llm_request)
+            if text is not None:
+                reply.append(text)
+                yield sse_event("token", {"text": text})
+            else:
+                async for event in stream_commentary(llm_request, reply, HINT):
+                    yield event
+                text = "".join(reply)
+                cache_reply(llm_request, text)
+            if text:
+                await store_call(active_games.update, game_id, lambda stored: stored.remember_hint(llm_request, text))
+        yield sse_event("done", {"message": "".join(reply) or None})
+
+    return event_stream(events())
+
+
+async def batch_validate_route(request):
+    """Score many guesses at once (see app.py)"""
+    with span("parse"):
+        data = await read_json(request)
+        pairs = data.get('pairs')
+    if isinstance(pairs, list) and len(pairs) > BATCH_LIMIT:
+        return error(f"At most {BATCH_LIMIT} pairs per request", 413)
+    try:
+        result = batch_validate(pairs, emoji=data.get('emoji', True))
+    except ValueError as e:
+        return error(str(e), 400)
+
+    with span("serialize"):
+        return JSONResponse({"success": True, "count": len(pairs), **result})
+
+
+async def game_status(request):
+    """Get the current status of a game"""
+    game_session = await store_call(active_games.get, request.path_params['game_id'])
+    if game_session is None:
+        return error("Game not found", 404)
+
+    return JSONResponse({
+        "success": True,
+        "game_over": game_session.game_over,
+        "attempts": game_session.attempts,
+        "max_attempts": game_session.max_attempts,
+        "won": game_session.won
+    })
+
+
+async def stats(request):
+    """Server metrics: live sessions, evictions, cache hits"""
+    return JSONResponse({
+        "success": True,
+        "sessions": await store_call(active_games.stats),
+        "hint_cache": hint_cache.stats() if hint_cache is not None else None,
+        "llm": llm_stats()
+    })
+
+
+async def metrics(request):
+    """Per-stage and per-endpoint latency histograms (Prometheus text format)"""
+    return Response(metrics_text(), media_type=METRICS_CONTENT_TYPE)
+
+
+routes = [
+    Route('/', index),
+    Route('/api/new_game', new_game, methods=['POST']),
+    Route('/api/submit_guess', submit_guess, methods=['POST']),
+    Route('/api/submit_guess/stream', submit_guess_stream, methods=['POST']),
+    Route('/api/flavor/{game_id}', get_flavor, methods=['GET']),
+    Route('/api/get_hint', get_hint, methods=['POST']),
+    Route('/api/get_hint/stream', get_hint_stream, methods=['POST']),
+    Route('/api/batch_validate', batch_validate_route, methods=['POST']),
+    Route('/api/game_status/{game_id}', game_status, methods=['GET']),
+    Route('/api/stats', stats, methods=['GET']),
+    Route('/metrics', metrics, methods=['GET']),
+    Route('/{filename:path}', serve_static),
+]
+
+app = Starlette(
+    routes=routes,
+    middleware=[
+        Middleware(ServerTimingMiddleware),
+        Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*']),
+    ],
+)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    print("Starting async Wordle Web Server...")
+    print("Visit http://localhost:5001 to play!")
+    uvicorn.run(app, port=5001)
@@ -0,0 +1,124 @@
+"""
+How much does the game event log cost, and how fast does a restart replay it?
+
+1. Logging: plays --games games (a new game plus --guesses guesses each)
+   through EventLog.record from --threads threads, and reports the cost per
+   event, the bytes written and how many fsyncs the batching needed. For
+   comparison, it also times the naive approach: one JSON line written and
+   fsynced per event.
+2. Replay: reopens the folder, once with a long log tail (no snapshot yet) and
+   once after a snapshot, and times how long rebuilding the games takes.
+
+HOW TO RUN (from example-projects/wordle-game-web):
+
+    python benchmarks/bench_event_log.py
+    python benchmarks/bench_event_log.py --games 50000 --guesses 4
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(HERE)
+sys.path.insert(0, APP_DIR)
+sys.path.append(os.path.join(APP_DIR, '..', '..', 'shared', 'utils'))
+
+from event_log import RECORD, EventLog  # noqa: E402
+from word_index import load_word_index  # noqa: E402
+from wordle_feedback import score  # noqa: E402
+
+
+class FakeGame:
+    """Just the fields EventLog.record reads"""
+
+    def __init__(self, answer):
+        self.game_id = str(uuid.uuid4())
+        self.word_of_the_day = answer
+        self.board = []
+        self.game_over = False
+        self.won = False
+
+
+def play(log, games, words, guesses, seed):
+    rng = random.Random(seed)
+    for _ in range(games):
+        game = FakeGame(rng.choice(words))
+        log.record(game)
+        for _ in range(guesses):
+            guess = rng.choice(words)
+            game.board.append((guess, score(guess, game.word_of_the_day)))
+            log.record(game)
+
+
+def json_per_event(path, events):
+    """The naive baseline: one JSON line + fsync per event"""
+    with open(path, "a") as f:
+        start = time.perf_counter()
+        for i in range(events):
+            f.write(json.dumps({"type": "guess", "game_id": str(uuid.uuid4()), "guess": "crane",
+                                "pattern": 180, "time": time.time()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event log write cost and replay time.")
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--guesses", type=int, default=3, help="Guesses per game (games are left unfinished)")
+    parser.add_argument("--threads", type=int, default=4, help="Threads recording at once, like request workers")
+    args = parser.parse_args()
+
+    words = load_word_index().words
+    with tempfile.TemporaryDirectory() as folder:
+        log_dir = os.path.join(folder, "events")
+        log = EventLog(log_dir, snapshot_every=10 ** 9)
+        per_thread = args.games // args.threads
+        threads = [threading.Thread(target=play, args=(log, per_thread, words, args.guesses, seed))
+                   for seed in range(args.threads)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        recorded = time.perf_counter() - start
+        log.flush()
+        stats = log.stats()
+        events = stats["events"]
+        # Crash without a final snapshot, so the next open replays the whole tail
+        log._stop.set()
+        log._lock_file.close()
+
+        start = time.perf_counter()
+        reopened = EventLog(log_dir)
+        from_tail = time.perf_counter() - start
+        games = len(reopened.recovered)
+        reopened.close()
+
+        start = time.perf_counter()
+        reopened = EventLog(log_dir)
+        from_snapshot = time.perf_counter() - start
+        reopened.close()
+
+        baseline_events = min(events, 2000)
+        baseline = json_per_event(os.path.join(folder, "naive.jsonl"), baseline_events)
+
+    print(f"\n{events:,} events ({args.games:,} games x {args.guesses} guesses + new game), "
+          f"{args.threads} threads, {RECORD.size}-byte records\n")
+    print(f"  EventLog.record          {1e6 * recorded / events:8.2f} µs/event   "
+          f"({stats['bytes_written']:,} bytes, {stats['fsyncs']} fsyncs)")
+    print(f"  JSON line + fsync        {1e6 * baseline / baseline_events:8.2f} µs/event   "
+          f"(measured on {baseline_events:,} events)")
+    print(f"\n  replay {games:,} games from the log tail     {1000 * from_tail:8.1f} ms")
+    print(f"  replay {games:,} games from a snapshot      {1000 * from_snapshot:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+How big is each LLM request as a game goes on?
+
+Plays the same six-guess game in llm referee mode against a local stub LLM
+(stub_llm.py), once sending the whole transcript every turn
+(WORDLE_HISTORY_TURNS=0, the old behaviour) and once with the bounded history
+(older turns replaced by the compact board message). For every guess it
+reports the request size (bytes and ~tokens, across both LLM calls a guess
+makes) and how long the guess took. The stub charges extra time per prompt
+token, like a real model, so latency follows size.
+
+HOW TO RUN (from example-projects/wordle-game-web):
+
+    python benchmarks/bench_history.py
+    python benchmarks/bench_history.py --turns 0,1,2 --prefill-ms 100
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(HERE)
+sys.path.insert(0, APP_DIR)
+sys.path.append(os.path.join(APP_DIR, '..', '..', 'shared', 'utils'))
+
+ANSWER = "CRANE"
+GUESSES = ["SLATE", "MOIST", "PUDGY", "BOWEL", "FJORD", "CRANE"]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def play(game, history_turns, request_sizes):
+    """Play GUESSES once; returns (bytes, seconds) per guess"""
+    game.HISTORY_TURNS = history_turns
+    session = game.WordleGameSession("bench", ANSWER)
+    session.get_initial_message()
+    rows = []
+    for guess in GUESSES:
+        request_sizes.clear()
+        start = time.perf_counter()
+        result = session.process_guess(guess)
+        elapsed = time.perf_counter() - start
+        if not result.get("success"):
+            raise RuntimeError(result.get("error"))
+        rows.append((sum(request_sizes), elapsed))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Request size and latency per guess, bounded vs full history.")
+    parser.add_argument("--turns", default="0,1", help="WORDLE_HISTORY_TURNS values to compare (0 = full transcript)")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Stub LLM fixed delay per call")
+    parser.add_argument("--prefill-ms", type=float, default=50, help="Stub LLM delay per 1,000 prompt tokens")
+    args = parser.parse_args()
+
+    port = free_port()
+    env = dict(os.environ, STUB_LLM_LATENCY_MS=str(args.latency_ms),
+               STUB_LLM_PREFILL_MS_PER_1K=str(args.prefill_ms))
+    stub = subprocess.Popen([sys.executable, "-m", "uvicorn", "benchmarks.stub_llm:app", "--port", str(port),
+                             "--log-level", "warning"], cwd=APP_DIR, env=env)
+    try:
+        deadline = time.time() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.1)
+
+        os.environ.update(GEMINI_API_KEY="stub", LLM_BASE_URL=f"http://127.0.0.1:{port}/v1/")
+        import httpx
+        from openai import OpenAI
+
+        import game
+
+        # Measure what actually goes over the wire
+        request_sizes = []
+        game._llm_client = OpenAI(
+            api_key="stub", base_url=game.LLM_BASE_URL,
+            http_client=httpx.Client(event_hooks={"request": [lambda r: request_sizes.append(len(r.content))]})
+        )
+
+        results = {turns: play(game, turns, request_sizes) for turns in (int(t) for t in args.turns.split(","))}
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    print(f"\nStub LLM: {args.latency_ms:.0f} ms per call + {args.prefill_ms:.0f} ms per 1k prompt tokens "
+          f"(~4 bytes per token); 2 calls per guess\n")
+    header = f"{'guess':>5}"
+    for turns in results:
+        label = "full" if turns == 0 else f"last {turns}"
+        header += f" | {label + ' bytes':>14}{'~tokens':>9}{'ms':>7}"
+    print(header)
+    for i in range(len(GUESSES)):
+        line = f"{i + 1:>5}"
+        for rows in results.values():
+            size, seconds = rows[i]
+            line += f" | {size:>14,}{size // 4:>9,}{1000 * seconds:>7.0f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
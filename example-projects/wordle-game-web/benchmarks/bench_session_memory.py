@@ -0,0 +1,94 @@
+"""
+Memory benchmark: bytes per Wordle game at 10k concurrent games.
+
+Creates N games the way /api/new_game does, plays a few guesses in each with
+the fast referee, and measures the memory they hold with tracemalloc. It
+also builds a small sample of games the old way (a dict-backed object with
+its own OpenAI client and the full system prompt stored per game) and
+extrapolates, for comparison.
+
+No API key or network needed: no LLM calls are made.
+
+    python benchmarks/bench_session_memory.py --games 10000 --guesses 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+import uuid
+
+os.environ.setdefault('GEMINI_API_KEY', 'not-needed-for-this-benchmark')
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, APP_DIR)
+sys.path.append(os.path.join(APP_DIR, '..', '..', 'shared', 'utils'))
+
+import game  # noqa: E402
+from openai import OpenAI  # noqa: E402
+from word_index import load_word_index  # noqa: E402
+
+
+class LegacySession:
+    """The pre-slots game layout: per-game client + full message list"""
+
+    def __init__(self, game_id, word_of_the_day, model="gemini-3.5-flash"):
+        self.game_id = game_id
+        self.word_of_the_day = word_of_the_day
+        self.model = model
+        self.messages = [
+            {"role": "system", "content": game.SYSTEM_PROMPT.format(word=word_of_the_day)},
+            {"role": "user", "content": "[system] Start a new Wordle game"},
+        ]
+        self.curr_guess = ""
+        self.hints_messages = []
+        self.client = OpenAI(api_key=os.environ['GEMINI_API_KEY'], base_url=game.LLM_BASE_URL)
+        self.game_over = False
+        self.attempts = 0
+        self.max_attempts = 6
+        self.won = False
+
+
+def measure(build, count):
+    """Return (total bytes, objects) held by `count` objects made with build()"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, objects
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--guesses', type=int, default=3, help='guesses played per game')
+    parser.add_argument('--legacy-sample', type=int, default=300,
+                        help='old-style games to build for the comparison')
+    args = parser.parse_args()
+
+    words = load_word_index()
+    rng = random.Random(0)
+
+    def new_game():
+        session = game.WordleGameSession(str(uuid.uuid4()), words.random_word(rng))
+        for _ in range(args.guesses):
+            session.referee_guess(words.random_word(rng))
+        return session
+
+    game.get_llm_client()  # the one shared client isn't part of any single game
+    total, games = measure(new_game, args.games)
+    print(f"Slotted games:  {args.games:,} games, {total / 1e6:8.2f} MB, "
+          f"{total / args.games:8.0f} bytes/game ({args.guesses} guesses each)")
+
+    legacy_total, legacy = measure(
+        lambda: LegacySession(str(uuid.uuid4()), words.random_word(rng)), args.legacy_sample
+    )
+    per_game = legacy_total / args.legacy_sample
+    print(f"Legacy games:   {args.legacy_sample:,} sampled, "
+          f"{per_game:8.0f} bytes/game before any guesses "
+          f"(~{per_game * args.games / 1e6:.1f} MB at {args.games:,} games)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+What does loading the Wordle page cost, before and after static_assets.py?
+
+Simulates a browser opening the page twice (first visit, then a reload) and
+counts the requests and bytes the server sends each time:
+
+- before: send_from_directory on every request (the old app.py routes):
+  uncompressed, and a reload revalidates every file (three 304s)
+- after: precompressed, fingerprinted files; on reload index.html comes back
+  as a 304 and style/script are served from the browser cache (no request)
+
+It also times how long the Flask app takes to answer each kind of request.
+Runs in-process with Flask's test client (no server or API key needed).
+
+HOW TO RUN (from example-projects/wordle-game-web):
+
+    python benchmarks/bench_static.py
+"""
+
+import gzip
+import os
+import re
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(HERE)
+sys.path.insert(0, APP_DIR)
+
+from flask import Flask, Response, request, send_from_directory  # noqa: E402
+
+from static_assets import BASE_DIR, StaticAssets  # noqa: E402
+
+BROWSER = {"Accept-Encoding": "gzip, deflate, br"}
+
+
+def old_app():
+    """The routes app.py used before static_assets.py"""
+    app = Flask(__name__)
+
+    @app.route('/')
+    def index():
+        return send_from_directory(BASE_DIR, 'index.html')
+
+    @app.route('/<path:filename>')
+    def serve_static(filename):
+        return send_from_directory(BASE_DIR, filename)
+
+    return app
+
+
+def new_app():
+    app = Flask(__name__)
+    assets = StaticAssets()
+
+    def respond(filename):
+        status, headers, body = assets.respond(
+            filename, request.headers.get('If-None-Match'), request.headers.get('Accept-Encoding'))
+        return Response(body, status=status, headers=headers)
+
+    app.add_url_rule('/', 'index', lambda: respond(assets.index))
+    app.add_url_rule('/<path:filename>', 'serve_static', respond)
+    return app
+
+
+def decode(body, encoding):
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'br':
+        import brotli
+        return brotli.decompress(body)
+    return body
+
+
+def page_load(client, cache):
+    """
+    Load / and everything it links to, like a browser with an HTTP cache.
+
+    Returns:
+        tuple: (requests sent, body bytes received)
+    """
+    requests_sent = 0
+    received = 0
+    page = None
+    queue = ['/']
+    while queue:
+        url = queue.pop(0)
+        cached = cache.get(url)
+        if cached and 'immutable' in cached['cache_control']:
+            body = cached['body']
+        else:
+            headers = dict(BROWSER)
+            if cached and cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            response = client.get(url, headers=headers)
+            requests_sent += 1
+            received += len(response.data)
+            if response.status_code == 304:
+                body = cached['body']
+            else:
+                body = decode(response.get_data(), response.headers.get('Content-Encoding'))
+                cache[url] = {'body': body, 'etag': response.headers.get('ETag'),
+                              'cache_control': response.headers.get('Cache-Control') or ''}
+        if url == '/':
+            page = body.decode('utf-8')
+            queue += ['/' + ref for ref in re.findall(r'(?:href|src)="([^":/]+)"', page)]
+    return requests_sent, received
+
+
+def time_request(client, url, headers, repeat=2000):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        client.get(url, headers=headers)
+    return 1e6 * (time.perf_counter() - start) / repeat
+
+
+def main():
+    print(f"{'':<8}{'first visit':>22}{'reload':>22}")
+    for label, app in (("before", old_app()), ("after", new_app())):
+        client = app.test_client()
+        cache = {}
+        first = page_load(client, cache)
+        again = page_load(client, cache)
+        print(f"{label:<8}{first[0]:>6} req {first[1]:>9,} B{again[0]:>6} req {again[1]:>9,} B")
+
+    old, new = old_app().test_client(), new_app().test_client()
+    etag = new.get('/', headers=BROWSER).headers['ETag']
+    print("\nServer time per request (Flask test client):")
+    print(f"  before, GET /script.js             {time_request(old, '/script.js', BROWSER):7.0f} µs")
+    print(f"  after,  GET /script.js (br/gzip)   {time_request(new, '/script.js', BROWSER):7.0f} µs")
+    print(f"  after,  GET / with If-None-Match   {time_request(new, '/', dict(BROWSER, **{'If-None-Match': etag})):7.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
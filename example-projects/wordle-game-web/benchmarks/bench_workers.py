@@ -0,0 +1,95 @@
+"""
+Does the Wordle server scale with gunicorn worker processes?
+
+Runs app.py under gunicorn with 1, 2, 4... workers sharing one SQLite (WAL)
+session store, and plays the same concurrent load as load_test.py against a
+local stub LLM. Because consecutive requests of one game land on different
+workers, any "Invalid game ID" error means state is not shared; the errors
+column should stay at 0.
+
+HOW TO RUN (from example-projects/wordle-game-web):
+
+    python benchmarks/bench_workers.py
+    python benchmarks/bench_workers.py --workers 1,2,4,8 --users 400 --duration 20
+    python benchmarks/bench_workers.py --server asgi      # uvicorn workers instead of Flask
+
+Scaling needs spare CPU cores: on a 1-2 core machine, the load generator and
+stub LLM compete with the workers.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from load_test import APP_DIR, STUB_COMMAND, free_port, run_load, start  # noqa: E402
+from word_index import load_word_index  # noqa: E402 (path set up by load_test)
+
+GUNICORN = {
+    "flask": [sys.executable, "-m", "gunicorn", "app:app", "-c", "gunicorn.conf.py"],
+    "asgi": [sys.executable, "-m", "gunicorn", "asgi_app:app", "-c", "gunicorn.conf.py",
+             "-k", "uvicorn.workers.UvicornWorker"],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput vs gunicorn worker count (shared SQLite sessions).")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--server", default="flask", choices=sorted(GUNICORN))
+    parser.add_argument("--users", type=int, default=200, help="Simulated players at once")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds per run")
+    parser.add_argument("--llm-latency", type=float, default=100, help="Stub LLM delay (ms)")
+    parser.add_argument("--referee", default="fast", choices=["llm", "fast"])
+    parser.add_argument("--json", default=None, help="Also write the results to this file")
+    args = parser.parse_args()
+
+    words = [word.upper() for word in load_word_index().words]
+    stub_port = free_port()
+    base_env = dict(os.environ,
+                    STUB_LLM_LATENCY_MS=str(args.llm_latency),
+                    LLM_BASE_URL=f"http://127.0.0.1:{stub_port}/v1/",
+                    GEMINI_API_KEY="stub",
+                    WORDLE_REFEREE=args.referee,
+                    WORDLE_WORD_MODE="random",
+                    WORDLE_SESSION_BACKEND="sqlite",
+                    PYTHONPATH=APP_DIR)
+
+    results = {}
+    stub = start(STUB_COMMAND, stub_port, base_env)
+    try:
+        for count in (int(n) for n in args.workers.split(",")):
+            with tempfile.TemporaryDirectory() as folder:
+                env = dict(base_env, WEB_CONCURRENCY=str(count),
+                           WORDLE_SESSION_DB=os.path.join(folder, "sessions.db"))
+                port = free_port()
+                server = start(GUNICORN[args.server] + ["-b", "127.0.0.1:{port}"], port, env)
+                try:
+                    print(f"{count} worker(s): {args.users} players for {args.duration:.0f}s...")
+                    results[count] = asyncio.run(run_load(f"http://127.0.0.1:{port}", args.users,
+                                                          args.duration, words, seed=0))
+                finally:
+                    server.terminate()
+                    server.wait()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    print(f"\n{args.server} under gunicorn, referee={args.referee}, stub LLM {args.llm_latency:.0f} ms, "
+          f"{os.cpu_count()} CPU(s)\n")
+    print(f"{'workers':>7}{'requests':>10}{'errors':>8}{'req/s':>9}{'speedup':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    baseline = next(iter(results.values()))["req_per_s"] or 1
+    for count, r in results.items():
+        print(f"{count:>7}{r['requests']:>10}{r['errors']:>8}{r['req_per_s']:>9}{r['req_per_s'] / baseline:>8.2f}x"
+              f"{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Load test: Flask server (app.py) vs async server (asgi_app.py).
+
+Starts a stub LLM (stub_llm.py) and each server as subprocesses, then has many
+simulated players play games at once: start a game, guess a few words, ask
+for a hint, guess the answer, check the game status. Reports requests per
+second and p50/p95/p99 latency for each server, overall and per endpoint.
+No API key needed.
+
+HOW TO RUN (from example-projects/wordle-game-web):
+
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --users 500 --duration 30 --llm-latency 500
+    python benchmarks/load_test.py --servers asgi --referee fast --json results.json
+
+--referee llm (the default) sends every guess through the (stub) model, which
+is where the async server helps; --referee fast scores guesses locally.
+--think-ms adds a random pause (up to that long) between a player's actions.
+
+Tracking regressions: save a run with --json, then compare later runs to it.
+The exit code is 1 if any endpoint's p95 grew, or its throughput dropped, by
+more than --tolerance (default 20%):
+
+    python benchmarks/load_test.py --json baseline.json
+    python benchmarks/load_test.py --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(HERE)
+
+sys.path.append(os.path.join(APP_DIR, '..', '..', 'shared', 'utils'))
+from word_index import load_word_index  # noqa: E402
+
+SERVERS = {
+    # The Flask development server, one thread per request (how app.py runs)
+    "flask": [sys.executable, "-c",
+              "import sys, app; app.app.run(host='127.0.0.1', port=int(sys.argv[1]), threaded=True)", "{port}"],
+    "asgi": [sys.executable, "-m", "uvicorn", "asgi_app:app", "--host", "127.0.0.1", "--timeout-keep-alive", "30",
+             "--log-level", "warning", "--no-access-log", "--port", "{port}"],
+}
+
+STUB_COMMAND = [sys.executable, "-m", "uvicorn", "benchmarks.stub_llm:app", "--host", "127.0.0.1",
+                "--log-level", "warning", "--no-access-log", "--port", "{port}"]
+
+
+# Settings that change the load itself; --compare warns if the baseline used others
+LOAD_SETTINGS = ("users", "duration", "llm_latency", "referee", "think_ms", "seed")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start(command, port, env):
+    """Run command (with "{port}" filled in) and wait until it accepts connections"""
+    command = [part.format(port=port) for part in command]
+    process = subprocess.Popen(command, cwd=APP_DIR, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{' '.join(command)} exited with code {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{' '.join(command)} did not start")
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))]
+
+
+async def player(base_url, words, stop_at, samples, rng, think=0.0):
+    """Play games back to back until time runs out (on its own connection, like a real browser)"""
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        await play_games(client, words, stop_at, samples, rng, think)
+
+
+async def play_games(client, words, stop_at, samples, rng, think=0.0):
+    """
+    One player's games. Every request adds (endpoint, seconds, error or None) to samples.
+
+    Args:
+        think (float): Longest random pause between actions, in seconds
+    """
+    async def call(endpoint, method, path, **kwargs):
+        if think:
+            await asyncio.sleep(rng.uniform(0, think))
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+            data = response.json()
+            ok = response.status_code < 500 and data.get("success", False)
+        except (httpx.HTTPError, ValueError) as e:
+            ok, data = False, {"error": repr(e)}
+        samples.append((endpoint, time.perf_counter() - start, None if ok else f"{path}: {data.get('error')}"))
+        return data
+
+    while time.perf_counter() < stop_at:
+        game = await call("new_game", "POST", "/api/new_game")
+        game_id = game.get("game_id")
+        if not game_id:
+            continue
+        for guess in rng.sample(words, 2) + [None, game.get("word", "")]:
+            if guess is None:
+                await call("get_hint", "POST", "/api/get_hint", json={"game_id": game_id})
+                continue
+            result = await call("submit_guess", "POST", "/api/submit_guess", json={"game_id": game_id, "guess": guess})
+            if result.get("game_over") or time.perf_counter() >= stop_at:
+                break
+        await call("game_status", "GET", f"/api/game_status/{game_id}")
+
+
+def summarize(latencies, errors, elapsed):
+    """Throughput and latency percentiles for one list of request latencies (seconds)"""
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:5],
+        "seconds": round(elapsed, 2),
+        "req_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(1000 * percentile(latencies, 50), 1),
+        "p95_ms": round(1000 * percentile(latencies, 95), 1),
+        "p99_ms": round(1000 * percentile(latencies, 99), 1),
+        "max_ms": round(1000 * (latencies[-1] if latencies else 0), 1),
+    }
+
+
+async def run_load(base_url, users, duration, words, seed, think=0.0):
+    """
+    Run the players and summarize what they saw.
+
+    Returns:
+        dict: summarize() over every request, plus "endpoints": one summary per endpoint
+    """
+    samples = []
+    start = time.perf_counter()
+    stop_at = start + duration
+    await asyncio.gather(*(player(base_url, words, stop_at, samples, random.Random(seed + i), think)
+                           for i in range(users)))
+    elapsed = time.perf_counter() - start
+
+    report = summarize([s[1] for s in samples], [s[2] for s in samples if s[2]], elapsed)
+    report["endpoints"] = {
+        endpoint: summarize([s[1] for s in samples if s[0] == endpoint],
+                            [s[2] for s in samples if s[0] == endpoint and s[2]], elapsed)
+        for endpoint in sorted({s[0] for s in samples})
+    }
+    return report
+
+
+def environment():
+    """Where a run happened, saved with --json so results from different machines aren't mixed up"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Regressions against a saved run: p95 up, or req/s down, by more than tolerance.
+
+    Returns:
+        list: One message per regression (empty if none)
+    """
+    regressions = []
+    for server, result in results.items():
+        old = baseline.get("results", {}).get(server)
+        if not old:
+            continue
+        rows = [("all", result, old)] + [(endpoint, result["endpoints"][endpoint], old["endpoints"][endpoint])
+                                          for endpoint in result.get("endpoints", {})
+                                          if endpoint in old.get("endpoints", {})]
+        for endpoint, new_row, old_row in rows:
+            if old_row["p95_ms"] and new_row["p95_ms"] > old_row["p95_ms"] * (1 + tolerance):
+                regressions.append(f"{server} {endpoint}: p95 {old_row['p95_ms']} -> {new_row['p95_ms']} ms")
+            if old_row["req_per_s"] and new_row["req_per_s"] < old_row["req_per_s"] * (1 - tolerance):
+                regressions.append(f"{server} {endpoint}: {old_row['req_per_s']} -> {new_row['req_per_s']} req/s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Flask and async Wordle servers.")
+    parser.add_argument("--servers", default="flask,asgi", help="Comma-separated: flask, asgi")
+    parser.add_argument("--users", type=int, default=200, help="Simulated players at once")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds per server")
+    parser.add_argument("--llm-latency", type=float, default=300, help="Stub LLM delay (ms)")
+    parser.add_argument("--referee", default="llm", choices=["llm", "fast"], help="WORDLE_REFEREE for the servers")
+    parser.add_argument("--think-ms", type=float, default=0, help="Longest random pause between a player's actions")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default=None, help="Also write the results to this file")
+    parser.add_argument("--compare", default=None, help="Baseline --json file; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95/throughput change for --compare")
+    args = parser.parse_args()
+
+    words = [word.upper() for word in load_word_index().words]
+    stub_port = free_port()
+    env = dict(os.environ,
+               STUB_LLM_LATENCY_MS=str(args.llm_latency),
+               LLM_BASE_URL=f"http://127.0.0.1:{stub_port}/v1/",
+               LLM_MAX_CONNECTIONS=os.environ.get("LLM_MAX_CONNECTIONS", str(max(64, args.users))),
+               GEMINI_API_KEY="stub",
+               WORDLE_REFEREE=args.referee,
+               WORDLE_WORD_MODE="random",
+               PYTHONPATH=APP_DIR)
+
+    stub = start(STUB_COMMAND, stub_port, env)
+    results = {}
+    try:
+        for name in args.servers.split(","):
+            port = free_port()
+            server = start(SERVERS[name], port, env)
+            try:
+                print(f"Loading {name} with {args.users} players for {args.duration:.0f}s...")
+                results[name] = asyncio.run(run_load(f"http://127.0.0.1:{port}", args.users, args.duration,
+                                                     words, args.seed, args.think_ms / 1000))
+            finally:
+                server.terminate()
+                server.wait()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    print(f"\nreferee={args.referee}, stub LLM latency {args.llm_latency:.0f} ms, {args.users} players\n")
+    print(f"{'server':<8}{'endpoint':<14}{'requests':>10}{'errors':>8}{'req/s':>9}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for name, result in results.items():
+        for endpoint, r in [("all", result)] + list(result["endpoints"].items()):
+            print(f"{name:<8}{endpoint:<14}{r['requests']:>10}{r['errors']:>8}{r['req_per_s']:>9}"
+                  f"{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['max_ms']:>9}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"settings": vars(args), "environment": environment(), "results": results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        recorded = baseline.get("settings", {})
+        if any(recorded.get(key) != getattr(args, key) for key in LOAD_SETTINGS):
+            print(f"\nNote: {args.compare} was recorded with different load settings")
+        regressions = compare(results, baseline, args.tolerance)
+        print(f"\nCompared with {args.compare} (tolerance {args.tolerance:.0%}): "
+              f"{len(regressions) or 'no'} regression(s)")
+        for line in regressions:
+            print(f"  {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
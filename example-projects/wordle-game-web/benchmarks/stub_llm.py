@@ -0,0 +1,118 @@
+"""
+A stand-in for the Gemini OpenAI-compatible endpoint, for load tests.
+
+Answers POST /v1/chat/completions after a fixed delay (like a real model
+"thinking"), without any API key or network. When the request offers tools and
+the last message is a user's guess, it calls validate_word, just like the real
+game master; otherwise it replies with a short line of text.
+
+Run it (from this folder's parent):
+
+    uvicorn benchmarks.stub_llm:app --port 5055
+    # then point a server at it:
+    LLM_BASE_URL=http://127.0.0.1:5055/v1/ GEMINI_API_KEY=stub python app.py
+
+Set STUB_LLM_LATENCY_MS to change the delay (default 300), and
+STUB_LLM_PREFILL_MS_PER_1K to add time per 1,000 prompt tokens (default 0;
+a token is counted as ~4 bytes of request), like a real model reading a longer
+prompt. Requests with
+"stream": true get the reply as server-sent event chunks, one word every
+STUB_LLM_TOKEN_MS (default 30) after the first-token delay.
+
+Set STUB_LLM_RPS to act like a quota: requests beyond that many per second
+(counted over the last second) get a 429 with Retry-After, as Gemini does.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import deque
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+LATENCY = float(os.environ.get('STUB_LLM_LATENCY_MS', '300')) / 1000
+TOKEN_DELAY = float(os.environ.get('STUB_LLM_TOKEN_MS', '30')) / 1000
+PREFILL = float(os.environ.get('STUB_LLM_PREFILL_MS_PER_1K', '0')) / 1000
+QUOTA = int(os.environ.get('STUB_LLM_RPS', '0'))
+_recent = deque()  # arrival times of accepted requests in the last second
+REPLY = "Nice guess! Keep going, you are getting closer."
+
+
+def completion(model, message):
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": message,
+            "finish_reason": "tool_calls" if message.get("tool_calls") else "stop",
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def over_quota():
+    now = time.monotonic()
+    while _recent and now - _recent[0] >= 1:
+        _recent.popleft()
+    if len(_recent) >= QUOTA:
+        return True
+    _recent.append(now)
+    return False
+
+
+async def chat_completions(request):
+    if QUOTA and over_quota():
+        return JSONResponse({"error": {"code": 429, "message": "Resource has been exhausted (stub quota)",
+                                       "status": "RESOURCE_EXHAUSTED"}},
+                            status_code=429, headers={"Retry-After": "1"})
+    raw = await request.body()
+    body = json.loads(raw)
+    await asyncio.sleep(LATENCY + PREFILL * len(raw) / 4 / 1000)
+
+    messages = body.get("messages") or [{}]
+    last = messages[-1]
+    if body.get("tools") and last.get("role") == "user" and "guess" in str(last.get("content", "")):
+        message = {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{
+                "id": f"call_{uuid.uuid4().hex}",
+                "type": "function",
+                "function": {"name": "validate_word", "arguments": "{}"},
+            }],
+        }
+    else:
+        message = {"role": "assistant", "content": REPLY}
+        if body.get("stream"):
+            return StreamingResponse(stream_reply(body.get("model", "stub")), media_type="text/event-stream")
+    return JSONResponse(completion(body.get("model", "stub"), message))
+
+
+async def stream_reply(model):
+    chunk_id = f"chatcmpl-{uuid.uuid4().hex}"
+    words = REPLY.split(" ")
+    for i, word in enumerate(words):
+        chunk = {
+            "id": chunk_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "delta": {"role": "assistant", "content": word if i == 0 else " " + word},
+                "finish_reason": "stop" if i == len(words) - 1 else None,
+            }],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+        await asyncio.sleep(TOKEN_DELAY)
+    yield "data: [DONE]\n\n"
+
+
+app = Starlette(routes=[Route('/v1/chat/completions', chat_completions, methods=['POST'])])
@@ -0,0 +1,407 @@
+"""
+Append-only binary event log for Wordle games, so a restart doesn't lose them.
+
+The in-memory session store (WORDLE_SESSION_BACKEND=memory) logs every change
+to a game as a small fixed-size record instead of saving the whole game:
+
+    NEW_GAME  game id, answer
+    GUESS     game id, guess, its feedback pattern (base-3 code)
+    END       game id, won?
+
+Each record is RECORD.size (30) bytes: type, game id (UUID bytes), timestamp,
+word packed into 25 bits (word_index.pack_word), pattern code, CRC32. Appends
+only go into a memory buffer; a background thread writes and fsyncs the buffer
+every fsync_interval seconds, so one fsync covers every event in that window
+(a crash loses at most that window). No JSON is written per request.
+
+The log is split into numbered segments in one folder. Every snapshot_every
+events the live games are written to a snapshot, a new segment is started and
+the segments the snapshot covers are deleted, so startup (replay) only reads
+one snapshot plus a short tail:
+
+    wordle_events/
+        snapshot-000007.bin    games as of the end of segment 7
+        events-000008.log      everything since
+
+Finished games are dropped (they only matter for a few minutes), and games idle
+longer than ttl are dropped on replay and snapshot.
+
+Only one process may write a log folder: it is locked while open. A process
+forked from the owner (gunicorn --preload) gets a disabled copy that logs
+nothing and never snapshots, so it can't overwrite or delete the owner's files.
+With several gunicorn workers, use the shared SQLite session store instead
+(gunicorn.conf.py refuses the memory store + event log with more than one).
+"""
+
+import atexit
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+
+from word_index import pack_word, unpack_word
+
+try:
+    import fcntl
+except ImportError:  # Windows: no folder lock
+    fcntl = None
+
+NEW_GAME, GUESS, END = 1, 2, 3
+
+# type, game id, unix time, packed word, pattern / won flag, CRC32 of the rest
+RECORD = struct.Struct("<B16sIIBI")
+_BODY = struct.Struct("<B16sIIB")
+
+SNAPSHOT_MAGIC = b"WDLSNAP1"
+# game id, packed answer, last activity, number of guesses; then (packed guess, code) per guess
+_SNAPSHOT_GAME = struct.Struct("<16sIIB")
+_SNAPSHOT_GUESS = struct.Struct("<IB")
+
+_SEGMENT = re.compile(r"events-(\d{6})\.log$")
+_SNAPSHOT = re.compile(r"snapshot-(\d{6})\.bin$")
+
+
+def _id_bytes(game_id):
+    """A UUID string as its 16 bytes (None if it isn't one)"""
+    if not isinstance(game_id, str) or len(game_id) != 36:
+        return None
+    try:
+        return bytes.fromhex(game_id.replace("-", ""))
+    except ValueError:
+        return None
+
+
+def _id_text(raw_id):
+    """16 bytes back to the canonical UUID string (what uuid.UUID would print, faster)"""
+    h = raw_id.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class GameState:
+    """What the log knows about one unfinished game."""
+
+    __slots__ = ('raw_id', 'answer', 'board', 'last_seen')
+
+    def __init__(self, raw_id, answer, last_seen):
+        self.raw_id = raw_id        # game id as 16 bytes
+        self.answer = answer        # packed answer word
+        self.board = []             # (packed guess, pattern code) per scored guess
+        self.last_seen = last_seen  # unix time of the latest event
+
+    def words(self):
+        """(answer, [(guess, code), ...]) as lowercase words"""
+        return unpack_word(self.answer), [(unpack_word(guess), code) for guess, code in self.board]
+
+
+class EventLog:
+    """Buffered, segmented event log with snapshots (see the module docstring)."""
+
+    def __init__(self, directory, fsync_interval=0.05, snapshot_every=100000, ttl=3600):
+        """
+        Args:
+            directory (str): Folder for segments and snapshots (created if missing)
+            fsync_interval (float): Seconds between background write + fsync batches
+            snapshot_every (int): Events between snapshots (each one starts a new segment)
+            ttl (float): Seconds without events after which a game is forgotten
+        """
+        self.directory = directory
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+        self.ttl = ttl
+        self.events = 0
+        self.fsyncs = 0
+        self.snapshots = 0
+        self.bytes_written = 0
+        self._games = {}            # game id (str) -> GameState for unfinished games
+        self._buffer = bytearray()
+        self._since_snapshot = 0
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._file = None
+        self._seq = 0
+        self._flusher = None
+        self.disabled = False
+
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = open(os.path.join(directory, "LOCK"), "w")
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                self._lock_file.close()
+                raise RuntimeError(f"{directory} is already in use by another process")
+
+        start = time.perf_counter()
+        # game id -> GameState for every unfinished game found on disk (see restore in session_store.py)
+        self.recovered = self._replay()
+        self.replay_seconds = time.perf_counter() - start
+        self._start_flusher()
+        if hasattr(os, 'register_at_fork'):
+            # Holding _io_lock across fork() means no write is half done in the child's copy
+            os.register_at_fork(before=self._io_lock.acquire, after_in_parent=self._io_lock.release,
+                                after_in_child=self._disable_in_child)
+        # A clean shutdown leaves a fresh snapshot, so the next start reads no log at all
+        atexit.register(self.close)
+
+    # --- startup -----------------------------------------------------------
+
+    def _replay(self):
+        """Rebuild the unfinished games from the latest snapshot and the log tail, then open a new segment"""
+        snapshot_seq, games = self._load_snapshot()
+        segments = self._files(_SEGMENT)
+        tail = sum(self._apply_segment(path, games) for seq, path in segments if seq > snapshot_seq)
+
+        cutoff = time.time() - self.ttl
+        self._games = {_id_text(raw_id): game for raw_id, game in games.items() if game.last_seen >= cutoff}
+        next_seq = max([snapshot_seq] + [seq for seq, _ in segments]) + 1
+        if tail:
+            # Fold the tail into a fresh snapshot so those segments can go
+            with self._lock:
+                self._write_snapshot(next_seq - 1, self._encode_snapshot())
+        self._open_segment(next_seq)
+        return dict(self._games)
+
+    def _files(self, pattern):
+        found = []
+        for name in os.listdir(self.directory):
+            match = pattern.match(name)
+            if match:
+                found.append((int(match.group(1)), os.path.join(self.directory, name)))
+        return sorted(found)
+
+    def _load_snapshot(self):
+        snapshots = self._files(_SNAPSHOT)
+        for seq, path in reversed(snapshots):
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                return seq, self._decode_snapshot(data)
+            except (OSError, ValueError, struct.error) as e:
+                print(f"Skipping unreadable snapshot {path}: {e}")
+        return 0, {}
+
+    @staticmethod
+    def _decode_snapshot(data):
+        if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or len(data) < len(SNAPSHOT_MAGIC) + 4:
+            raise ValueError("not a snapshot")
+        body, (crc,) = data[:-4], struct.unpack("<I", data[-4:])
+        if zlib.crc32(body) != crc:
+            raise ValueError("checksum mismatch")
+        games = {}
+        offset = len(SNAPSHOT_MAGIC)
+        while offset < len(body):
+            raw_id, answer, last_seen, guesses = _SNAPSHOT_GAME.unpack_from(body, offset)
+            offset += _SNAPSHOT_GAME.size
+            game = GameState(raw_id, answer, last_seen)
+            for _ in range(guesses):
+                game.board.append(_SNAPSHOT_GUESS.unpack_from(body, offset))
+                offset += _SNAPSHOT_GUESS.size
+            games[raw_id] = game
+        return games
+
+    def _apply_segment(self, path, games):
+        """Apply every intact record in one segment (returns how many); a torn tail is cut off"""
+        with open(path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % RECORD.size
+        offset = 0
+        for offset in range(0, usable, RECORD.size):
+            kind, raw_id, stamp, word, code, crc = RECORD.unpack_from(data, offset)
+            if zlib.crc32(data[offset:offset + _BODY.size]) != crc:
+                break
+            self._apply(games, kind, raw_id, stamp, word, code)
+        else:
+            offset = usable
+        if offset < len(data):
+            print(f"Truncating {len(data) - offset} damaged bytes from {path}")
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        return offset // RECORD.size
+
+    @staticmethod
+    def _apply(games, kind, game_id, stamp, word, code):
+        if kind == NEW_GAME:
+            games[game_id] = GameState(game_id, word, stamp)
+        elif kind == GUESS:
+            game = games.get(game_id)
+            if game is not None:
+                game.board.append((word, code))
+                game.last_seen = stamp
+        elif kind == END:
+            games.pop(game_id, None)
+
+    # --- recording ---------------------------------------------------------
+
+    def record(self, session):
+        """
+        Log whatever changed in a game since it was last recorded.
+
+        Only touches the in-memory buffer; the write happens on the next flush.
+
+        Args:
+            session: Object with game_id, word_of_the_day, board, game_over and won
+        """
+        raw_id = _id_bytes(session.game_id)
+        if raw_id is None or self.disabled:
+            return  # not a server-issued game id, or not the process that owns the log
+        stamp = int(time.time())
+        with self._lock:
+            game = self._games.get(session.game_id)
+            if game is None:
+                if session.game_over:
+                    return
+                game = self._games[session.game_id] = GameState(raw_id, pack_word(session.word_of_the_day), stamp)
+                self._append(NEW_GAME, raw_id, stamp, game.answer, 0)
+            for guess, code in session.board[len(game.board):]:
+                packed = pack_word(guess)
+                game.board.append((packed, code))
+                self._append(GUESS, raw_id, stamp, packed, code)
+            game.last_seen = stamp
+            if session.game_over:
+                del self._games[session.game_id]
+                self._append(END, raw_id, stamp, 0, 1 if session.won else 0)
+
+    def _append(self, kind, raw_id, stamp, word, code):
+        body = _BODY.pack(kind, raw_id, stamp, max(word, 0), code)
+        self._buffer += body
+        self._buffer += struct.pack("<I", zlib.crc32(body))
+        self.events += 1
+        self._since_snapshot += 1
+
+    def flush(self, snapshot=False):
+        """
+        Write and fsync everything appended so far (one fsync for the whole batch).
+
+        Also snapshots and starts a new segment once snapshot_every events have
+        been logged since the last snapshot (or right away with snapshot=True).
+        """
+        # Lock order: _io_lock (file) then _lock (buffer + games), held only to swap the buffer
+        with self._io_lock:
+            if self._file is None:
+                return
+            with self._lock:
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                snapshot_body = None
+                if snapshot or self._since_snapshot >= self.snapshot_every:
+                    snapshot_body = self._encode_snapshot()
+            if data:
+                self._file.write(data)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self.fsyncs += 1
+                self.bytes_written += len(data)
+            if snapshot_body is not None:
+                # The snapshot holds exactly the events written so far: it replaces this segment
+                self._file.close()
+                self._write_snapshot(self._seq, snapshot_body)
+                self._open_segment(self._seq + 1)
+
+    def snapshot(self):
+        """Snapshot the live games now and start a new segment"""
+        self.flush(snapshot=True)
+
+    def _start_flusher(self):
+        if self.fsync_interval > 0 and not self._stop.is_set():
+            self._flusher = threading.Thread(target=self._flush_loop, name='wordle-event-log', daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.fsync_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error writing the event log: {e}")
+
+    # --- snapshots ---------------------------------------------------------
+
+    def _encode_snapshot(self):
+        """(Holding self._lock) The live games as snapshot bytes; idle games are dropped"""
+        cutoff = time.time() - self.ttl
+        parts = [SNAPSHOT_MAGIC]
+        for game_id, game in list(self._games.items()):
+            if game.last_seen < cutoff:
+                del self._games[game_id]
+                continue
+            parts.append(_SNAPSHOT_GAME.pack(game.raw_id, game.answer, game.last_seen, len(game.board)))
+            for guess, code in game.board:
+                parts.append(_SNAPSHOT_GUESS.pack(guess, code))
+        self._since_snapshot = 0
+        body = b"".join(parts)
+        return body + struct.pack("<I", zlib.crc32(body))
+
+    def _write_snapshot(self, seq, data):
+        path = os.path.join(self.directory, f"snapshot-{seq:06d}.bin")
+        temp = path + ".tmp"
+        with open(temp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+        self.snapshots += 1
+
+        # The snapshot covers every segment up to seq, and older snapshots
+        for old_seq, old_path in self._files(_SEGMENT) + self._files(_SNAPSHOT):
+            if old_seq <= seq and old_path != path:
+                os.remove(old_path)
+
+    def _open_segment(self, seq):
+        self._seq = seq
+        self._file = open(os.path.join(self.directory, f"events-{seq:06d}.log"), "ab")
+
+    # --- housekeeping ------------------------------------------------------
+
+    def _disable_in_child(self):
+        """
+        (In a forked child) Stop logging: the folder belongs to the parent.
+
+        The child's _games is a stale copy, so a snapshot from it (at exit, via
+        the inherited atexit hook) would replace the parent's state and delete
+        the segment the parent is still appending to. Closing the inherited
+        files only drops the child's descriptors; the parent keeps its flock.
+        """
+        self.disabled = True
+        self._stop.set()
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._buffer = bytearray()
+        self._games = {}
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._lock_file.close()
+        atexit.unregister(self.close)
+        print(f"Event log disabled in forked process {os.getpid()}: only the process that opened "
+              f"{self.directory} writes it (use the sqlite session backend with several workers)")
+
+    def close(self):
+        """Flush, snapshot and release the folder"""
+        if self._lock_file.closed:
+            return
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush(snapshot=True)
+        with self._io_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        self._lock_file.close()
+
+    def stats(self):
+        """Metrics for the /api/stats endpoint."""
+        return {
+            "directory": self.directory,
+            "segment": self._file.name if self._file else None,
+            "live_games": len(self._games),
+            "replay_seconds": round(self.replay_seconds, 3),
+            "events": self.events,
+            "buffered_bytes": len(self._buffer),
+            "bytes_written": self.bytes_written,
+            "fsyncs": self.fsyncs,
+            "snapshots": self.snapshots,
+            "disabled": self.disabled,
+        }
@@ -0,0 +1,686 @@
+"""
+Wordle game sessions, shared by the Flask (app.py) and async (asgi_app.py) servers.
+
+The game logic never calls the LLM itself. Each LLM-backed method is written as
+a *generator of requests*: it yields the keyword arguments for one
+``chat.completions.create`` call and is sent back the response. A small driver
+runs those requests with whichever client the server has:
+
+    result = run_sync(game.process_guess_steps(guess), get_llm_client())           # Flask
+    result = await run_async(game.process_guess_steps(guess), get_async_llm_client())  # ASGI
+
+so both servers play exactly the same game, but the async one never blocks a
+thread while the model is thinking.
+
+The streaming endpoints (/api/submit_guess/stream, /api/get_hint/stream) send
+the same requests with stream=True (see stream_text / stream_text_async) and
+forward the model's tokens as server-sent events (sse_event).
+
+Every request goes through the process's LLM scheduler (llm_scheduler.py),
+which rate-limits them, caps how many are in flight, lets guesses jump ahead of
+hints and background flavor text, and sends identical in-flight requests once.
+Pass the request's priority to the driver (GUESS is the default).
+
+Each LLM call, guess check and hint lookup is timed as a span (tracing.py).
+"""
+
+import json
+import os
+import uuid
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from wordle_feedback import ALL_GREEN, EMOJI_PATTERNS, pattern_to_emoji, score
+from feedback_matrix import INVALID, score_word_pairs
+from word_service import word_service
+from hint_engine import get_hint_engine
+from hint_cache import cache_key, create_hint_cache
+from llm_scheduler import BACKGROUND, GUESS, HINT, AsyncLLMScheduler, LLMScheduler, scheduler_options
+from tracing import span
+
+# Loaded once at import (word_service.py), so every server process has it
+dictionary = word_service.index
+
+# One LLM client per process: every game shares its connection pool instead of
+# opening its own (set LLM_BASE_URL to point at another endpoint, e.g. a stub)
+LLM_BASE_URL = os.environ.get('LLM_BASE_URL', "https://generativelanguage.googleapis.com/v1beta/openai/")
+LLM_MAX_CONNECTIONS = int(os.environ.get('LLM_MAX_CONNECTIONS', '64'))
+_llm_client = None
+_async_llm_client = None
+_llm_scheduler = None
+_async_llm_scheduler = None
+
+
+def _llm_limits():
+    return httpx.Limits(max_connections=LLM_MAX_CONNECTIONS, max_keepalive_connections=LLM_MAX_CONNECTIONS)
+
+
+def get_llm_client():
+    """Return the process-wide, connection-pooled OpenAI-compatible client"""
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = OpenAI(
+            api_key=os.environ['GEMINI_API_KEY'],
+            base_url=LLM_BASE_URL,
+            http_client=DefaultHttpxClient(limits=_llm_limits())
+        )
+    return _llm_client
+
+
+def get_async_llm_client():
+    """Return the process-wide async client (create it inside the server's event loop)"""
+    global _async_llm_client
+    if _async_llm_client is None:
+        _async_llm_client = AsyncOpenAI(
+            api_key=os.environ['GEMINI_API_KEY'],
+            base_url=LLM_BASE_URL,
+            http_client=DefaultAsyncHttpxClient(limits=_llm_limits())
+        )
+    return _async_llm_client
+
+
+def get_llm_scheduler():
+    """Return the process-wide scheduler for blocking LLM calls"""
+    global _llm_scheduler
+    if _llm_scheduler is None:
+        _llm_scheduler = LLMScheduler(**scheduler_options(LLM_MAX_CONNECTIONS))
+    return _llm_scheduler
+
+
+def get_async_llm_scheduler():
+    """Return the process-wide scheduler for async LLM calls (create it inside the server's event loop)"""
+    global _async_llm_scheduler
+    if _async_llm_scheduler is None:
+        _async_llm_scheduler = AsyncLLMScheduler(**scheduler_options(LLM_MAX_CONNECTIONS))
+    return _async_llm_scheduler
+
+
+def llm_stats():
+    """Scheduler counters for /api/stats (whichever schedulers this process has used)"""
+    stats = {}
+    if _llm_scheduler is not None:
+        stats["sync"] = _llm_scheduler.stats()
+    if _async_llm_scheduler is not None:
+        stats["async"] = _async_llm_scheduler.stats()
+    return stats
+
+
+def run_sync(steps, client, priority=GUESS):
+    """Drive an LLM step generator with a blocking client; returns its result"""
+    scheduler = get_llm_scheduler()
+    try:
+        request = next(steps)
+        while True:
+            try:
+                with span("llm"):
+                    response = scheduler.call(lambda: client.chat.completions.create(**request), request, priority)
+            except Exception as e:
+                request = steps.throw(e)
+            else:
+                request = steps.send(response)
+    except StopIteration as done:
+        return done.value
+
+
+async def run_async(steps, client, priority=GUESS):
+    """Drive an LLM step generator with an async client; returns its result"""
+    scheduler = get_async_llm_scheduler()
+    try:
+        request = next(steps)
+        while True:
+            try:
+                with span("llm"):
+                    response = await scheduler.call(lambda: client.chat.completions.create(**request),
+                                                    request, priority)
+            except Exception as e:
+                request = steps.throw(e)
+            else:
+                request = steps.send(response)
+    except StopIteration as done:
+        return done.value
+
+
+def stream_text(request, client, priority=GUESS):
+    """Send one request with stream=True and yield the text as it arrives (holds a scheduler slot until done)"""
+    with get_llm_scheduler().slot(priority):
+        for chunk in client.chat.completions.create(stream=True, **request):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+async def stream_text_async(request, client, priority=GUESS):
+    """Async version of stream_text"""
+    async with get_async_llm_scheduler().slot(priority):
+        async for chunk in await client.chat.completions.create(stream=True, **request):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+def sse_event(event, data):
+    """Format one server-sent event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+# Rephrased hints are shared between players who send the exact same prompt
+hint_cache = create_hint_cache()
+
+
+def cached_reply(request):
+    """The cached LLM reply for a request, or None (always None with the cache off)"""
+    if hint_cache is None:
+        return None
+    with span("hint_cache"):
+        return hint_cache.get(cache_key(request))
+
+
+def cache_reply(request, text):
+    if hint_cache is not None:
+        hint_cache.put(cache_key(request), text)
+
+
+SYSTEM_PROMPT = "You are a Wordle game that the user plays via chat. The word the user is trying to guess is: {word}, they have 6 guesses! Call validate_word() when you receive a user's guess. Call end_game() when the game is over (won, lost, or after 6 guesses). You are responsible for driving the game loop. Each round the system will validate the guess and give them the hint (using color emojis, green 🟩 corresponds to letter in correct position, yellow 🟨 corresponds to letter in incorrect position, and gray ⬜ corresponds to letter not in the word) that you should display."
+START_MESSAGE = {"role": "user", "content": "[system] Start a new Wordle game"}
+
+# How many recent turns (a guess and everything the model said about it) are
+# sent to the model verbatim. Older turns are replaced by one compact board
+# message, so each request stays about the same size however long the game
+# runs. 0 sends the whole transcript, as before.
+HISTORY_TURNS = int(os.environ.get('WORDLE_HISTORY_TURNS', '1'))
+WELCOME_MESSAGE = "Welcome to Wordle! I'm thinking of a 5-letter word. You have 6 attempts to guess it!"
+
+GAME_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "validate_word",
+            "description": "Validate the user's guess for the Wordle game and provide feedback",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "guess": {"type": "string", "description": "The user's 5-letter guess"}
+                },
+                "required": ["guess"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "end_game",
+            "description": "Call this function to end the game",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reason": {"type": "string", "description": "The reason for ending the game", "enum": ["WON", "LOST", "QUIT"]},
+                    "answer": {"type": "string", "description": "The correct answer"}
+                },
+                "required": ["reason", "answer"]
+            }
+        }
+    },
+]
+
+
+class WordleGameSession:
+    # Slots keep each game small: no per-instance __dict__, no per-game client,
+    # and the system prompt is rendered on demand instead of stored per game
+    __slots__ = (
+        'game_id', 'word_of_the_day', 'model', 'history', 'curr_guess', 'hints_messages',
+        'game_over', 'attempts', 'max_attempts', 'won', 'flavor_text', 'flavor_attempt',
+        'board', 'candidates', 'narrowed', 'revision'
+    )
+
+    def __init__(self, game_id, word_of_the_day, model="gemini-3.5-flash"):
+        self.game_id = game_id
+        self.word_of_the_day = word_of_the_day
+        self.model = model
+        self.history = []
+        self.curr_guess = ""
+        self.hints_messages = None
+        self.game_over = False
+        self.attempts = 0
+        self.max_attempts = 6
+        self.won = False
+        self.flavor_text = None
+        self.flavor_attempt = 0
+        self.board = []          # (guess, pattern code) for every scored guess
+        self.candidates = None   # hint-engine bitset of possible answers (None = all)
+        self.narrowed = 0        # how many board entries are applied to candidates
+        self.revision = 0        # bumped by the session store on every save
+
+    @classmethod
+    def from_log(cls, game_id, state):
+        """Rebuild a game from the event log (event_log.GameState) after a restart"""
+        answer, board = state.words()
+        session = cls(game_id, answer.upper())
+        for guess, code in board:
+            session.record_guess(guess, code)
+            session.start_turn(guess.upper())
+            session.history.append({"role": "assistant", "content": f'Hint: {" ".join(pattern_to_emoji(code))}'})
+        session.flavor_attempt = session.attempts
+        return session
+
+    def record_guess(self, guess, code):
+        self.attempts += 1
+        self.curr_guess = guess
+        self.board.append((guess.lower(), code))
+
+    def plan_hint(self):
+        """The hint engine's hint for this game, worked out without changing it
+
+        Safe to run on a stored game outside the store's lock, since it only
+        reads. Pass the candidates on to keep_candidates() so the next hint
+        doesn't narrow by the same guesses again.
+
+        Returns:
+            tuple: (hint, candidate bitset, how many board entries it covers)
+        """
+        # narrowed before candidates: keep_candidates writes them the other way
+        # round, so a racing save can only make us re-apply a guess (harmless)
+        narrowed = self.narrowed
+        candidates = self.candidates
+        board = list(self.board)
+        with span("hint_engine"):
+            engine = get_hint_engine(dictionary.words)
+            if candidates is None:
+                candidates, narrowed = engine.all_candidates, 0
+            for guess, code in board[narrowed:]:
+                candidates = engine.narrow(candidates, guess, code)
+            return engine.hint(candidates, board), candidates, len(board)
+
+    def keep_candidates(self, candidates, narrowed):
+        """Save candidates from plan_hint unless this game already has newer ones
+
+        The board only ever grows, so candidates narrowed by its first
+        `narrowed` guesses stay valid even if more guesses landed meanwhile.
+        """
+        if narrowed > self.narrowed:
+            self.candidates, self.narrowed = candidates, narrowed
+
+    def start_turn(self, guess):
+        """Add the user's guess to the history, dropping turns older than HISTORY_TURNS"""
+        self.history.append({"role": "user", "content": f"My guess is: {guess.upper()}"})
+        if HISTORY_TURNS:
+            turn_starts = [i for i, message in enumerate(self.history) if message["role"] == "user"]
+            if len(turn_starts) >= HISTORY_TURNS:
+                del self.history[:turn_starts[-HISTORY_TURNS]]
+
+    def board_message(self):
+        """Every scored guess so far as one compact message (replaces the old turns)"""
+        rows = "\n".join(f"{i}. {guess.upper()} {''.join(pattern_to_emoji(code))}"
+                         for i, (guess, code) in enumerate(self.board, 1))
+        return {
+            "role": "user",
+            "content": f"[system] Board so far ({self.attempts} of {self.max_attempts} guesses used):\n{rows}"
+        }
+
+    @property
+    def messages(self):
+        """What is sent to the model: system prompt, board state and the latest turn(s)"""
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT.format(word=self.word_of_the_day)},
+            START_MESSAGE,
+        ]
+        if HISTORY_TURNS and self.board:
+            messages.append(self.board_message())
+        return messages + self.history
+
+    def get_initial_message(self):
+        """Get the initial AI response to start the game"""
+        return run_sync(self.initial_message_steps(), get_llm_client())
+
+    def initial_message_steps(self):
+        try:
+            response = yield dict(
+                model=self.model,
+                messages=self.messages,
+                temperature=0.0
+            )
+
+            if response.choices[0].message.content:
+                ai_message = response.choices[0].message.content
+                self.history.append({
+                    "role": "assistant",
+                    "content": ai_message
+                })
+                return ai_message
+            else:
+                return WELCOME_MESSAGE
+
+        except Exception as e:
+            print(f"Error getting initial message: {e}")
+            return WELCOME_MESSAGE
+
+    def process_guess(self, guess):
+        """Process a user's guess and return the AI response"""
+        return run_sync(self.process_guess_steps(guess), get_llm_client())
+
+    def process_guess_steps(self, guess):
+        if self.game_over:
+            return {
+                "success": False,
+                "error": "Game is already over",
+                "game_over": True
+            }
+
+        if len(guess) != 5:
+            return {
+                "success": False,
+                "error": "Guess must be exactly 5 letters"
+            }
+
+        try:
+            # Add user's guess to messages
+            self.start_turn(guess)
+
+            # Get AI response with function calling
+            response = yield dict(
+                model=self.model,
+                messages=self.messages,
+                temperature=0.0,
+                tools=GAME_TOOLS
+            )
+
+            ai_message = ""
+            feedback = None
+
+            # Handle tool calls
+            if response.choices[0].message.tool_calls:
+                tool_calls = response.choices[0].message.tool_calls
+
+                # Add assistant message with tool calls
+                if response.choices[0].message.content:
+                    ai_message = response.choices[0].message.content
+
+                self.history.append({
+                    "role": "assistant",
+                    "content": response.choices[0].message.content or "",
+                    "tool_calls": tool_calls
+                })
+
+                for tool_call in tool_calls:
+                    tool_call.id = self.generate_call_id()
+
+                    if tool_call.function.name == "validate_word":
+                        feedback = self.validate_word(guess, self.word_of_the_day)
+                        # Only increment attempts for valid words (feedback is not None and not empty)
+                        if feedback["feedback"] is not None and len(feedback["feedback"]) > 0:
+                            self.record_guess(guess, feedback["pattern"])
+                        self.history.append({
+                            "role": "tool",
+                            "tool_call_id": tool_call.id,
+                            "name": "validate_word",
+                            "content": feedback["message"]
+                        })
+
+                    elif tool_call.function.name == "end_game":
+                        args = json.loads(tool_call.function.arguments)
+                        reason = args.get("reason", "QUIT")
+
+                        if reason == "WON":
+                            self.won = True
+
+                        self.game_over = True
+
+                        self.history.append({
+                            "role": "tool",
+                            "tool_call_id": tool_call.id,
+                            "name": "end_game",
+                            "content": f"Game ended: {reason}. Answer was: {self.word_of_the_day}"
+                        })
+
+                # Get final AI response after tool calls
+                if not self.game_over or len([tc for tc in tool_calls if tc.function.name == "end_game"]) > 0:
+                    final_response = yield dict(
+                        model=self.model,
+                        messages=self.messages,
+                        temperature=0.0
+                    )
+
+                    if final_response.choices[0].message.content:
+                        ai_message = final_response.choices[0].message.content
+                        self.history.append({
+                            "role": "assistant",
+                            "content": ai_message
+                        })
+
+            elif response.choices[0].message.content:
+                ai_message = response.choices[0].message.content
+                self.history.append({
+                    "role": "assistant",
+                    "content": ai_message
+                })
+
+            # Check if game should end due to max attempts
+            if self.attempts >= self.max_attempts and not self.game_over:
+                self.game_over = True
+                ai_message += f" Game Over! The word was: {self.word_of_the_day}"
+
+            return {
+                "success": True,
+                "message": ai_message,
+                "feedback": feedback["feedback"] if feedback else None,
+                "game_over": self.game_over,
+                "won": self.won,
+                "answer": self.word_of_the_day if self.game_over else None,
+                "attempts": self.attempts
+            }
+
+        except Exception as e:
+            print(f"Error processing guess: {e}")
+            return {
+                "success": False,
+                "error": f"Error processing guess: {str(e)}"
+            }
+
+    def referee_guess(self, guess):
+        """Score a guess locally (no LLM round-trip) and return immediately.
+
+        Returns the same JSON shape as process_guess. The AI's commentary is
+        generated in the background (see flavor_text_steps); poll
+        /api/flavor/<game_id> for it.
+        """
+        if self.game_over:
+            return {
+                "success": False,
+                "error": "Game is already over",
+                "game_over": True
+            }
+
+        if len(guess) != 5:
+            return {
+                "success": False,
+                "error": "Guess must be exactly 5 letters"
+            }
+
+        feedback = self.validate_word(guess, self.word_of_the_day)
+        if feedback["feedback"] is None:
+            return {
+                "success": True,
+                "message": feedback["message"],
+                "feedback": None,
+                "game_over": False,
+                "won": False,
+                "answer": None,
+                "attempts": self.attempts
+            }
+
+        self.record_guess(guess, feedback["pattern"])
+        message = feedback["message"]
+        if feedback["pattern"] == ALL_GREEN:
+            self.won = True
+            self.game_over = True
+        elif self.attempts >= self.max_attempts:
+            self.game_over = True
+            message += f" Game Over! The word was: {self.word_of_the_day}"
+
+        # Keep the transcript in sync so LLM-backed features see every guess
+        self.start_turn(guess)
+        self.history.append({"role": "assistant", "content": message})
+
+        return {
+            "success": True,
+            "message": message,
+            "feedback": feedback["feedback"],
+            "game_over": self.game_over,
+            "won": self.won,
+            "answer": self.word_of_the_day if self.game_over else None,
+            "attempts": self.attempts,
+            "flavor_pending": True
+        }
+
+    def generate_flavor_text(self, messages):
+        """Ask the model for a short comment on the latest guess"""
+        return run_sync(self.flavor_text_steps(messages), get_llm_client(), BACKGROUND)
+
+    def flavor_text_request(self, messages):
+        return dict(
+            model=self.model,
+            messages=messages + [{
+                "role": "user",
+                "content": "[system] The guess above has already been scored. In one or two short, upbeat sentences, react to it as the game host. Do not reveal the word unless the game is over."
+            }],
+            temperature=0.7
+        )
+
+    def flavor_text_steps(self, messages):
+        try:
+            response = yield self.flavor_text_request(messages)
+            return response.choices[0].message.content
+        except Exception as e:
+            print(f"Error generating flavor text: {e}")
+            return None
+
+    def set_flavor_text(self, attempt, text):
+        # Only keep commentary for the newest guess
+        if attempt >= self.flavor_attempt:
+            self.flavor_attempt = attempt
+            self.flavor_text = text
+
+    def rephrase_hint(self, hint):
+        """Ask Gemini to turn the hint engine's hint into a friendlier, more creative one"""
+        return run_sync(self.rephrase_hint_steps(hint), get_llm_client(), HINT)
+
+    def rephrase_hint_request(self, hint):
+        """The LLM request for rephrasing a hint (the hint conversation so far + a new ask)"""
+        word = self.word_of_the_day
+        attempts = self.attempts
+
+        # Start the hints conversation if this is the first rephrased hint
+        hints_messages = self.hints_messages or [{
+            "role": "system",
+            "content": f"You are a helpful assistant that gives hints for Wordle games. The target word is '{word}'. The user's current guess is '{self.curr_guess}'. Give creative, helpful hints without revealing the word directly. Vary your hint style - you can mention letter count, provide riddles that give hints about the word and its meaning, word characteristics, rhymes, definitions. Or provide several candidiate words based on how many attempts the user has made. Don't repeat previous hints."
+        }]
+
+        # Create the hint request message, grounded in what the hint engine found
+        hint_request = f"Give me a helpful hint for the Wordle game. The word is '{word}' (5 letters). The user has made {attempts} attempts so far. Our solver says: {hint['hint']} Please rephrase this as a creative, helpful hint without revealing the word directly. Make it progressively more helpful if they've made more attempts."
+
+        return dict(
+            model=self.model,
+            messages=hints_messages + [{"role": "user", "content": hint_request}],
+            temperature=0.7  # Higher temperature for more creative hints
+        )
+
+    def remember_hint(self, request, hint_text):
+        """Keep the hint exchange so later hints don't repeat it"""
+        self.hints_messages = request["messages"] + [{
+            "role": "assistant",
+            "content": hint_text
+        }]
+
+    def rephrase_hint_steps(self, hint):
+        request = self.rephrase_hint_request(hint)
+        hint_text = cached_reply(request)
+        if hint_text is None:
+            response = yield request
+            hint_text = response.choices[0].message.content
+            cache_reply(request, hint_text)
+        self.remember_hint(request, hint_text)
+        return hint_text
+
+    def validate_word(self, guess, correct_word):
+        """Validate a guess and return feedback"""
+        with span("validate"):
+            return self._validate_word(guess, correct_word)
+
+    def _validate_word(self, guess, correct_word):
+        if not guess or len(guess.strip()) != 5:
+            return {
+                "message": "Invalid Input, word must be exactly 5 letters long",
+                "feedback": None
+            }
+
+        guess = guess.strip().lower()
+        correct_word = correct_word.strip().lower()
+        if guess not in dictionary:
+            return {
+                "message": f"Invalid Input, word not in the dictionary!",
+                "feedback": None
+            }
+        pattern = score(guess, correct_word)
+        if guess == correct_word:
+            return {
+                "message": f"Correct! You guessed the word {correct_word}",
+                "feedback": ["🟩", "🟩", "🟩", "🟩", "🟩"],
+                "pattern": pattern
+            }
+        else:
+            result = list(pattern_to_emoji(pattern))
+            return {
+                "message": f'Hint: {" ".join(result)}',
+                "feedback": result,
+                "pattern": pattern
+            }
+
+    def generate_call_id(self, prefix="call_"):
+        return f"{prefix}{uuid.uuid4()}"
+
+
+# Most (guess, answer) pairs one /api/batch_validate request may send
+BATCH_LIMIT = int(os.environ.get('WORDLE_BATCH_LIMIT', '100000'))
+
+
+def batch_validate(pairs, emoji=True):
+    """
+    Score many (guess, answer) pairs at once, e.g. to replay a day's game logs.
+
+    All pairs are scored in one vectorized pass (feedback_matrix.score_word_pairs)
+    against the shared dictionary, instead of one validate_word call each.
+
+    Args:
+        pairs (list): [guess, answer] pairs, any case
+        emoji (bool): Also return each pattern as emoji (like validate_word's feedback)
+
+    Returns:
+        dict: "patterns" (base-3 codes; None where the guess is not a dictionary
+        word or either word is not 5 letters), "feedback" (emoji lists, if asked)
+        and "invalid" (how many pairs could not be scored)
+
+    Raises:
+        ValueError: If pairs is not a list of [guess, answer] pairs
+    """
+    if not isinstance(pairs, list) or not all(isinstance(pair, (list, tuple)) and len(pair) == 2 for pair in pairs):
+        raise ValueError("pairs must be a list of [guess, answer] pairs")
+    with span("validate"):
+        codes = score_word_pairs([pair[0] for pair in pairs], [pair[1] for pair in pairs], dictionary).tolist()
+    patterns = [None if code == INVALID else code for code in codes]
+    result = {"patterns": patterns, "invalid": patterns.count(None)}
+    if emoji:
+        result["feedback"] = [None if code is None else list(EMOJI_PATTERNS[code]) for code in patterns]
+    return result
+
+
+def restore_games(store):
+    """Put the games saved in the store's event log (WORDLE_EVENT_LOG) back into it"""
+    restored = store.restore(WordleGameSession.from_log)
+    if restored:
+        print(f"Restored {restored} unfinished games from the event log")
+    return restored
+
+
+def get_word_of_the_day():
+    """Get the word for a new game from the preloaded schedule (no file I/O)"""
+    word_of_the_day = word_service.new_game_word()
+    print(f"Word of the day: {word_of_the_day}")
+    return word_of_the_day
@@ -0,0 +1,43 @@
+"""
+gunicorn settings for running the Wordle server with several worker processes.
+
+    gunicorn app:app                                          # Flask, threaded workers
+    gunicorn asgi_app:app -k uvicorn.workers.UvicornWorker    # async server
+
+Every worker is its own process, so games must live in a store they all share:
+this file switches the session store to SQLite (WAL mode) unless
+WORDLE_SESSION_BACKEND is already set. Sessions pickled by one worker are read
+by another, so run every worker from the same code.
+"""
+
+import multiprocessing
+import os
+
+os.environ.setdefault('WORDLE_SESSION_BACKEND', 'sqlite')
+
+bind = os.environ.get('WORDLE_BIND', '127.0.0.1:5001')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+# Threads per worker (Flask): each one can wait on an LLM call
+threads = int(os.environ.get('WORDLE_THREADS', '8'))
+# LLM calls can take a while; don't kill a worker that is just waiting on one
+timeout = 120
+
+
+def on_starting(server):
+    """Refuse to start when the event log would silently stop recording.
+
+    One process owns an event log folder: several workers would each open
+    the same one, and with preload_app (--preload) the master opens it and
+    the worker only gets a forked copy, which is disabled (see event_log.py),
+    so its games would never be logged. Runs after the command line is read,
+    so -w and --preload are checked too.
+    """
+    if os.environ['WORDLE_SESSION_BACKEND'] != 'memory' or not os.environ.get('WORDLE_EVENT_LOG'):
+        return
+    if server.cfg.workers > 1:
+        raise SystemExit("WORDLE_EVENT_LOG with the memory session store needs a single worker "
+                         "(WEB_CONCURRENCY=1); with several workers use WORDLE_SESSION_BACKEND=sqlite")
+    if server.cfg.preload_app:
+        raise SystemExit("WORDLE_EVENT_LOG with the memory session store can't be used with "
+                         "preload_app (--preload): the worker would only get a disabled copy of the log")
@@ -0,0 +1,150 @@
+"""
+Content-addressed cache for LLM-written hints.
+
+Players on the same daily word who have made the same guesses send Gemini the
+exact same hint prompt. This cache keys each reply on a hash of the normalized
+request (model, temperature and messages), so the first player pays for the
+LLM call and everyone after gets the stored reply.
+
+- an in-memory LRU tier (bounded by max_entries)
+- an optional SQLite tier on disk, shared by every worker process and kept
+  across restarts; disk hits are copied into memory
+
+Hit/miss counters are reported through stats() (shown on /api/stats).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def _normalize(content):
+    """Collapse whitespace so formatting-only differences share a cache entry"""
+    return " ".join(str(content or "").split())
+
+
+def cache_key(request):
+    """
+    The cache key for one chat.completions request.
+
+    Args:
+        request (dict): Keyword arguments for chat.completions.create
+
+    Returns:
+        str: SHA-256 hex digest of the normalized model, temperature and messages
+    """
+    normalized = {
+        "model": request.get("model"),
+        "temperature": request.get("temperature"),
+        "messages": [[message.get("role"), _normalize(message.get("content"))]
+                     for message in request.get("messages", [])],
+    }
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class HintCache:
+    """LRU memory cache with an optional SQLite tier."""
+
+    def __init__(self, max_entries=10000, path=None):
+        """
+        Args:
+            max_entries (int): Most replies kept in memory (least recently used go first)
+            path (str, optional): SQLite file for the on-disk tier (None = memory only)
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._connect()
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS hint_cache (
+                    key TEXT PRIMARY KEY,
+                    reply TEXT NOT NULL,
+                    created REAL NOT NULL
+                )
+            """)
+            # Workers forked after the app is imported (gunicorn --preload) must not
+            # share the parent's SQLite connection
+            if hasattr(os, 'register_at_fork'):
+                os.register_at_fork(after_in_child=self._after_fork)
+
+    def _connect(self):
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+
+    def _after_fork(self):
+        # A connection must never be used by two processes; open our own
+        self._lock = threading.Lock()
+        self._connect()
+
+    def get(self, key):
+        """Return the cached reply for a key, or None."""
+        with self._lock:
+            reply = self._entries.get(key)
+            if reply is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return reply
+            if self._db is not None:
+                row = self._db.execute("SELECT reply FROM hint_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, key, reply):
+        """Store a reply in memory (and on disk, if enabled)."""
+        if not reply:
+            return
+        with self._lock:
+            self._remember(key, reply)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO hint_cache (key, reply, created) VALUES (?, ?, ?)",
+                                 (key, reply, time.time()))
+
+    def _remember(self, key, reply):
+        self._entries[key] = reply
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Metrics for the /api/stats endpoint."""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk": self.path,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evicted": self.evicted,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else None,
+            }
+
+
+def create_hint_cache():
+    """Build the hint cache from the WORDLE_HINT_CACHE_* environment variables (None if disabled)"""
+    if os.environ.get('WORDLE_HINT_CACHE', 'on').lower() in ('off', '0', 'false'):
+        return None
+    return HintCache(
+        max_entries=int(os.environ.get('WORDLE_HINT_CACHE_SIZE', '10000')),
+        path=os.environ.get('WORDLE_HINT_CACHE_DB') or None
+    )
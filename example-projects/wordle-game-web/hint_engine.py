@@ -0,0 +1,173 @@
+"""
+Local hint engine for the Wordle server.
+
+Each game keeps the set of answers still consistent with its guesses as a
+Python int used as a bitset (bit i = word i of the list). After every guess the
+set is narrowed with one AND against a cached "answers that would give this
+pattern" mask taken from the precomputed feedback matrix. Hints are then
+information-theoretic: how many words are left, which guess splits them best
+(highest expected entropy), and which letters are known.
+
+No LLM call is needed; app.py can still ask the model to rephrase the result.
+"""
+
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from feedback_matrix import FeedbackMatrix, pattern_entropies
+from wordle_feedback import GREEN, YELLOW, decode_pattern
+
+
+class HintEngine:
+    """Candidate tracking + best-guess search over one word list."""
+
+    def __init__(self, words):
+        """
+        Args:
+            words (sequence[str]): Word list used as both guesses and answers
+        """
+        self.fm = FeedbackMatrix.cached(words)
+        self.words = self.fm.answer_words
+        self.all_candidates = (1 << len(self.words)) - 1
+        self._opener = None
+        # Answers that give `code` for guess row `row`, as a bitset; bounded so
+        # long-running servers don't keep every (guess, pattern) pair around
+        self._pattern_mask = lru_cache(maxsize=8192)(self._build_pattern_mask)
+
+    def _build_pattern_mask(self, row, code):
+        hits = np.packbits(self.fm.matrix[row] == code, bitorder="little")
+        return int.from_bytes(hits.tobytes(), "little")
+
+    def narrow(self, candidates, guess, code):
+        """
+        Keep only the candidates that would have produced `code` for `guess`.
+
+        Args:
+            candidates (int): Current candidate bitset
+            guess (str): The guess that was played
+            code (int): The base-3 pattern it received
+
+        Returns:
+            int: The narrowed bitset (unchanged if the guess isn't in the list)
+        """
+        row = self.fm.guess_rows.get(guess.strip().lower())
+        if row is None:
+            return candidates
+        return candidates & self._pattern_mask(row, code)
+
+    def candidate_indices(self, candidates):
+        """The answer indices set in a bitset, as a NumPy array"""
+        raw = np.frombuffer(candidates.to_bytes((len(self.words) + 7) // 8, "little"), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(raw, bitorder="little")[:len(self.words)])
+
+    def best_guess(self, candidates):
+        """
+        The guess with the highest expected information over the candidates.
+
+        Ties (and near-ties) go to words that could still be the answer.
+
+        Returns:
+            tuple[str | None, float]: (word, expected bits)
+        """
+        if candidates == self.all_candidates and self._opener is not None:
+            return self._opener
+        columns = self.candidate_indices(candidates)
+        if len(columns) == 0:
+            return None, 0.0
+        if len(columns) <= 2:
+            return self.words[columns[0]], float(len(columns) - 1)
+
+        entropies = pattern_entropies(self.fm.matrix, columns)
+        bonus = np.zeros(len(entropies))
+        bonus[columns] = 1e-6
+        row = int(np.argmax(entropies + bonus))
+        result = (self.fm.guess_words[row], float(entropies[row]))
+        if candidates == self.all_candidates:
+            self._opener = result
+        return result
+
+    @staticmethod
+    def known_letters(board):
+        """
+        Summarize what the guesses so far reveal.
+
+        Args:
+            board (list[tuple[str, int]]): (guess, pattern code) pairs
+
+        Returns:
+            dict: "pattern" (e.g. "_R__E"), "present" and "absent" letter lists
+        """
+        pattern = ["_"] * 5
+        present, absent = set(), set()
+        for guess, code in board:
+            guess = guess.lower()
+            for i, state in enumerate(decode_pattern(code)):
+                letter = guess[i]
+                if state == GREEN:
+                    pattern[i] = letter.upper()
+                    present.add(letter)
+                elif state == YELLOW:
+                    present.add(letter)
+                else:
+                    absent.add(letter)
+        absent -= present
+        return {
+            "pattern": "".join(pattern),
+            "present": sorted(letter.upper() for letter in present),
+            "absent": sorted(letter.upper() for letter in absent),
+        }
+
+    def hint(self, candidates, board):
+        """
+        Build the hint payload for a game.
+
+        Args:
+            candidates (int): The game's (already narrowed) candidate bitset
+            board (list[tuple[str, int]]): The game's (guess, pattern code) pairs
+
+        Returns:
+            dict: remaining, best_guess, expected_bits, known_letters and a
+            ready-to-show "hint" sentence
+        """
+        remaining = candidates.bit_count()
+        known = self.known_letters(board)
+        best, bits = self.best_guess(candidates)
+
+        if remaining == 0:
+            text = "Hmm, no word in my list fits those clues — trust your instincts on this one!"
+            best = None
+        elif remaining == 1:
+            text = "Only one word fits everything you've seen so far. You've got this!"
+            best = None
+        else:
+            text = f"{remaining} words still fit. Try {best.upper()} next — it should narrow things down the most (~{bits:.1f} bits)."
+        if board:
+            text += f" Known: {known['pattern']}"
+            if known["present"]:
+                text += f", contains {', '.join(known['present'])}"
+            if known["absent"]:
+                text += f", not {', '.join(known['absent'])}"
+            text += "."
+
+        return {
+            "hint": text,
+            "remaining": remaining,
+            "best_guess": best.upper() if best else None,
+            "expected_bits": round(bits, 3) if best else None,
+            "known_letters": known,
+        }
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_hint_engine(words):
+    """The process-wide HintEngine (the feedback matrix is built on first use)"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = HintEngine(words)
+        return _engine
@@ -0,0 +1,328 @@
+"""
+One gate for every LLM call the Wordle server makes.
+
+When many players guess at once, firing one request per player straight at
+Gemini trips its rate limit (HTTP 429). run_sync / run_async / stream_text in
+game.py send every request through a scheduler instead, which provides:
+
+- a token bucket: at most `rate` requests per second on average, with bursts
+  of up to `burst` (WORDLE_LLM_RPS / WORDLE_LLM_BURST; 0 = no limit)
+- a concurrency cap: at most `max_concurrent` requests in flight
+  (WORDLE_LLM_CONCURRENCY, default LLM_MAX_CONNECTIONS)
+- priorities: when requests queue up, guesses go first, then hints, then
+  background flavor text (GUESS < HINT < BACKGROUND)
+- coalescing: identical requests already in flight are sent once and every
+  caller gets (a copy of) the same response; if the caller that sent it is
+  cancelled, a waiting caller sends it again instead of being cancelled too
+- backoff: a 429 pauses the bucket for the server's Retry-After (or 1 s)
+
+LLMScheduler is for threads (Flask), AsyncLLMScheduler for one asyncio event
+loop (asgi_app.py). Counters are reported by stats() on /api/stats.
+"""
+
+import asyncio
+import copy
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+import openai
+
+# Lower runs first
+GUESS, HINT, BACKGROUND = 0, 1, 2
+PRIORITY_NAMES = {GUESS: "guess", HINT: "hint", BACKGROUND: "background"}
+
+# How long to hold off after a 429 that gave no Retry-After
+DEFAULT_BACKOFF = 1.0
+
+
+def request_key(request):
+    """Identity of a request for coalescing: a hash of every argument"""
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def retry_after(error):
+    """Seconds the server asked us to wait in a 429 response (DEFAULT_BACKOFF if it didn't say)"""
+    response = getattr(error, "response", None)
+    try:
+        return max(0.0, float(response.headers.get("retry-after")))
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_BACKOFF
+
+
+class TokenBucket:
+    """Classic token bucket; not thread-safe on its own (the schedulers hold a lock)."""
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate (float): Tokens added per second (0 or less = unlimited)
+            burst (float, optional): Bucket size (default: rate, at least 1)
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst if burst else rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def wait_time(self):
+        """Seconds until a token is available (0 = take one now)"""
+        now = time.monotonic()
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.rate <= 0:
+            return 0.0
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        if self.rate > 0:
+            self.tokens -= 1
+
+    def pause(self, seconds):
+        """Hand out no tokens for a while (after a 429), and start again from an empty bucket"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+
+class _SchedulerBase:
+    def __init__(self, rate=0, burst=None, max_concurrent=64, coalesce=True):
+        """
+        Args:
+            rate (float): Average requests per second (0 = unlimited)
+            burst (float, optional): Requests allowed at once after a quiet spell
+            max_concurrent (int): Most requests in flight at the same time
+            coalesce (bool): Share one response between identical in-flight requests
+        """
+        self.bucket = TokenBucket(rate, burst)
+        self.max_concurrent = max_concurrent
+        self.coalesce = coalesce
+        self.running = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.rate_limited = 0
+        self.max_wait = 0.0
+        self._waiting = []              # heap of (priority, sequence) tickets
+        self._sequence = itertools.count()
+        self._inflight = {}             # request key -> _Shared
+
+    def _ready(self, ticket):
+        """(Holding the lock) 0 if ticket may run now, seconds to wait for a token, or None to wait for a slot"""
+        if self._waiting[0] != ticket or self.running >= self.max_concurrent:
+            return None
+        return self.bucket.wait_time()
+
+    def _admit(self, queued_at):
+        heapq.heappop(self._waiting)
+        self.bucket.take()
+        self.running += 1
+        self.sent += 1
+        self.max_wait = max(self.max_wait, time.monotonic() - queued_at)
+
+    def _forget(self, ticket):
+        """(Holding the lock) Drop a ticket whose caller gave up"""
+        if ticket in self._waiting:
+            self._waiting.remove(ticket)
+            heapq.heapify(self._waiting)
+
+    def _rate_limited(self, error):
+        self.rate_limited += 1
+        self.bucket.pause(retry_after(error))
+
+    def stats(self):
+        """Metrics for the /api/stats endpoint."""
+        return {
+            "rate_per_s": self.bucket.rate or None,
+            "burst": self.bucket.burst if self.bucket.rate > 0 else None,
+            "max_concurrent": self.max_concurrent,
+            "running": self.running,
+            "waiting": {name: sum(1 for priority, _ in self._waiting if priority == level)
+                        for level, name in PRIORITY_NAMES.items()},
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "rate_limited": self.rate_limited,
+            "max_wait_ms": round(1000 * self.max_wait, 1),
+        }
+
+
+class _Shared:
+    """One in-flight request that identical requests wait on"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self, done):
+        self.done = done
+        self.result = None
+        self.error = None
+
+    def abandoned(self):
+        """True if the sender was cancelled or interrupted rather than getting an answer or an error"""
+        return self.error is not None and not isinstance(self.error, Exception)
+
+
+class LLMScheduler(_SchedulerBase):
+    """Scheduler for blocking calls made from many threads."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self, priority=GUESS):
+        """Wait for a token and a free slot (in priority order), hold the slot for the block"""
+        queued_at = time.monotonic()
+        with self._cond:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    wait = self._ready(ticket)
+                    if wait == 0:
+                        break
+                    self._cond.wait(wait)
+            except BaseException:
+                self._forget(ticket)
+                self._cond.notify_all()
+                raise
+            self._admit(queued_at)
+            # The next ticket may be able to go too
+            self._cond.notify_all()
+        try:
+            yield
+        except openai.RateLimitError as e:
+            with self._cond:
+                self._rate_limited(e)
+            raise
+        finally:
+            with self._cond:
+                self.running -= 1
+                self._cond.notify_all()
+
+    def call(self, send, request, priority=GUESS):
+        """
+        Run send() (which makes the request) once it is this request's turn.
+
+        Args:
+            send (callable): Makes the LLM call and returns the response
+            request (dict): The request's arguments (used to spot identical ones)
+            priority (int): GUESS, HINT or BACKGROUND
+
+        Returns:
+            The response (a deep copy of it for callers that were coalesced)
+        """
+        key = request_key(request) if self.coalesce else None
+        while key is not None:
+            with self._cond:
+                shared = self._inflight.get(key)
+                if shared is None:
+                    shared = self._inflight[key] = _Shared(threading.Event())
+                    break
+            shared.done.wait()
+            if shared.abandoned():
+                continue  # Nobody got an answer: send it (or wait on whoever does now)
+            with self._cond:
+                self.coalesced += 1
+            if shared.error is not None:
+                raise shared.error
+            return copy.deepcopy(shared.result)
+        try:
+            with self.slot(priority):
+                result = send()
+            if key is not None:
+                shared.result = copy.deepcopy(result)
+            return result
+        except BaseException as e:
+            if key is not None:
+                shared.error = e
+            raise
+        finally:
+            if key is not None:
+                with self._cond:
+                    del self._inflight[key]
+                shared.done.set()
+
+
+class AsyncLLMScheduler(_SchedulerBase):
+    """Scheduler for coroutines on one event loop."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self, priority=GUESS):
+        """Async version of LLMScheduler.slot"""
+        queued_at = time.monotonic()
+        async with self._cond:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    wait = self._ready(ticket)
+                    if wait == 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                self._forget(ticket)
+                self._cond.notify_all()
+                raise
+            self._admit(queued_at)
+            self._cond.notify_all()
+        try:
+            yield
+        except openai.RateLimitError as e:
+            self._rate_limited(e)
+            raise
+        finally:
+            async with self._cond:
+                self.running -= 1
+                self._cond.notify_all()
+
+    async def call(self, send, request, priority=GUESS):
+        """Async version of LLMScheduler.call (send returns an awaitable)"""
+        key = request_key(request) if self.coalesce else None
+        while key is not None:
+            shared = self._inflight.get(key)
+            if shared is None:
+                shared = self._inflight[key] = _Shared(asyncio.Event())
+                break
+            await shared.done.wait()
+            if shared.abandoned():
+                continue  # The sender's task was cancelled, not this one: send it ourselves
+            self.coalesced += 1
+            if shared.error is not None:
+                raise shared.error
+            return copy.deepcopy(shared.result)
+        try:
+            async with self.slot(priority):
+                result = await send()
+            if key is not None:
+                shared.result = copy.deepcopy(result)
+            return result
+        except BaseException as e:
+            if key is not None:
+                shared.error = e
+            raise
+        finally:
+            if key is not None:
+                del self._inflight[key]
+                shared.done.set()
+
+
+def scheduler_options(max_connections):
+    """Scheduler settings from the WORDLE_LLM_* environment variables"""
+    return {
+        "rate": float(os.environ.get('WORDLE_LLM_RPS', '0')),
+        "burst": float(os.environ.get('WORDLE_LLM_BURST', '0')) or None,
+        "max_concurrent": int(os.environ.get('WORDLE_LLM_CONCURRENCY', str(max_connections))),
+        "coalesce": os.environ.get('WORDLE_LLM_COALESCE', 'on').lower() not in ('off', '0', 'false'),
+    }
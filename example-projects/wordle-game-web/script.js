@@ -191,7 +191,9 @@ class WordleGame {
             this.setLoading(true);
             this.addChatMessage(`👤 Your guess: ${guess}`, 'user');
             
-            const response = await fetch('/api/submit_guess', {
+            // Streamed: the tiles arrive at once, the AI's comment follows word by word
+            // (in llm referee mode the server answers with plain JSON instead)
+            const response = await fetch('/api/submit_guess/stream', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -202,34 +204,21 @@ class WordleGame {
                 })
             });
             
-            const data = await response.json();
+            if (!this.isEventStream(response)) {
+                this.handleGuessResult(guess, await response.json());
+                return;
+            }
             
-            if (data.success) {
-                this.addChatMessage(data.message, 'system');
-                
-                // Only process valid guesses (with feedback)
-                if (data.feedback) {
-                    this.updateGuessRow(guess, data.feedback);
-                    this.gameState.attempts = data.attempts || this.gameState.attempts + 1;
-                    this.gameState.currentRow++;
-                    this.updateAttemptsDisplay();
-                    
-                    if (data.game_over) {
-                        this.endGame(data.won, data.answer);
-                    } else {
-                        this.elements.guessInput.value = '';
-                        this.elements.guessInput.focus();
-                        this.updateGameStatus(`Attempt ${this.gameState.attempts}/${this.gameState.maxAttempts} completed. Keep trying!`);
-                    }
-                } else {
-                    // Invalid word - don't advance row, allow re-editing
-                    this.updateGameStatus('Invalid word! Please try a different 5-letter word.', 'error');
-                    this.elements.guessInput.focus();
-                    this.elements.guessInput.select(); // Select the text for easy re-editing
+            let commentary = null;
+            await this.readEvents(response, (event, data) => {
+                if (event === 'feedback') {
+                    this.handleGuessResult(guess, data);
+                    this.setLoading(false);
+                } else if (event === 'token') {
+                    commentary = commentary || this.addChatMessage('', 'system');
+                    this.appendToMessage(commentary, data.text);
                 }
-            } else {
-                this.updateGameStatus('Error: ' + data.error, 'error');
-            }
+            });
         } catch (error) {
             console.error('Error submitting guess:', error);
             this.updateGameStatus('Failed to submit guess. Please try again.', 'error');
@@ -238,6 +227,63 @@ class WordleGame {
         }
     }
     
+    handleGuessResult(guess, data) {
+        if (data.success) {
+            this.addChatMessage(data.message, 'system');
+            
+            // Only process valid guesses (with feedback)
+            if (data.feedback) {
+                this.updateGuessRow(guess, data.feedback);
+                this.gameState.attempts = data.attempts || this.gameState.attempts + 1;
+                this.gameState.currentRow++;
+                this.updateAttemptsDisplay();
+                
+                if (data.game_over) {
+                    this.endGame(data.won, data.answer);
+                } else {
+                    this.elements.guessInput.value = '';
+                    this.elements.guessInput.focus();
+                    this.updateGameStatus(`Attempt ${this.gameState.attempts}/${this.gameState.maxAttempts} completed. Keep trying!`);
+                }
+            } else {
+                // Invalid word - don't advance row, allow re-editing
+                this.updateGameStatus('Invalid word! Please try a different 5-letter word.', 'error');
+                this.elements.guessInput.focus();
+                this.elements.guessInput.select(); // Select the text for easy re-editing
+            }
+        } else {
+            this.updateGameStatus('Error: ' + data.error, 'error');
+        }
+    }
+    
+    isEventStream(response) {
+        return (response.headers.get('Content-Type') || '').startsWith('text/event-stream');
+    }
+    
+    // Read a server-sent events response, calling onEvent(name, data) for each event
+    async readEvents(response, onEvent) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            let end;
+            while ((end = buffer.indexOf('\n\n')) !== -1) {
+                const block = buffer.slice(0, end);
+                buffer = buffer.slice(end + 2);
+                let event = 'message';
+                let data = '';
+                for (const line of block.split('\n')) {
+                    if (line.startsWith('event:')) event = line.slice(6).trim();
+                    else if (line.startsWith('data:')) data += line.slice(5).trim();
+                }
+                onEvent(event, data ? JSON.parse(data) : null);
+            }
+        }
+    }
+    
     updateGuessRow(guess, feedback) {
         const rowElement = document.getElementById(`row-${this.gameState.currentRow}`);
         if (!rowElement) return;
@@ -270,7 +316,7 @@ class WordleGame {
             this.setLoading(true);
             this.addChatMessage('💡 Requesting hint...', 'user');
             
-            const response = await fetch('/api/get_hint', {
+            const response = await fetch('/api/get_hint/stream', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -280,13 +326,29 @@ class WordleGame {
                 })
             });
             
-            const data = await response.json();
+            const showHint = (data) => {
+                if (data.success) {
+                    this.addChatMessage(data.hint, 'system');
+                } else {
+                    this.updateGameStatus('Failed to get hint: ' + data.error, 'error');
+                }
+            };
             
-            if (data.success) {
-                this.addChatMessage(data.hint, 'system');
-            } else {
-                this.updateGameStatus('Failed to get hint: ' + data.error, 'error');
+            if (!this.isEventStream(response)) {
+                showHint(await response.json());
+                return;
             }
+            
+            let rephrased = null;
+            await this.readEvents(response, (event, data) => {
+                if (event === 'hint') {
+                    showHint(data);
+                    this.setLoading(false);
+                } else if (event === 'token') {
+                    rephrased = rephrased || this.addChatMessage('', 'system');
+                    this.appendToMessage(rephrased, data.text);
+                }
+            });
         } catch (error) {
             console.error('Error getting hint:', error);
             this.updateGameStatus('Failed to get hint. Please try again.', 'error');
@@ -366,6 +428,12 @@ class WordleGame {
         
         this.elements.chatHistory.appendChild(messageElement);
         this.elements.chatHistory.scrollTop = this.elements.chatHistory.scrollHeight;
+        return messageElement;
+    }
+    
+    appendToMessage(messageElement, text) {
+        messageElement.appendChild(document.createTextNode(text));
+        this.elements.chatHistory.scrollTop = this.elements.chatHistory.scrollHeight;
     }
     
     updateAttemptsDisplay() {
@@ -0,0 +1,404 @@
+"""
+Session stores for active Wordle games.
+
+Every route looks games up through one of these instead of a bare dict, so
+finished and abandoned games are evicted instead of piling up forever.
+
+- MemorySessionStore: an in-process LRU with a per-entry idle TTL
+- SQLiteSessionStore: games pickled into an SQLite file (survives restarts).
+  The file is opened in WAL mode, so several worker processes (e.g. gunicorn
+  -w 4) can share it: a guess can land on any worker and still find its game.
+
+Both expire idle games from a background thread and report metrics through
+stats(). Pick one with create_session_store() (driven by environment vars).
+
+Routes change a game with update() (load, change and store back as one step,
+so two requests for one game on different workers can't both play the same
+attempt). Work too slow to do inside that step (an LLM turn) runs on a copy
+and is stored with replace(), which refuses if the game changed meanwhile:
+every put() bumps the game's ``revision``.
+
+The memory store can also keep an append-only event log (event_log.py, set
+WORDLE_EVENT_LOG to a folder): every put() logs what changed in the game, and
+restore() brings unfinished games back after a restart.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class SessionStore:
+    """Common interface + background expiry thread for the session backends."""
+
+    def __init__(self, ttl=3600, max_sessions=10000, sweep_interval=30, event_log=None):
+        """
+        Args:
+            ttl (float): Seconds a game may sit idle before it is evicted
+            max_sessions (int): Most games kept at once (least recently used go first)
+            sweep_interval (float): Seconds between background expiry sweeps
+            event_log (EventLog, optional): Log every stored change here (memory store)
+        """
+        self.ttl = ttl
+        self.event_log = event_log
+        self.max_sessions = max_sessions
+        self.sweep_interval = sweep_interval
+        self.hits = 0
+        self.misses = 0
+        self.evicted_lru = 0
+        self.evicted_expired = 0
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._start_sweeper()
+        # Servers that fork after importing the app (gunicorn --preload) only
+        # copy the calling thread, so each child needs its own sweeper (and lock)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _start_sweeper(self):
+        self._sweeper = threading.Thread(target=self._sweep_loop, name='wordle-session-sweeper', daemon=True)
+        self._sweeper.start()
+
+    def _after_fork(self):
+        self._lock = threading.RLock()
+        if not self._stop.is_set():
+            self._start_sweeper()
+
+    def get(self, game_id):
+        """Return the game (refreshing its TTL), or None if missing/expired."""
+        raise NotImplementedError
+
+    def put(self, game_id, session, ttl=None):
+        """Store (or re-store) a game. ttl overrides the store default for this game."""
+        raise NotImplementedError
+
+    def delete(self, game_id):
+        """Forget a game."""
+        raise NotImplementedError
+
+    def expire(self):
+        """Evict every expired game now; returns how many were removed."""
+        raise NotImplementedError
+
+    def restore(self, build):
+        """Load the event log's unfinished games back in (at startup); returns how many.
+
+        Args:
+            build: Called as build(game_id, GameState) to recreate each game
+        """
+        return 0
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def __contains__(self, game_id):
+        return self.get(game_id) is not None
+
+    def update(self, game_id, apply, ttl=None):
+        """Atomically load a game, call apply(session) on it and store it back.
+
+        Every change to a stored game goes through here (or replace()), so a
+        request or background job (e.g. flavor text) can't overwrite a newer
+        copy of the game saved in the meantime.
+
+        Args:
+            game_id (str): The game
+            apply: Called as apply(session); it changes the game in place
+            ttl (float or callable, optional): New idle TTL, or a function of
+                the updated game returning one; None keeps the game's TTL
+
+        Returns:
+            The updated game, or None if it doesn't exist (apply isn't called)
+        """
+        with self._atomic():
+            session = self.get(game_id)
+            if session is None:
+                return None
+            apply(session)
+            self._store_back(game_id, session, ttl)
+            return session
+
+    def replace(self, game_id, session, ttl=None):
+        """Store a copy of a game that was changed outside update() (e.g. across an LLM call).
+
+        Refuses if someone stored the game since the copy was read (its
+        revision moved on), so their change isn't lost.
+
+        Returns:
+            bool: True if stored; False if the game changed or is gone
+        """
+        with self._atomic():
+            stored = self.get(game_id)
+            if stored is None or getattr(stored, 'revision', 0) != getattr(session, 'revision', 0):
+                return False
+            self._store_back(game_id, session, ttl)
+            return True
+
+    def _store_back(self, game_id, session, ttl):
+        if callable(ttl):
+            ttl = ttl(session)
+        self.put(game_id, session, ttl=self._ttl_of(game_id) if ttl is None else ttl)
+
+    @staticmethod
+    def _next_revision(session):
+        session.revision = getattr(session, 'revision', 0) + 1
+
+    def _atomic(self):
+        """Context in which a get() + put() can't interleave with another writer's"""
+        return self._lock
+
+    def _ttl_of(self, game_id):
+        return None
+
+    def stats(self):
+        """Metrics for the /api/stats endpoint."""
+        return {
+            "backend": type(self).__name__,
+            "pid": os.getpid(),  # counters below are per worker process
+            "live_sessions": len(self),
+            "max_sessions": self.max_sessions,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted_lru": self.evicted_lru,
+            "evicted_expired": self.evicted_expired,
+            "event_log": self.event_log.stats() if self.event_log is not None else None,
+        }
+
+    def close(self):
+        self._stop.set()
+        if self.event_log is not None:
+            self.event_log.close()
+
+    def _sweep_loop(self):
+        while not self._stop.wait(self.sweep_interval):
+            try:
+                self.expire()
+            except Exception as e:
+                print(f"Error expiring sessions: {e}")
+
+
+class MemorySessionStore(SessionStore):
+    """LRU + TTL store kept in this process's memory."""
+
+    def __init__(self, **kwargs):
+        # game_id -> [session, expires_at, ttl]; order = least recently used first
+        self._entries = OrderedDict()
+        super().__init__(**kwargs)
+
+    def get(self, game_id):
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            now = time.monotonic()
+            if entry[1] <= now:
+                del self._entries[game_id]
+                self.evicted_expired += 1
+                self.misses += 1
+                return None
+            entry[1] = now + entry[2]
+            self._entries.move_to_end(game_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, game_id, session, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._next_revision(session)
+            self._entries[game_id] = [session, time.monotonic() + ttl, ttl]
+            self._entries.move_to_end(game_id)
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+                self.evicted_lru += 1
+            if self.event_log is not None:
+                self.event_log.record(session)
+
+    def restore(self, build):
+        if self.event_log is None:
+            return 0
+        games, self.event_log.recovered = self.event_log.recovered, {}
+        now, wall_clock = time.monotonic(), time.time()
+        with self._lock:
+            # Oldest first, so the LRU order matches when the games were last played
+            for game_id, state in sorted(games.items(), key=lambda item: item[1].last_seen):
+                idle = max(0.0, wall_clock - state.last_seen)
+                self._entries[game_id] = [build(game_id, state), now + self.ttl - idle, self.ttl]
+                self._entries.move_to_end(game_id)
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+                self.evicted_lru += 1
+        return len(games)
+
+    def delete(self, game_id):
+        with self._lock:
+            self._entries.pop(game_id, None)
+
+    def expire(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [game_id for game_id, entry in self._entries.items() if entry[1] <= now]
+            for game_id in expired:
+                del self._entries[game_id]
+            self.evicted_expired += len(expired)
+        return len(expired)
+
+    def _ttl_of(self, game_id):
+        entry = self._entries.get(game_id)
+        return entry[2] if entry else None
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Games pickled into an SQLite database file."""
+
+    def __init__(self, path='wordle_sessions.db', busy_timeout=10.0, touch_interval=5.0, **kwargs):
+        """
+        Args:
+            path (str): SQLite file to keep games in
+            busy_timeout (float): Seconds to wait for another process's write lock
+            touch_interval (float): A read only refreshes a game's last access (a
+                write) when it is older than this, so polling stays read-only
+            **kwargs: ttl / max_sessions / sweep_interval, as for SessionStore;
+                max_sessions is enforced by the background sweep, not every put()
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.touch_interval = touch_interval
+        self._connect()
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                game_id TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                last_access REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                ttl REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS sessions_last_access ON sessions (last_access)")
+        super().__init__(**kwargs)
+
+    def _connect(self):
+        self._db = sqlite3.connect(self.path, timeout=self.busy_timeout,
+                                   check_same_thread=False, isolation_level=None)
+        # WAL: readers never block the writer, and processes share the file safely
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+
+    def _after_fork(self):
+        # A connection must never be used by two processes; open our own
+        self._connect()
+        super()._after_fork()
+
+    @contextmanager
+    def _atomic(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so the read-modify-write
+        # is atomic across worker processes too, not just threads
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def get(self, game_id):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data, last_access, expires_at, ttl FROM sessions WHERE game_id = ?", (game_id,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            data, last_access, expires_at, ttl = row
+            if expires_at <= now:
+                self._db.execute("DELETE FROM sessions WHERE game_id = ?", (game_id,))
+                self.evicted_expired += 1
+                self.misses += 1
+                return None
+            # Reads stay reads (no WAL write lock) unless the TTL refresh is overdue
+            if now - last_access > self.touch_interval:
+                self._db.execute(
+                    "UPDATE sessions SET last_access = ?, expires_at = ? WHERE game_id = ?",
+                    (now, now + ttl, game_id)
+                )
+            self.hits += 1
+        return pickle.loads(data)
+
+    def put(self, game_id, session, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            self._next_revision(session)
+            data = pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL)
+            self._db.execute(
+                "INSERT OR REPLACE INTO sessions (game_id, data, last_access, expires_at, ttl) VALUES (?, ?, ?, ?, ?)",
+                (game_id, data, now, now + ttl, ttl)
+            )
+
+    def delete(self, game_id):
+        with self._lock:
+            self._db.execute("DELETE FROM sessions WHERE game_id = ?", (game_id,))
+
+    def expire(self):
+        with self._lock:
+            removed = self._db.execute("DELETE FROM sessions WHERE expires_at <= ?", (time.time(),)).rowcount
+            self.evicted_expired += removed
+            # The cap is checked here rather than on every put(), which would COUNT(*) per write
+            excess = self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] - self.max_sessions
+            if excess > 0:
+                self._db.execute(
+                    "DELETE FROM sessions WHERE game_id IN (SELECT game_id FROM sessions ORDER BY last_access LIMIT ?)",
+                    (excess,)
+                )
+                self.evicted_lru += excess
+        return removed
+
+    def _ttl_of(self, game_id):
+        row = self._db.execute("SELECT ttl FROM sessions WHERE game_id = ?", (game_id,)).fetchone()
+        return row[0] if row else None
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def close(self):
+        super().close()
+        with self._lock:
+            self._db.close()
+
+
+def create_session_store():
+    """Build the session store selected by the WORDLE_SESSION_* environment variables"""
+    options = {
+        "ttl": float(os.environ.get('WORDLE_SESSION_TTL', '3600')),
+        "max_sessions": int(os.environ.get('WORDLE_MAX_SESSIONS', '10000')),
+        "sweep_interval": float(os.environ.get('WORDLE_SESSION_SWEEP', '30')),
+    }
+    backend = os.environ.get('WORDLE_SESSION_BACKEND', 'memory').lower()
+    log_dir = os.environ.get('WORDLE_EVENT_LOG')
+    if backend == 'sqlite':
+        if log_dir:
+            print("WORDLE_EVENT_LOG is ignored with the sqlite backend (games are already saved)")
+        return SQLiteSessionStore(os.environ.get('WORDLE_SESSION_DB', 'wordle_sessions.db'), **options)
+    if backend == 'memory':
+        if log_dir:
+            from event_log import EventLog
+            options["event_log"] = EventLog(
+                log_dir,
+                fsync_interval=float(os.environ.get('WORDLE_EVENT_LOG_FSYNC', '0.05')),
+                snapshot_every=int(os.environ.get('WORDLE_SNAPSHOT_EVERY', '100000')),
+                ttl=options["ttl"],
+            )
+        return MemorySessionStore(**options)
+    raise ValueError(f"Unknown WORDLE_SESSION_BACKEND: {backend}")
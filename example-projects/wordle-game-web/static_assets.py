@@ -0,0 +1,172 @@
+"""
+Static files for the Wordle UI, prepared once at startup.
+
+Every file the page needs (index.html, style.css, script.js) is read into
+memory when the server starts, and for each one we precompute:
+
+- a content hash, used as the ETag and as a fingerprint in the file name
+  (style.css -> style.3f2a9c1e.css)
+- gzip and (if the `brotli` package is installed) brotli versions
+
+index.html is rewritten to point at the fingerprinted names. Those URLs change
+whenever the file does, so browsers may cache them for a year without asking
+again; index.html itself is revalidated on every load, and a matching
+If-None-Match gets a bodyless 304 instead of the file.
+
+Only files in the whitelist are served, so app.py, .env, session databases
+and the like can never be downloaded. Both app.py (Flask) and asgi_app.py
+(Starlette) use the same framework-neutral respond() method.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The only files the server hands out
+STATIC_FILES = ('index.html', 'style.css', 'script.js')
+
+# Fingerprinted URLs never change content, so browsers may keep them forever
+IMMUTABLE = 'public, max-age=31536000, immutable'
+# Everything else may be cached but must be revalidated (cheap with a 304)
+REVALIDATE = 'no-cache'
+
+# Smaller files aren't worth compressing
+MIN_COMPRESS_BYTES = 512
+
+SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+}
+
+
+class Asset:
+    """One static file: its bytes, ETag and precompressed variants."""
+
+    __slots__ = ('name', 'content_type', 'digest', 'fingerprinted', 'variants')
+
+    def __init__(self, name, data):
+        self.name = name
+        content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type.endswith('javascript'):
+            content_type += '; charset=utf-8'
+        self.content_type = content_type
+        self.digest = hashlib.sha256(data).hexdigest()[:16]
+        stem, ext = os.path.splitext(name)
+        self.fingerprinted = f"{stem}.{self.digest[:8]}{ext}"
+
+        # encoding -> bytes; only kept when compression actually helps
+        self.variants = {'identity': data}
+        if len(data) >= MIN_COMPRESS_BYTES:
+            candidates = {'gzip': gzip.compress(data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                candidates['br'] = brotli.compress(data, quality=11)
+            for encoding, body in candidates.items():
+                if len(body) < len(data):
+                    self.variants[encoding] = body
+
+    def etag(self, encoding):
+        """Strong ETag for one encoding (each variant is a different byte string)"""
+        return f'"{self.digest}"' if encoding == 'identity' else f'"{self.digest}-{encoding}"'
+
+
+def _accepted_encodings(accept_encoding):
+    """Encodings the client allows, from an Accept-Encoding header (ignores q=0)"""
+    accepted = set()
+    for part in (accept_encoding or '').split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = params.strip().lower()
+        if quality.startswith('q=') and quality[2:].strip() in ('0', '0.0', '0.00', '0.000'):
+            continue
+        accepted.add(token)
+    return accepted
+
+
+def _etag_matches(if_none_match, digest):
+    """True if an If-None-Match header names any variant of this content"""
+    for tag in (if_none_match or '').split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return True
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag.split('-', 1)[0] == digest:
+            return True
+    return False
+
+
+class StaticAssets:
+    """The whitelisted UI files, loaded and compressed once."""
+
+    def __init__(self, root=BASE_DIR, files=STATIC_FILES, index='index.html'):
+        """
+        Args:
+            root (str): Folder holding the files
+            files (tuple): File names that may be served
+            index (str): The page served at "/" (its references get fingerprinted)
+        """
+        self.root = root
+        self.index = index
+        self._assets = {}
+        for name in files:
+            if name != index:
+                with open(os.path.join(root, name), 'rb') as f:
+                    self._add(Asset(name, f.read()))
+        with open(os.path.join(root, index), encoding='utf-8') as f:
+            page = f.read()
+        for asset in list(self._assets.values()):
+            page = page.replace(f'"{asset.name}"', f'"{asset.fingerprinted}"')
+        self._add(Asset(index, page.encode('utf-8')))
+
+    def _add(self, asset):
+        self._assets[asset.name] = asset
+        self._assets[asset.fingerprinted] = asset
+
+    def get(self, name):
+        """The Asset served under a (plain or fingerprinted) name, or None"""
+        return self._assets.get(name)
+
+    def respond(self, name, if_none_match=None, accept_encoding=None):
+        """
+        Build the response for one request.
+
+        Args:
+            name (str): Requested file name (plain or fingerprinted)
+            if_none_match (str, optional): The request's If-None-Match header
+            accept_encoding (str, optional): The request's Accept-Encoding header
+
+        Returns:
+            tuple: (status, headers dict, body bytes); status is 200, 304 or 404
+        """
+        asset = self._assets.get(name)
+        if asset is None:
+            return 404, {'Content-Type': 'text/plain; charset=utf-8'}, b'Not found'
+
+        accepted = _accepted_encodings(accept_encoding)
+        encoding = next((e for e in ('br', 'gzip') if e in asset.variants and e in accepted), 'identity')
+        headers = dict(SECURITY_HEADERS)
+        headers.update({
+            'ETag': asset.etag(encoding),
+            'Cache-Control': IMMUTABLE if name == asset.fingerprinted else REVALIDATE,
+            'Vary': 'Accept-Encoding',
+        })
+        if _etag_matches(if_none_match, asset.digest):
+            return 304, headers, b''
+
+        body = asset.variants[encoding]
+        headers['Content-Type'] = asset.content_type
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return 200, headers, body
+
@@ -0,0 +1,168 @@
+"""
+Self-check for the game event log 📼
+===================================
+
+Plays a few games into an EventLog in a temporary folder, "crashes" and
+restarts it, and checks that the games come back: from the log tail, from a
+snapshot, and when the last record was only half written or a record is
+corrupted. No server, network or API key needed.
+
+HOW TO RUN (from the project's ROOT folder):
+
+    python example-projects/wordle-game-web/test_event_log.py
+
+You should see a row of ✅ PASS lines.
+"""
+
+import os
+import sys
+import tempfile
+import uuid
+
+# Shared helpers (word index, scoring) live in shared/utils at the repo root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+
+from event_log import RECORD, EventLog  # noqa: E402
+from wordle_feedback import ALL_GREEN, score  # noqa: E402
+
+
+def check(name, condition):
+    """Print a friendly PASS/FAIL line and remember the result."""
+    print(("✅ PASS" if condition else "❌ FAIL"), "-", name)
+    return condition
+
+
+class Game:
+    """The parts of a WordleGameSession that EventLog.record reads"""
+
+    def __init__(self, answer):
+        self.game_id = str(uuid.uuid4())
+        self.word_of_the_day = answer.upper()
+        self.board = []
+        self.game_over = False
+        self.won = False
+
+    def guess(self, word):
+        code = score(word, self.word_of_the_day)
+        self.board.append((word, code))
+        if code == ALL_GREEN:
+            self.game_over = self.won = True
+        return self
+
+
+def open_log(folder, **options):
+    # No background flusher: the checks decide when things are written
+    return EventLog(folder, fsync_interval=0, **options)
+
+
+def crash(log):
+    """Leave the folder the way a killed server would: flushed events on disk, no final snapshot"""
+    log.flush()
+    log._file.close()
+    log._lock_file.close()   # the OS drops the folder lock when a process dies
+
+
+def boards(games):
+    """game id -> (answer, board) for what a log recovered"""
+    return {game_id: state.words() for game_id, state in games.items()}
+
+
+def files(folder, prefix):
+    return sorted(name for name in os.listdir(folder) if name.startswith(prefix))
+
+
+results = []
+print("\nReplay after a restart")
+with tempfile.TemporaryDirectory() as folder:
+    log = open_log(folder)
+    playing = Game("crane").guess("slate").guess("moist")
+    won = Game("pride").guess("pride")
+    for game in (playing, won):
+        log.record(game)
+    crash(log)
+    log = open_log(folder)
+    results.append(check("an unfinished game comes back from the log tail with its whole board",
+                         boards(log.recovered) == {playing.game_id: ("crane", playing.board)}))
+    results.append(check("the tail is folded into a snapshot and its segment removed",
+                         files(folder, "snapshot-") == ["snapshot-000001.bin"]
+                         and files(folder, "events-") == ["events-000002.log"]))
+    log.record(playing.guess("crane"))
+    log.close()
+    log = open_log(folder)
+    results.append(check("a game that was won later is gone after the next restart", log.recovered == {}))
+    log.close()
+
+print("\nSnapshots")
+with tempfile.TemporaryDirectory() as folder:
+    log = open_log(folder, snapshot_every=5)
+    games = [Game("crane").guess("slate"), Game("moist").guess("world"), Game("bunch").guess("fight")]
+    for game in games:
+        log.record(game)          # 6 events: NEW_GAME + GUESS each
+    log.flush()
+    results.append(check("after snapshot_every events the log snapshots and starts a new segment",
+                         files(folder, "snapshot-") == ["snapshot-000001.bin"]
+                         and files(folder, "events-") == ["events-000002.log"]
+                         and os.path.getsize(os.path.join(folder, "events-000002.log")) == 0))
+    log.record(games[0].guess("pride"))
+    crash(log)
+    log = open_log(folder)
+    results.append(check("a restart reads the snapshot plus the newer events",
+                         boards(log.recovered) == {game.game_id: (game.word_of_the_day.lower(), game.board)
+                                                   for game in games}))
+    log.close()
+    log = open_log(folder, ttl=-1)
+    results.append(check("games idle longer than ttl are dropped on replay", log.recovered == {}))
+    log.close()
+
+print("\nDamaged files")
+with tempfile.TemporaryDirectory() as folder:
+    log = open_log(folder)
+    game = Game("crane").guess("slate").guess("moist")
+    log.record(game)              # 3 records
+    crash(log)
+    segment = os.path.join(folder, "events-000001.log")
+    with open(segment, "rb") as f:
+        intact = f.read()
+    with open(segment, "ab") as f:
+        f.write(intact[:RECORD.size // 2])   # the write a crash cut short
+
+    copy = os.path.join(folder, "copy.bin")
+    with open(copy, "wb") as f:
+        f.write(intact + intact[:RECORD.size // 2])
+    applied = log._apply_segment(copy, {})
+    results.append(check(f"a half-written last record is cut off ({RECORD.size // 2} bytes), the rest is kept",
+                         applied == 3 and os.path.getsize(copy) == len(intact)))
+    os.remove(copy)
+
+    log = open_log(folder)
+    results.append(check("a restart with a torn tail recovers every complete record",
+                         boards(log.recovered) == {game.game_id: ("crane", game.board)}))
+    crash(log)
+
+with tempfile.TemporaryDirectory() as folder:
+    log = open_log(folder)
+    game = Game("crane").guess("slate").guess("moist")
+    log.record(game)
+    crash(log)
+    segment = os.path.join(folder, "events-000001.log")
+    with open(segment, "r+b") as f:
+        f.seek(2 * RECORD.size + 20)          # inside the third record (MOIST)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    log = open_log(folder)
+    results.append(check("a record with a bad CRC is rejected, and replay stops there",
+                         boards(log.recovered) == {game.game_id: ("crane", game.board[:1])}))
+    crash(log)
+
+    snapshot = os.path.join(folder, "snapshot-000001.bin")
+    with open(snapshot, "r+b") as f:
+        f.seek(12)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    log = open_log(folder)
+    results.append(check("a snapshot with a bad checksum is skipped instead of misread", log.recovered == {}))
+    log.close()
+
+print(f"\n{sum(results)} / {len(results)} checks passed.\n")
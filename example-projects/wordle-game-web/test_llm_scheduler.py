@@ -0,0 +1,185 @@
+"""
+Self-check for the LLM scheduler 🚦
+=================================
+
+Sends fake LLM calls (plain functions that sleep, count and sometimes fail
+with a 429) through LLMScheduler and AsyncLLMScheduler, and checks the order
+they run in, that identical requests are sent once, and that a 429 holds
+everything back for the server's Retry-After. No network or API key needed.
+
+HOW TO RUN (from the project's ROOT folder):
+
+    python example-projects/wordle-game-web/test_llm_scheduler.py
+
+You should see a row of ✅ PASS lines.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import openai
+
+from llm_scheduler import BACKGROUND, GUESS, HINT, AsyncLLMScheduler, LLMScheduler
+
+
+def check(name, condition):
+    """Print a friendly PASS/FAIL line and remember the result."""
+    print(("✅ PASS" if condition else "❌ FAIL"), "-", name)
+    return condition
+
+
+def rate_limit_error(seconds):
+    """What the OpenAI client raises for an HTTP 429 with a Retry-After header"""
+    response = httpx.Response(429, headers={"retry-after": str(seconds)},
+                              request=httpx.Request("POST", "http://llm.test/v1/chat/completions"))
+    return openai.RateLimitError("Too many requests", response=response, body=None)
+
+
+def request(text):
+    return {"model": "test", "messages": [{"role": "user", "content": text}]}
+
+
+results = []
+print("\nPriorities (threads)")
+scheduler = LLMScheduler(max_concurrent=1, coalesce=False)
+order = []
+release = threading.Event()
+
+
+def blocker():
+    with scheduler.slot(GUESS):
+        release.wait()
+
+
+def queued(name, priority):
+    scheduler.call(lambda: order.append(name), request(name), priority)
+
+
+threads = [threading.Thread(target=blocker)]
+threads[0].start()
+time.sleep(0.05)
+for name, priority in [("background", BACKGROUND), ("hint", HINT), ("guess", GUESS)]:
+    threads.append(threading.Thread(target=queued, args=(name, priority)))
+    threads[-1].start()
+    time.sleep(0.05)          # so they queue in this order
+waiting = scheduler.stats()["waiting"]
+release.set()
+for thread in threads:
+    thread.join()
+results.append(check(f"queued calls wait behind the busy slot ({waiting})",
+                     waiting == {"guess": 1, "hint": 1, "background": 1}))
+results.append(check(f"they run guess, hint, background whatever order they came in ({', '.join(order)})",
+                     order == ["guess", "hint", "background"]))
+
+print("\nCoalescing (threads)")
+scheduler = LLMScheduler()
+sends = []
+
+
+def slow_send():
+    sends.append(1)
+    time.sleep(0.2)
+    return {"text": "Nice guess!"}
+
+
+replies = []
+threads = [threading.Thread(target=lambda: replies.append(scheduler.call(slow_send, request("same"))))
+           for _ in range(5)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+results.append(check(f"5 identical calls at once are sent {len(sends)} time(s)",
+                     len(sends) == 1 and scheduler.stats()["coalesced"] == 4))
+results.append(check("every caller gets the answer, each its own copy",
+                     all(reply == {"text": "Nice guess!"} for reply in replies)
+                     and len({id(reply) for reply in replies}) == 5))
+
+print("\n429 backoff (threads)")
+scheduler = LLMScheduler()
+try:
+    scheduler.call(lambda: (_ for _ in ()).throw(rate_limit_error(0.3)), request("busy"))
+    raised = False
+except openai.RateLimitError:
+    raised = True
+start = time.monotonic()
+scheduler.call(lambda: "ok", request("next"))
+waited = time.monotonic() - start
+results.append(check("a 429 is passed back to the caller and counted",
+                     raised and scheduler.stats()["rate_limited"] == 1))
+results.append(check(f"the next call waits out the 0.3 s Retry-After (waited {waited:.2f} s)", waited >= 0.28))
+
+print("\nAsync scheduler")
+
+
+async def async_checks():
+    scheduler = AsyncLLMScheduler(max_concurrent=1, coalesce=False)
+    order = []
+    release = asyncio.Event()
+
+    async def blocker():
+        async with scheduler.slot(GUESS):
+            await release.wait()
+
+    async def queued(name, priority):
+        async def send():
+            order.append(name)
+        await scheduler.call(send, request(name), priority)
+
+    tasks = [asyncio.create_task(blocker())]
+    await asyncio.sleep(0.01)
+    for name, priority in [("background", BACKGROUND), ("hint", HINT), ("guess", GUESS)]:
+        tasks.append(asyncio.create_task(queued(name, priority)))
+        await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(*tasks)
+    results.append(check(f"priorities: guess, hint, background ({', '.join(order)})",
+                         order == ["guess", "hint", "background"]))
+
+    scheduler = AsyncLLMScheduler()
+    sends = []
+
+    async def slow_send():
+        sends.append(1)
+        await asyncio.sleep(0.2)
+        return {"text": "Nice guess!"}
+
+    replies = await asyncio.gather(*[scheduler.call(slow_send, request("same")) for _ in range(5)])
+    results.append(check(f"5 identical calls at once are sent {len(sends)} time(s), everyone gets the answer",
+                         len(sends) == 1 and all(reply == {"text": "Nice guess!"} for reply in replies)))
+
+    sends.clear()
+    leader = asyncio.create_task(scheduler.call(slow_send, request("cancel me")))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(scheduler.call(slow_send, request("cancel me")))
+    await asyncio.sleep(0.05)
+    leader.cancel()
+    try:
+        reply = await follower
+    except asyncio.CancelledError:
+        reply = None
+    results.append(check("cancelling the caller that sent a request doesn't cancel the one waiting on it",
+                         leader.cancelled() and reply == {"text": "Nice guess!"} and len(sends) == 2))
+
+    async def busy():
+        raise rate_limit_error(0.3)
+
+    async def ok():
+        return "ok"
+
+    try:
+        await scheduler.call(busy, request("busy"))
+    except openai.RateLimitError:
+        pass
+    start = time.monotonic()
+    await scheduler.call(ok, request("next"))
+    waited = time.monotonic() - start
+    results.append(check(f"a 429 holds the next call back for its Retry-After (waited {waited:.2f} s)",
+                         waited >= 0.28 and scheduler.stats()["rate_limited"] == 1))
+
+
+asyncio.run(async_checks())
+
+print(f"\n{sum(results)} / {len(results)} checks passed.\n")
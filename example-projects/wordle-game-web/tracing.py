@@ -0,0 +1,193 @@
+"""
+Lightweight per-request timing for the Wordle servers.
+
+Wrap each stage of a request in a span:
+
+    with span("validate"):
+        feedback = session.validate_word(guess, answer)
+
+Every span is recorded twice:
+
+- on the current request's Trace, which the server sends back as a
+  Server-Timing header (browser dev tools show it under "Timing"):
+      Server-Timing: parse;dur=0.1, session;dur=0.2, llm;dur=612.4;desc="2 calls", total;dur=615.0
+- in a per-stage latency histogram, exported at /metrics in the Prometheus
+  text format (wordle_stage_seconds and wordle_request_seconds)
+
+The current trace lives in a context variable, so it follows the request
+through Flask's worker thread or the async server's task. Spans outside a
+request (e.g. background flavor text) only feed the histograms. Histograms are
+per process: with several gunicorn workers, each /metrics shows one worker.
+
+Set WORDLE_TRACING=off to turn everything off.
+"""
+
+import bisect
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+ENABLED = os.environ.get('WORDLE_TRACING', 'on').lower() not in ('off', '0', 'false')
+
+# Histogram bucket upper bounds, in seconds (LLM calls are slow, local work is fast)
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_current = contextvars.ContextVar('wordle_trace', default=None)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram, one series per label value."""
+
+    def __init__(self, name, label, help_text, buckets=BUCKETS):
+        self.name = name
+        self.label = label
+        self.help_text = help_text
+        self.buckets = buckets
+        self._series = {}  # label value -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, seconds):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(value)
+            if series is None:
+                series = self._series[value] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += seconds
+
+    def render(self):
+        """Prometheus text exposition lines (cumulative buckets)"""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {value: list(series) for value, series in self._series.items()}
+        for value, series in sorted(snapshot.items()):
+            label = f'{self.label}="{value}"'
+            total = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                total += count
+                lines.append(f'{self.name}_bucket{{{label},le="{bound}"}} {total}')
+            lines.append(f"{self.name}_sum{{{label}}} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{{{label}}} {total}")
+        return lines
+
+
+stage_seconds = Histogram("wordle_stage_seconds", "stage", "Time spent in each stage of a request")
+request_seconds = Histogram("wordle_request_seconds", "endpoint", "Total time to answer a request")
+
+
+class Trace:
+    """The spans recorded during one request."""
+
+    __slots__ = ('start', 'spans')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.spans = {}  # stage -> [seconds, calls], in first-seen order
+
+    def add(self, stage, seconds):
+        entry = self.spans.get(stage)
+        if entry is None:
+            self.spans[stage] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def server_timing(self):
+        """The Server-Timing header value (durations in milliseconds)"""
+        parts = []
+        for stage, (seconds, calls) in self.spans.items():
+            part = f"{stage};dur={1000 * seconds:.1f}"
+            if calls > 1:
+                part += f';desc="{calls} calls"'
+            parts.append(part)
+        parts.append(f"total;dur={1000 * self.elapsed():.1f}")
+        return ", ".join(parts)
+
+
+@contextmanager
+def span(stage):
+    """Time the enclosed block as one stage of the current request"""
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        stage_seconds.observe(stage, seconds)
+        trace = _current.get()
+        if trace is not None:
+            trace.add(stage, seconds)
+
+
+def start_trace():
+    """Begin tracing a request; returns a token for finish_trace (None when tracing is off)"""
+    if not ENABLED:
+        return None
+    return _current.set(Trace())
+
+
+def finish_trace(token, endpoint):
+    """
+    End the request's trace and record its total time.
+
+    Args:
+        token: What start_trace returned
+        endpoint (str): Label for the request histogram (e.g. "submit_guess")
+
+    Returns:
+        str: The Server-Timing header value, or None when tracing is off
+    """
+    if token is None:
+        return None
+    trace = _current.get()
+    _current.reset(token)
+    request_seconds.observe(endpoint or "unknown", trace.elapsed())
+    return trace.server_timing()
+
+
+def metrics_text():
+    """Everything recorded so far, in the Prometheus text format"""
+    return "\n".join(stage_seconds.render() + request_seconds.render()) + "\n"
+
+
+# Content type Prometheus expects from /metrics
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware: trace each HTTP request and add its Server-Timing header."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        token = start_trace()
+        trace = _current.get()
+        finished = False
+
+        async def send_with_timing(message):
+            nonlocal finished
+            if message["type"] == "http.response.start" and not finished:
+                finished = True
+                endpoint = getattr(scope.get("endpoint"), "__name__", None)
+                request_seconds.observe(endpoint or "unknown", trace.elapsed())
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
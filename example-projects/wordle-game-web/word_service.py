@@ -0,0 +1,72 @@
+"""
+Word-list service for the Wordle server.
+
+The word list is loaded once, when this module is imported, so it is ready
+under any WSGI/ASGI server (where app.py's `__main__` block never runs). A
+seeded shuffle of the list is precomputed as the daily schedule, so picking a
+new game's word is an index into a tuple: no file I/O per game, and every
+worker process agrees on today's word.
+"""
+
+import os
+import random
+from datetime import date, datetime, timezone
+
+from word_index import DEFAULT_WORD_FILE, WordIndex, load_word_index
+
+# Used only if the word file can't be read
+FALLBACK_WORDS = ["ABOUT", "ABOVE", "ABUSE", "ACTOR", "ACUTE", "ADMIT", "ADOPT", "ADULT", "AFTER", "AGAIN"]
+
+# Day 0 of the schedule; any fixed date works as long as every server agrees
+SCHEDULE_EPOCH = date(2025, 1, 1)
+
+
+class WordService:
+    """A loaded word list plus its precomputed daily schedule."""
+
+    def __init__(self, index, seed="gset-wordle", mode="daily"):
+        """
+        Args:
+            index (WordIndex): The words to serve
+            seed (str): Seed for the daily schedule shuffle (same seed = same schedule)
+            mode (str): "daily" (everyone gets today's word) or "random" (a new word per game)
+        """
+        self.index = index
+        self.mode = mode
+        schedule = [word.upper() for word in index.words]
+        random.Random(seed).shuffle(schedule)
+        self.schedule = tuple(schedule)
+        self._rng = random.Random()
+
+    @classmethod
+    def from_env(cls):
+        """Load the word list named by WORDLE_WORD_FILE (falls back to a short built-in list)"""
+        path = os.environ.get('WORDLE_WORD_FILE', DEFAULT_WORD_FILE)
+        try:
+            index = load_word_index(path)
+        except OSError as e:
+            print(f"Error reading word file: {e}")
+            index = WordIndex(FALLBACK_WORDS)
+        return cls(
+            index,
+            seed=os.environ.get('WORDLE_SCHEDULE_SEED', 'gset-wordle'),
+            mode=os.environ.get('WORDLE_WORD_MODE', 'daily').lower()
+        )
+
+    def word_for_day(self, day=None):
+        """The scheduled word for a date (default: today, UTC)"""
+        day = day or datetime.now(timezone.utc).date()
+        return self.schedule[(day - SCHEDULE_EPOCH).days % len(self.schedule)]
+
+    def random_word(self):
+        return self.schedule[self._rng.randrange(len(self.schedule))]
+
+    def new_game_word(self):
+        """The word for a new game, according to the configured mode"""
+        if self.mode == "random":
+            return self.random_word()
+        return self.word_for_day()
+
+
+# Loaded at import time so every server process has it before the first request
+word_service = WordService.from_env()
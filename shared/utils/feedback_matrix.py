@@ -0,0 +1,330 @@
+"""
+Vectorized Wordle feedback with NumPy.
+
+Instead of scoring one guess against one answer in a Python loop, this encodes
+the whole word list as a ``uint8`` array of shape (N, 5) and scores *every*
+guess against *every* answer in a handful of array operations.
+
+Each feedback pattern is stored as one base-3 integer (0-242):
+
+    position i contributes  state * 3**i   where  ⬜ = 0, 🟨 = 1, 🟩 = 2
+
+using the same two-pass duplicate-letter rules as wordle_feedback.py,
+so "🟩🟩🟩🟩🟩" is 242 and "⬜⬜⬜⬜⬜" is 0. The full 2,315 x 2,315 matrix fits
+in ~5 MB, which hint generation, solvers and offline analysis can reuse.
+
+Usage:
+    from feedback_matrix import FeedbackMatrix
+
+    fm = FeedbackMatrix.from_index()       # class05 wordle.txt, all words
+    code = fm.lookup("crane", "slate")
+    pattern_to_emoji(code)                 # ('⬜', '⬜', '🟩', '⬜', '🟩')
+
+For lots of unrelated (guess, answer) pairs, e.g. replaying game logs, use
+score_word_pairs, which scores them all in one pass without a matrix:
+
+    score_word_pairs(["crane", "xxxxx"], ["slate", "slate"], index)   # [180, -1]
+"""
+
+import hashlib
+import os
+import time
+
+import numpy as np
+
+from word_index import WORD_LENGTH, load_word_index
+from wordle_feedback import (
+    GRAY, GREEN, NUM_PATTERNS, YELLOW, pattern_to_emoji,
+)
+
+POSITION_WEIGHTS = 3 ** np.arange(WORD_LENGTH, dtype=np.int16)
+
+# Where FeedbackMatrix.cached() keeps built matrices (git-ignored)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def encode_words(words):
+    """
+    Encode words as letter numbers (a=0 ... z=25).
+
+    Args:
+        words (iterable[str]): 5-letter words, any case
+
+    Returns:
+        np.ndarray: uint8 array of shape (N, 5)
+    """
+    joined = "".join(word.strip().lower() for word in words).encode("ascii")
+    letters = np.frombuffer(joined, dtype=np.uint8) - ord("a")
+    return letters.reshape(-1, WORD_LENGTH)
+
+
+def score_encoded(guesses, answers):
+    """
+    Score every encoded guess against every encoded answer.
+
+    Args:
+        guesses (np.ndarray): uint8 array (G, 5)
+        answers (np.ndarray): uint8 array (A, 5)
+
+    Returns:
+        np.ndarray: uint8 array (G, A) of base-3 pattern codes
+    """
+    green = guesses[:, None, :] == answers[None, :, :]
+    not_green = ~green
+    states = np.where(green, GREEN, GRAY).astype(np.int16)
+    for i in range(WORD_LENGTH):
+        letter = guesses[:, i][:, None]
+        # Copies of this letter the answer has left over after its greens...
+        available = np.zeros(green.shape[:2], dtype=np.int8)
+        for k in range(WORD_LENGTH):
+            available += (answers[None, :, k] == letter) & not_green[:, :, k]
+        # ...minus copies already spent on earlier non-green spots in the guess.
+        for j in range(i):
+            available -= (guesses[:, j] == guesses[:, i])[:, None] & not_green[:, :, j]
+        states[:, :, i] += YELLOW * (not_green[:, :, i] & (available > 0))
+    return (states @ POSITION_WEIGHTS).astype(np.uint8)
+
+
+def score_pairs(guesses, answers):
+    """
+    Score guesses[i] against answers[i] for every i (pairwise, not all-vs-all).
+
+    Args:
+        guesses (np.ndarray): uint8 array (N, 5)
+        answers (np.ndarray): uint8 array (N, 5)
+
+    Returns:
+        np.ndarray: uint8 array (N,) of base-3 pattern codes
+    """
+    green = guesses == answers
+    not_green = ~green
+    states = np.where(green, GREEN, GRAY).astype(np.int16)
+    for i in range(WORD_LENGTH):
+        letter = guesses[:, i][:, None]
+        available = ((answers == letter) & not_green).sum(axis=1, dtype=np.int8)
+        for j in range(i):
+            available -= (guesses[:, j] == guesses[:, i]) & not_green[:, j]
+        states[:, i] += YELLOW * (not_green[:, i] & (available > 0))
+    return (states @ POSITION_WEIGHTS).astype(np.uint8)
+
+
+# score_word_pairs' code for a pair it could not score
+INVALID = -1
+
+_PACK_SHIFTS = np.array([5 * (WORD_LENGTH - 1 - i) for i in range(WORD_LENGTH)], dtype=np.uint32)
+
+
+def _encode_checked(words):
+    """encode_words for untrusted input: (letters, ok) with bad words as 'aaaaa' and ok=False"""
+    # Fast path: every word is already 5 letters a-z (checked on one joined buffer)
+    try:
+        joined = np.frombuffer("\n".join(words).lower().encode("ascii"), dtype=np.uint8)
+    except (TypeError, UnicodeEncodeError):
+        joined = None
+    if joined is not None and len(words) and len(joined) == (WORD_LENGTH + 1) * len(words) - 1:
+        rows = np.append(joined, ord("\n")).reshape(-1, WORD_LENGTH + 1)
+        letters = rows[:, :WORD_LENGTH]
+        if (rows[:, WORD_LENGTH] == ord("\n")).all() and ((letters >= ord("a")) & (letters <= ord("z"))).all():
+            return letters - ord("a"), np.ones(len(words), dtype=bool)
+
+    cleaned = []
+    ok = np.ones(len(words), dtype=bool)
+    for i, word in enumerate(words):
+        word = word.strip().lower() if isinstance(word, str) else ""
+        if len(word) != WORD_LENGTH or not (word.isascii() and word.isalpha()):
+            word = "a" * WORD_LENGTH
+            ok[i] = False
+        cleaned.append(word)
+    return encode_words(cleaned), ok
+
+
+def score_word_pairs(guess_words, answer_words, index=None):
+    """
+    Score many (guess, answer) pairs in one vectorized pass.
+
+    Args:
+        guess_words (sequence[str]): Guesses, any case
+        answer_words (sequence[str]): Answers, same length as guess_words
+        index (WordIndex, optional): If given, guesses not in it count as invalid
+            (checked against its packed array with one binary search over all pairs)
+
+    Returns:
+        np.ndarray: int16 array (N,) of pattern codes, INVALID where a word is
+        not 5 letters a-z or the guess is not in the index
+    """
+    if len(guess_words) != len(answer_words):
+        raise ValueError("guess_words and answer_words must be the same length")
+    guesses, valid = _encode_checked(guess_words)
+    answers, answers_ok = _encode_checked(answer_words)
+    valid &= answers_ok
+    if index is not None and len(guesses):
+        packed = (guesses.astype(np.uint32) << _PACK_SHIFTS).sum(axis=1, dtype=np.uint32)
+        known = np.frombuffer(index.packed, dtype=np.uint32) if len(index.packed) else np.zeros(1, np.uint32)
+        position = np.minimum(np.searchsorted(known, packed), len(known) - 1)
+        valid &= known[position] == packed
+    codes = score_pairs(guesses, answers).astype(np.int16)
+    codes[~valid] = INVALID
+    return codes
+
+
+def feedback_matrix(guesses, answers, chunk_size=256):
+    """
+    Build the full guess x answer feedback matrix, a block of guesses at a time.
+
+    Args:
+        guesses (np.ndarray): uint8 array (G, 5) from encode_words
+        answers (np.ndarray): uint8 array (A, 5) from encode_words
+        chunk_size (int): Guesses scored per block (bounds peak memory)
+
+    Returns:
+        np.ndarray: uint8 array (G, A) of base-3 pattern codes
+    """
+    matrix = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    for start in range(0, len(guesses), chunk_size):
+        stop = start + chunk_size
+        matrix[start:stop] = score_encoded(guesses[start:stop], answers)
+    return matrix
+
+
+def _plogp_table(size):
+    """c * log2(c) for c = 0..size (0 for c = 0), so entropies need no per-call log."""
+    table = np.zeros(size + 1)
+    counts = np.arange(1, size + 1)
+    table[1:] = counts * np.log2(counts)
+    return table
+
+
+# Below this many remaining answers, sorting each row beats 243-bin counting
+SORT_ENTROPY_BELOW = 96
+
+
+def pattern_entropies(matrix, columns=None):
+    """
+    Expected information (in bits) of every guess, given the remaining answers.
+
+    For each row (guess) this counts how the remaining answers split across
+    the 243 patterns; a guess that splits them evenly tells you the most.
+    With n answers split into buckets of size c, that is
+    log2(n) - sum(c * log2(c)) / n.
+
+    Args:
+        matrix (np.ndarray): uint8 (G, A) feedback matrix
+        columns (np.ndarray, optional): Indices of the answers still possible
+            (default: all of them)
+
+    Returns:
+        np.ndarray: float64 array (G,) of expected entropies in bits
+    """
+    block = matrix if columns is None else matrix[:, columns]
+    rows, remaining = block.shape
+    if remaining == 0:
+        return np.zeros(rows)
+    plogp = _plogp_table(remaining)
+    if remaining < SORT_ENTROPY_BELOW:
+        # Few answers: sort each row and measure the runs of equal patterns.
+        block = np.sort(block, axis=1)
+        starts = np.ones(block.shape, dtype=bool)
+        starts[:, 1:] = block[:, 1:] != block[:, :-1]
+        flat = np.flatnonzero(starts)
+        sizes = np.diff(np.append(flat, block.size))
+        spread = np.bincount(flat // remaining, weights=plogp[sizes], minlength=rows)
+    else:
+        # Many answers: one bincount over (row, pattern) pairs.
+        offsets = (np.arange(rows, dtype=np.int32) * NUM_PATTERNS)[:, None]
+        counts = np.bincount((block + offsets).ravel(), minlength=rows * NUM_PATTERNS)
+        spread = plogp[counts].reshape(rows, NUM_PATTERNS).sum(axis=1)
+    return np.log2(remaining) - spread / remaining
+
+
+class FeedbackMatrix:
+    """A precomputed guess x answer feedback table plus word -> row/column lookups."""
+
+    def __init__(self, guess_words, answer_words=None, matrix=None):
+        """
+        Args:
+            guess_words (sequence[str]): Words allowed as guesses (matrix rows)
+            answer_words (sequence[str], optional): Possible answers (columns);
+                defaults to the guess words
+            matrix (np.ndarray, optional): A previously built matrix for exactly
+                these words (skips scoring)
+        """
+        answer_words = guess_words if answer_words is None else answer_words
+        self.guess_words = tuple(word.strip().lower() for word in guess_words)
+        self.answer_words = tuple(word.strip().lower() for word in answer_words)
+        self.guess_rows = {word: i for i, word in enumerate(self.guess_words)}
+        self.answer_columns = {word: i for i, word in enumerate(self.answer_words)}
+        self.guesses = encode_words(self.guess_words)
+        self.answers = encode_words(self.answer_words)
+        if matrix is None:
+            matrix = feedback_matrix(self.guesses, self.answers)
+        self.matrix = matrix
+
+    @classmethod
+    def cached(cls, guess_words, answer_words=None, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Like FeedbackMatrix(...), but saves the matrix as a .npy file and reuses it.
+
+        The file name is a hash of both word lists, so editing a list simply
+        builds (and caches) a new matrix. The cached file is memory-mapped, so
+        worker processes loading it share one copy through the OS page cache.
+
+        Args:
+            guess_words (sequence[str]): Words allowed as guesses (matrix rows)
+            answer_words (sequence[str], optional): Possible answers (columns)
+            cache_dir (str): Folder for the .npy files
+
+        Returns:
+            FeedbackMatrix: The (possibly loaded) matrix
+        """
+        answer_words = guess_words if answer_words is None else answer_words
+        digest = hashlib.sha1()
+        for words in (guess_words, answer_words):
+            digest.update(",".join(word.strip().lower() for word in words).encode("ascii"))
+            digest.update(b"|")
+        path = os.path.join(cache_dir, f"feedback_{digest.hexdigest()[:16]}.npy")
+        try:
+            matrix = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            matrix = None
+        if matrix is not None and matrix.shape == (len(guess_words), len(answer_words)):
+            return cls(guess_words, answer_words, matrix=matrix)
+
+        fm = cls(guess_words, answer_words)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees half a file
+            temp = f"{path}.{os.getpid()}.tmp"
+            with open(temp, "wb") as f:
+                np.save(f, fm.matrix)
+            os.replace(temp, path)
+        except OSError as e:
+            print(f"Could not cache feedback matrix: {e}")
+        return fm
+
+    @classmethod
+    def from_index(cls, index=None, cache=False):
+        """Build the matrix for every word in a WordIndex (default: class05 wordle.txt)."""
+        index = index or load_word_index()
+        if cache:
+            return cls.cached(index.words)
+        return cls(index.words)
+
+    def lookup(self, guess, answer):
+        """Return the pattern code for one (guess, answer) pair from the table."""
+        row = self.guess_rows[guess.strip().lower()]
+        column = self.answer_columns[answer.strip().lower()]
+        return int(self.matrix[row, column])
+
+    def row(self, guess):
+        """All pattern codes for one guess against every answer."""
+        return self.matrix[self.guess_rows[guess.strip().lower()]]
+
+
+if __name__ == "__main__":
+    index = load_word_index()
+    start = time.perf_counter()
+    fm = FeedbackMatrix.from_index(index)
+    elapsed = time.perf_counter() - start
+    print(f"Scored {fm.matrix.size:,} guess/answer pairs in {elapsed:.2f}s "
+          f"({fm.matrix.nbytes / 1e6:.1f} MB)")
+    print("crane vs slate:", " ".join(pattern_to_emoji(fm.lookup("crane", "slate"))))
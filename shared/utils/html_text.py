@@ -0,0 +1,269 @@
+"""
+Turn a Wikipedia (or any) HTML page into compact text for an LLM prompt.
+
+The agents used to paste the raw mobile-html of an article into the Gemini
+extraction prompt: ~100 kB for a mid-sized article, most of it CSS, scripts,
+reference lists, edit links and image markup. ``html_to_text`` keeps what the
+model needs and drops the rest:
+
+- headings (as ``#``/``##``/``###``), paragraphs, list items and table rows
+  (cells joined with ``|``, so infobox facts survive)
+- the links, collected once each and listed at the end as ``- text: url``
+  (relative Wikipedia links become full https://en.wikipedia.org/wiki/... URLs)
+- no <script>/<style>, reference markers like [12], reference lists,
+  "References"/"External links"/... sections, hatnotes or navigation boxes
+
+It reads the page as a stream (a string, or an iterable of chunks such as
+``response.iter_content(decode_unicode=True)``) and stops as soon as the text
+reaches ``max_tokens`` (~4 characters per token), cutting at a line break.
+
+Usage:
+    from html_text import html_to_text
+
+    text = html_to_text(response.text, max_tokens=4000)
+
+Run ``python shared/utils/html_text.py [page.html ...]`` to benchmark it on the
+example pages (bytes in/out and time per page).
+"""
+
+import os
+import re
+import time
+from html.parser import HTMLParser
+from urllib.parse import unquote, urljoin
+
+# Rough size of one token in characters (English text)
+CHARS_PER_TOKEN = 4
+
+DEFAULT_BASE_URL = "https://en.wikipedia.org/wiki/"
+
+EXAMPLE_PAGES = [os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                              'week2-image-audio', 'class07-audio-mcp', 'examples', 'france.html')]
+
+# Elements whose contents are never text for the reader
+SKIP_TAGS = {"script", "style", "head", "noscript", "template", "svg", "math", "figure", "button", "nav"}
+
+# Elements without an end tag
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+# Classes of Wikipedia boilerplate: reference markers and lists, edit links, hatnotes, navboxes...
+SKIP_CLASSES = {
+    "mw-ref", "reference", "references", "reflist", "mw-references-wrap", "mw-editsection",
+    "pcs-edit-section-link-container", "pcs-collapse-table-collapsed-container",
+    "pcs-collapse-table-collapsed-bottom", "hatnote", "navbox", "navbox-styles", "metadata",
+    "noprint", "portalbox", "sistersitebox", "mw-empty-elt", "shortdescription", "thumb",
+}
+
+# Sections that are only lists of sources or links elsewhere
+SKIP_SECTIONS = {
+    "references", "notes", "citations", "sources", "footnotes", "bibliography", "further reading",
+    "external links", "see also",
+}
+
+# Elements that start a new line
+BLOCK_TAGS = {
+    "p", "div", "section", "ul", "ol", "li", "table", "tr", "blockquote", "dl", "dt", "dd",
+    "header", "footer", "article", "aside", "pre", "caption", "figcaption", "br", "hr",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+}
+HEADING_TAGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+
+# Links that are site furniture, not articles
+SKIP_LINK_PREFIXES = ("Special:", "Help:", "File:", "Template:", "Template_talk:", "Category:", "Wikipedia:",
+                      "Portal:", "Talk:")
+
+_SPACES = re.compile(r"[ \t\r\n\f\v ]+")
+
+
+class _Enough(Exception):
+    """Raised inside the parser once the token budget is used up"""
+
+
+class _Reducer(HTMLParser):
+    def __init__(self, base_url, budget_chars, max_links):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.budget_chars = budget_chars
+        self.max_links = max_links
+        self.lines = []            # finished lines
+        self.size = 0              # characters in self.lines
+        self.line = []             # pieces of the current line
+        self.prefix = ""           # "## ", "- " ... for the current line
+        self.stack = []            # open (non-void) tags
+        self.skip_depth = None     # stack depth where a skipped element started
+        self.section_skip = None   # heading level of a skipped section
+        self.heading = None        # [level, text pieces] while inside a heading
+        self.link = None           # [url, text pieces] while inside a link
+        self.links = {}            # url -> text, first time each is seen
+        self.truncated = False
+
+    # --- structure -----------------------------------------------------------
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "base":
+            href = dict(attrs).get("href")
+            if href:
+                self.base_url = urljoin("https:", href)
+            return
+        if self.skip_depth is not None:
+            if tag not in VOID_TAGS:
+                self.stack.append(tag)
+            return
+
+        level = HEADING_TAGS.get(tag)
+        if level is not None and self.section_skip is not None and level <= self.section_skip:
+            self.section_skip = None
+
+        if tag not in VOID_TAGS:
+            self.stack.append(tag)
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        if tag in SKIP_TAGS or SKIP_CLASSES.intersection(classes) or attrs.get("role") == "navigation":
+            if tag not in VOID_TAGS:
+                self.skip_depth = len(self.stack)
+            return
+
+        if tag in BLOCK_TAGS:
+            self._end_line()
+        if level is not None:
+            self.heading = [level, []]
+            self.prefix = "#" * level + " "
+        elif tag == "li":
+            self.prefix = "- "
+        elif tag in ("td", "th") and self.line:
+            self.line.append(" | ")
+        elif tag == "a" and self.section_skip is None:
+            url = self._resolve(attrs.get("href"))
+            if url:
+                self.link = [url, []]
+
+    def handle_endtag(self, tag):
+        if tag not in self.stack:
+            return
+        while self.stack:
+            open_tag = self.stack.pop()
+            if self.skip_depth is not None and len(self.stack) < self.skip_depth:
+                self.skip_depth = None
+            if open_tag == tag:
+                break
+        if self.skip_depth is not None:
+            return
+        if tag == "a" and self.link is not None:
+            url, pieces = self.link
+            text = _SPACES.sub(" ", "".join(pieces)).strip()
+            if text and url not in self.links and len(self.links) < self.max_links:
+                self.links[url] = text
+            self.link = None
+        elif tag in HEADING_TAGS and self.heading is not None:
+            level, pieces = self.heading
+            title = _SPACES.sub(" ", "".join(pieces)).strip().lower()
+            self.heading = None
+            if title in SKIP_SECTIONS:
+                self.line = []
+                self.prefix = ""
+                self.section_skip = level
+                return
+        if tag in BLOCK_TAGS:
+            self._end_line()
+
+    def handle_data(self, data):
+        if self.skip_depth is not None or self.section_skip is not None:
+            return
+        self.line.append(data)
+        if self.heading is not None:
+            self.heading[1].append(data)
+        if self.link is not None:
+            self.link[1].append(data)
+
+    # --- output --------------------------------------------------------------
+
+    def _end_line(self):
+        text = _SPACES.sub(" ", "".join(self.line)).strip(" |")
+        self.line = []
+        prefix, self.prefix = self.prefix, ""
+        if not text:
+            return
+        text = prefix + text
+        if self.size + len(text) + 1 > self.budget_chars:
+            self.truncated = True
+            raise _Enough
+        self.lines.append(text)
+        self.size += len(text) + 1
+
+    def _resolve(self, href):
+        """Absolute URL of an article/web link, or None for anchors and site furniture"""
+        if not href or href.startswith(("#", "javascript:", "mailto:")):
+            return None
+        url = urljoin(self.base_url, href)
+        if not url.startswith(("http://", "https://")):
+            return None
+        if "/wiki/" in url:
+            title = unquote(url.split("/wiki/", 1)[1])
+            if title.startswith(SKIP_LINK_PREFIXES):
+                return None
+            url = url.split("#", 1)[0]
+        elif "/w/index.php" in url:
+            return None
+        return url
+
+    def result(self):
+        text = "\n".join(self.lines)
+        if self.truncated:
+            text += "\n[... truncated ...]"
+        if self.links:
+            text += "\n\nLinks:\n" + "\n".join(f"- {label}: {url}" for url, label in self.links.items())
+        return text
+
+
+def html_to_text(html, max_tokens=4000, max_links=40, base_url=DEFAULT_BASE_URL):
+    """
+    Reduce an HTML page to readable text with its section structure and links.
+
+    Args:
+        html (str or iterable of str): The page, whole or in chunks
+        max_tokens (int): Budget for the text (~4 characters per token); reading stops there
+        max_links (int): Most links to list at the end (they come on top of the text budget)
+        base_url (str): For resolving relative links (a <base> tag in the page overrides it)
+
+    Returns:
+        str: Lines of text ("# Heading", "- list item", "cell | cell"), then "Links:" if any
+    """
+    # Links are listed after the text, so keep some of the budget for them
+    reducer = _Reducer(base_url, max_tokens * CHARS_PER_TOKEN * 4 // 5, max_links)
+    chunks = [html] if isinstance(html, str) else html
+    try:
+        for chunk in chunks:
+            reducer.feed(chunk)
+        reducer.close()
+        reducer._end_line()
+    except _Enough:
+        pass
+    return reducer.result()
+
+
+def benchmark(paths=None, repeats=20, max_tokens=4000):
+    """
+    Reduce each page `repeats` times.
+
+    Returns:
+        list: (file name, bytes in, bytes out, ms per page) per page
+    """
+    rows = []
+    for path in paths or EXAMPLE_PAGES:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        start = time.perf_counter()
+        for _ in range(repeats):
+            text = html_to_text(html, max_tokens=max_tokens)
+        ms = 1000 * (time.perf_counter() - start) / repeats
+        rows.append((os.path.basename(path), len(html.encode("utf-8")), len(text.encode("utf-8")), ms))
+    return rows
+
+
+if __name__ == "__main__":
+    import sys
+
+    for name, size_in, size_out, ms in benchmark(sys.argv[1:] or None):
+        print(f"{name}: {size_in:,} bytes in -> {size_out:,} bytes out "
+              f"({100 * size_out / size_in:.1f}%, ~{size_in // CHARS_PER_TOKEN:,} -> "
+              f"~{size_out // CHARS_PER_TOKEN:,} tokens), {ms:.2f} ms/page")
@@ -0,0 +1,249 @@
+"""
+HTTP response cache with conditional revalidation (used for Wikipedia fetches)
+==============================================================================
+
+The research agents fetch the same Wikipedia articles again and again, across
+questions and across runs. HTTPCache keeps successful responses in a SQLite
+file and only goes back to the server when an entry is older than `ttl`, and
+then with If-None-Match / If-Modified-Since: when the article hasn't changed
+Wikipedia answers "304 Not Modified" with no body, and the stored copy is used.
+
+- entries are bounded by total size (`max_bytes`); the least recently used go first
+- entries past `ttl` with no ETag/Last-Modified can't be revalidated and are refetched
+- hit/revalidation/miss counters are reported through stats()
+
+Scripts outside this folder use it like this:
+
+    import os, sys
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+
+    from http_cache import fetch_wikipedia
+    response = fetch_wikipedia("Eiffel tower")   # cached under "Eiffel_tower"
+    response.status_code, response.text, response.from_cache
+
+HOW TO RUN THE CHECKS (from the project's ROOT folder):
+
+    python shared/utils/test_http_cache.py
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import quote
+
+from http_client import get_session
+
+# Where the default cache lives (git-ignored, next to the feedback matrices)
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "http_cache.sqlite3")
+
+WIKIPEDIA_URL = "https://en.wikipedia.org/api/rest_v1/page/mobile-html/{title}"
+
+# Response headers worth keeping with the body
+KEPT_HEADERS = ("content-type", "content-language", "etag", "last-modified")
+
+
+def normalize_title(query):
+    """
+    Wikipedia's canonical form of an article title, so "eiffel  tower" and
+    "Eiffel_tower" share one cache entry.
+
+    Wikipedia titles only ignore the case of their first letter, so the rest
+    is left alone.
+    """
+    title = "_".join(str(query or "").replace("_", " ").split())
+    return title[:1].upper() + title[1:]
+
+
+class CachedResponse:
+    """The parts of a requests.Response the agents use, plus where it came from."""
+
+    __slots__ = ('url', 'status_code', 'content', 'headers', 'from_cache')
+
+    def __init__(self, url, status_code, content, headers, from_cache):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.from_cache = from_cache  # "hit", "revalidated" or None (fetched)
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+
+class HTTPCache:
+    """GET-only response cache on SQLite, shared safely between threads."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=24 * 3600, max_bytes=200 * 1024 * 1024,
+                 session=None, timeout=30):
+        """
+        Args:
+            path (str): SQLite file (":memory:" for a throwaway cache)
+            ttl (float): Seconds an entry is used without asking the server
+            max_bytes (int): Most body bytes kept (least recently used are evicted)
+            session: Anything with requests' get(url, headers=..., timeout=...) (default: the pooled http_client session)
+            timeout (float): Seconds before a fetch gives up
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.session = session or get_session()
+        self.timeout = timeout
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS http_cache_last_used ON http_cache (last_used)")
+
+    def get(self, url, key=None):
+        """
+        GET a URL through the cache.
+
+        Args:
+            url (str): What to fetch
+            key (str, optional): Cache key (default: the URL itself)
+
+        Returns:
+            CachedResponse: from_cache is "hit" (fresh copy, no request made),
+            "revalidated" (server said 304) or None (downloaded)
+        """
+        key = key or url
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT status, headers, body, fetched FROM http_cache WHERE key = ?",
+                                   (key,)).fetchone()
+        conditional = {}
+        if row is not None:
+            status, headers, body, fetched = row
+            headers = json.loads(headers)
+            if now - fetched < self.ttl:
+                with self._lock:
+                    self.hits += 1
+                    self._db.execute("UPDATE http_cache SET last_used = ? WHERE key = ?", (now, key))
+                return CachedResponse(url, status, body, headers, "hit")
+            if "etag" in headers:
+                conditional["If-None-Match"] = headers["etag"]
+            if "last-modified" in headers:
+                conditional["If-Modified-Since"] = headers["last-modified"]
+
+        response = self.session.get(url, headers=conditional, timeout=self.timeout)
+
+        if response.status_code == 304 and conditional:
+            # Unchanged: keep the body, pick up any new validators
+            headers.update({name: response.headers[name] for name in KEPT_HEADERS if name in response.headers})
+            with self._lock:
+                self.revalidated += 1
+                self._db.execute("UPDATE http_cache SET headers = ?, fetched = ?, last_used = ? WHERE key = ?",
+                                 (json.dumps(headers), now, now, key))
+            return CachedResponse(url, status, body, headers, "revalidated")
+
+        headers = {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+        with self._lock:
+            self.misses += 1
+            if response.status_code == 200:
+                self._store(key, url, response.status_code, headers, response.content, now)
+            elif row is not None and response.status_code in (404, 410):
+                # The article is gone: don't keep serving the old copy
+                self._db.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+        return CachedResponse(url, response.status_code, response.content, headers, None)
+
+    def _store(self, key, url, status, headers, body, now):
+        if len(body) > self.max_bytes:
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO http_cache (key, url, status, headers, body, size, fetched, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, status, json.dumps(headers), body, len(body), now, now))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for old_key, size in self._db.execute(
+                "SELECT key, size FROM http_cache WHERE key != ? ORDER BY last_used", (key,)).fetchall():
+            self._db.execute("DELETE FROM http_cache WHERE key = ?", (old_key,))
+            self.evicted += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        """Drop every entry (the counters are kept)."""
+        with self._lock:
+            self._db.execute("DELETE FROM http_cache")
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+
+    def stats(self):
+        """Hit rate and size of the cache."""
+        with self._lock:
+            entries, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache").fetchone()
+            lookups = self.hits + self.revalidated + self.misses
+            return {
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "evicted": self.evicted,
+                "hit_rate": round((self.hits + self.revalidated) / lookups, 3) if lookups else None,
+            }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_wikipedia_cache = None
+_wikipedia_cache_lock = threading.Lock()
+
+
+def get_wikipedia_cache():
+    """The process-wide cache for Wikipedia articles (HTTP_CACHE_PATH / HTTP_CACHE_TTL override the defaults)"""
+    global _wikipedia_cache
+    if _wikipedia_cache is None:
+        with _wikipedia_cache_lock:
+            if _wikipedia_cache is None:
+                _wikipedia_cache = HTTPCache(
+                    path=os.environ.get('HTTP_CACHE_PATH', DEFAULT_CACHE_PATH),
+                    ttl=float(os.environ.get('HTTP_CACHE_TTL', str(24 * 3600))),
+                )
+    return _wikipedia_cache
+
+
+def fetch_wikipedia(query, cache=None):
+    """
+    Fetch a Wikipedia article's mobile HTML, cached by its normalized title.
+
+    Args:
+        query (str): Article title as the model wrote it
+        cache (HTTPCache, optional): Defaults to get_wikipedia_cache()
+
+    Returns:
+        CachedResponse: check status_code (404 = no such article), then use text
+    """
+    title = normalize_title(query)
+    url = WIKIPEDIA_URL.format(title=quote(title, safe=""))
+    if cache is None:
+        cache = get_wikipedia_cache()
+    return cache.get(url, key=f"wikipedia:{title}")
@@ -0,0 +1,171 @@
+"""
+Shared, connection-pooled HTTP client for the agents' tools.
+
+A bare ``requests.get(url)`` opens a brand-new connection every time: a TCP
+handshake, plus a TLS handshake for https. An agent that calls a tool a dozen
+times per question pays that a dozen times. ``get_session()`` returns one
+``requests.Session`` per process that keeps connections alive and reuses them:
+
+- up to ``pool_maxsize`` open connections per host (threads wait for a free one)
+- a default timeout on every request (connect, read), so a tool never hangs forever
+- automatic retries with exponential backoff on connection errors and on
+  429/500/502/503/504 (Retry-After is honoured)
+- a User-Agent, which Wikipedia asks every program to send
+
+Usage (scripts outside this folder add it to the path first):
+
+    import os, sys
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+
+    from http_client import get_session
+    http = get_session()
+    http.get("https://api.open-meteo.com/v1/forecast", params={...}).json()
+
+Run ``python shared/utils/http_client.py`` to count the connections a burst of
+requests opens with and without the pool (against a local server).
+"""
+
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "GSET-Vibe-Coding-Course/1.0 (classroom project)"
+
+# Seconds to wait for a connection, then for the response
+DEFAULT_TIMEOUT = (5, 30)
+
+# Status codes worth trying again (rate limited or a temporary server problem)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class PooledSession(requests.Session):
+    """A requests.Session that fills in a timeout when the caller doesn't give one."""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(pool_maxsize=10, retries=3, backoff=0.5, timeout=DEFAULT_TIMEOUT, user_agent=USER_AGENT):
+    """
+    Build a keep-alive session with per-host connection limits and retries.
+
+    Args:
+        pool_maxsize (int): Most open connections to any one host
+        retries (int): Extra attempts after a failed request (0 = none)
+        backoff (float): Retry delays are backoff, 2*backoff, 4*backoff... seconds
+        timeout (float or tuple): Default (connect, read) timeout in seconds
+        user_agent (str): Sent with every request
+
+    Returns:
+        PooledSession
+    """
+    session = PooledSession(timeout=timeout)
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False,   # after the last retry, hand back the response instead of raising
+    )
+    # pool_block: when a host already has pool_maxsize connections in use, wait
+    # for one instead of opening (and then throwing away) an extra connection
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry, pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = user_agent
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    The process-wide pooled session (HTTP_POOL_SIZE / HTTP_RETRIES override the defaults).
+
+    Shared by every tool and thread in the process, so connections opened by
+    one tool call are reused by the next.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session(
+                    pool_maxsize=int(os.environ.get('HTTP_POOL_SIZE', '10')),
+                    retries=int(os.environ.get('HTTP_RETRIES', '3')),
+                )
+    return _session
+
+
+def benchmark(requests_count=200, threads=4):
+    """
+    Fetch a small page from a local server, first with bare requests.get and
+    then with a pooled session, counting the TCP connections the server accepts.
+
+    Returns:
+        dict: name -> (connections opened, seconds)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive, like real web servers
+        disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+        def do_GET(self):
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class CountingServer(ThreadingHTTPServer):
+        daemon_threads = True
+        connections = 0
+
+        def process_request(self, request, client_address):
+            self.connections += 1
+            super().process_request(request, client_address)
+
+    server = CountingServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/forecast"
+
+    pooled = create_session(pool_maxsize=threads)
+    fetchers = {
+        "requests.get": lambda: requests.get(url, timeout=DEFAULT_TIMEOUT),
+        "pooled session": lambda: pooled.get(url),
+    }
+    results = {}
+    for name, fetch in fetchers.items():
+        server.connections = 0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            statuses = list(pool.map(lambda _: fetch().status_code, range(requests_count)))
+        assert statuses == [200] * requests_count
+        results[name] = (server.connections, time.perf_counter() - start)
+    server.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    count, threads = 200, 4
+    print(f"{count} GET requests from {threads} threads to a local keep-alive server:\n")
+    for name, (connections, seconds) in benchmark(count, threads).items():
+        print(f"{name:>15}: {connections:4d} connections (handshakes), "
+              f"{1000 * seconds / count:6.2f} ms/request")
+    print("\nOver https each connection also costs a TLS handshake (often 50-150 ms to a real server).")
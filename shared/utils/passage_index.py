@@ -0,0 +1,398 @@
+"""
+Local passage retrieval (BM25) for the research agents.
+
+``search_wikipedia`` used to hand Gemini a whole article to answer one
+question. Now every fetched article is cut into passages of a few hundred
+characters, each tagged with its section heading, and put in a BM25 inverted
+index; only the top-k passages for the user's question go to the extractor.
+Articles stay in the index, so asking about an article again doesn't fetch it
+again at all (until it is older than ``max_age``).
+
+The index is a SQLite database (``":memory:"`` for a throwaway one):
+
+- ``articles``: title, URL, the article's links, when it was fetched
+- ``passages``: section heading, text and length in terms
+- ``postings``: term -> passage, term frequency (the inverted index)
+
+Usage:
+    from passage_index import search_article
+
+    found = search_article("France", question="Who appoints the prime minister?")
+    found.prompt_text()     # the top passages + their links, ready for the prompt
+
+Run ``python shared/utils/passage_index.py "your question"`` to see which
+passages of the example page are picked and how much smaller the prompt gets.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import Counter
+
+from html_text import html_to_text
+from http_cache import fetch_wikipedia, normalize_title
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "passages.sqlite3")
+
+# BM25 parameters (the usual defaults)
+K1 = 1.5
+B = 0.75
+
+# Passages sent to the extractor per search
+TOP_K = 5
+
+# Target passage size in characters (a passage never splits a sentence)
+PASSAGE_CHARS = 700
+
+# Whole articles are indexed, so read well past html_to_text's prompt-sized default
+ARTICLE_TOKENS = 100000
+
+STOPWORDS = frozenset("""
+a an and are as at be been but by can did do does for from had has have he her his how i if in into is it
+its me my no not of on or our she so than that the their them then there these they this to too was we
+were what when where which who whom why will with would you your
+""".split())
+
+_WORDS = re.compile(r"\w+")
+_SENTENCES = re.compile(r"(?<=[.!?])\s+")
+
+
+def tokenize(text):
+    """Lowercase words without accents or stopwords ("Élysée" and "elysee" match)"""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return [word for word in _WORDS.findall(text) if word not in STOPWORDS]
+
+
+def split_passages(text, max_chars=PASSAGE_CHARS):
+    """
+    Cut html_to_text output into (heading, passage) pairs.
+
+    Lines are grouped under the nearest heading until a passage reaches
+    max_chars; a longer paragraph is split between sentences. The "Links:"
+    block at the end is not part of any passage.
+
+    Returns:
+        list of (heading, text)
+    """
+    text = text.split("\n\nLinks:\n", 1)[0]
+    passages = []
+    heading = ""
+    current = []
+
+    def flush():
+        if current:
+            passages.append((heading, "\n".join(current)))
+            current.clear()
+
+    for line in text.split("\n"):
+        if not line.strip() or line == "[... truncated ...]":
+            continue
+        if line.startswith("#"):
+            flush()
+            heading = line.lstrip("#").strip()
+            continue
+        pieces = [line]
+        if len(line) > max_chars:
+            pieces, piece = [], ""
+            for sentence in _SENTENCES.split(line):
+                if piece and len(piece) + len(sentence) + 1 > max_chars:
+                    pieces.append(piece)
+                    piece = ""
+                piece = f"{piece} {sentence}" if piece else sentence
+            pieces.append(piece)
+        for piece in pieces:
+            if current and sum(len(part) + 1 for part in current) + len(piece) > max_chars:
+                flush()
+            current.append(piece)
+    flush()
+    return passages
+
+
+def _parse_links(text):
+    """The (label, url) pairs from html_to_text's "Links:" block"""
+    if "\n\nLinks:\n" not in text:
+        return []
+    links = []
+    for line in text.split("\n\nLinks:\n", 1)[1].split("\n"):
+        label, _, url = line[2:].rpartition(": ")
+        if label and url:
+            links.append((label, url))
+    return links
+
+
+class Passage:
+    """One search result."""
+
+    __slots__ = ('title', 'heading', 'text', 'score')
+
+    def __init__(self, title, heading, text, score):
+        self.title = title
+        self.heading = heading
+        self.text = text
+        self.score = score
+
+    def __repr__(self):
+        return f"Passage({self.title!r}, {self.heading!r}, score={self.score:.2f})"
+
+
+class PassageIndex:
+    """BM25 inverted index over article passages, stored in SQLite and shared safely between threads."""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        """
+        Args:
+            path (str): SQLite file (":memory:" for an index that lives only in this process)
+        """
+        self.path = path
+        self.searches = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                title TEXT PRIMARY KEY,
+                url TEXT,
+                links TEXT NOT NULL,
+                fetched REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS passages (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                heading TEXT NOT NULL,
+                text TEXT NOT NULL,
+                length INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS passages_title ON passages (title);
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                passage_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS postings_term ON postings (term);
+            CREATE INDEX IF NOT EXISTS postings_passage ON postings (passage_id);
+        """)
+
+    def add_article(self, title, text, url=None):
+        """
+        Index an article (replacing any older copy of it).
+
+        Args:
+            title (str): Key for the article (e.g. normalize_title(...))
+            text (str): The article as html_to_text output
+            url (str, optional): Where it came from
+
+        Returns:
+            int: Number of passages indexed
+        """
+        passages = split_passages(text)
+        links = _parse_links(text)
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._delete(title)
+                self._db.execute("INSERT INTO articles (title, url, links, fetched) VALUES (?, ?, ?, ?)",
+                                 (title, url, json.dumps(links), time.time()))
+                for heading, passage in passages:
+                    terms = Counter(tokenize(f"{heading} {passage}"))
+                    passage_id = self._db.execute(
+                        "INSERT INTO passages (title, heading, text, length) VALUES (?, ?, ?, ?)",
+                        (title, heading, passage, sum(terms.values()))).lastrowid
+                    self._db.executemany("INSERT INTO postings (term, passage_id, tf) VALUES (?, ?, ?)",
+                                         [(term, passage_id, tf) for term, tf in terms.items()])
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return len(passages)
+
+    def _delete(self, title):
+        self._db.execute("DELETE FROM postings WHERE passage_id IN (SELECT id FROM passages WHERE title = ?)",
+                         (title,))
+        self._db.execute("DELETE FROM passages WHERE title = ?", (title,))
+        self._db.execute("DELETE FROM articles WHERE title = ?", (title,))
+
+    def remove_article(self, title):
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._delete(title)
+            self._db.execute("COMMIT")
+
+    def article(self, title, max_age=None):
+        """(url, links) for an indexed article, or None if it isn't indexed (or is older than max_age seconds)"""
+        with self._lock:
+            row = self._db.execute("SELECT url, links, fetched FROM articles WHERE title = ?", (title,)).fetchone()
+        if row is None or (max_age is not None and time.time() - row[2] > max_age):
+            return None
+        return row[0], [tuple(link) for link in json.loads(row[1])]
+
+    def search(self, query, k=TOP_K, titles=None):
+        """
+        The k passages that best match a query (BM25).
+
+        Args:
+            query (str): Words to look for
+            k (int): How many passages to return
+            titles (list, optional): Only search these articles
+
+        Returns:
+            list of Passage, best first. When nothing matches inside `titles`,
+            the first k passages of those articles (their lead) are returned.
+        """
+        terms = set(tokenize(query))
+        where, params = "", []
+        if titles:
+            where = f" AND p.title IN ({','.join('?' * len(titles))})"
+            params = list(titles)
+        with self._lock:
+            self.searches += 1
+            count, average = self._db.execute("SELECT COUNT(*), AVG(length) FROM passages").fetchone()
+            scores = Counter()
+            for term in terms:
+                df = self._db.execute("SELECT COUNT(*) FROM postings WHERE term = ?", (term,)).fetchone()[0]
+                if not df:
+                    continue
+                idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                for passage_id, tf, length in self._db.execute(
+                        "SELECT po.passage_id, po.tf, p.length FROM postings po JOIN passages p ON p.id = po.passage_id "
+                        "WHERE po.term = ?" + where, [term] + params):
+                    scores[passage_id] += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / average))
+            best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+            if not best and titles:
+                rows = self._db.execute(f"SELECT p.id FROM passages p WHERE 1 = 1{where} ORDER BY p.id LIMIT ?",
+                                        params + [k]).fetchall()
+                best = [(row[0], 0.0) for row in rows]
+            results = []
+            for passage_id, score in best:
+                title, heading, text = self._db.execute(
+                    "SELECT title, heading, text FROM passages WHERE id = ?", (passage_id,)).fetchone()
+                results.append(Passage(title, heading, text, score))
+        return results
+
+    def stats(self):
+        """Size of the index."""
+        with self._lock:
+            articles = self._db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            passages, average = self._db.execute("SELECT COUNT(*), AVG(length) FROM passages").fetchone()
+            terms = self._db.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0]
+        return {
+            "articles": articles,
+            "passages": passages,
+            "terms": terms,
+            "average_passage_terms": round(average or 0, 1),
+            "searches": self.searches,
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class ArticleMatch:
+    """The passages of one article picked for a question, plus the links that appear in them."""
+
+    __slots__ = ('title', 'url', 'passages', 'links', 'fetched')
+
+    def __init__(self, title, url, passages, links, fetched):
+        self.title = title
+        self.url = url
+        self.passages = passages
+        self.links = links
+        self.fetched = fetched  # False when the article was already in the index
+
+    def prompt_text(self):
+        """What the extractor model reads instead of the whole article"""
+        parts = [f"Article: {self.title.replace('_', ' ')} ({self.url})"]
+        for passage in self.passages:
+            parts.append(f"[{passage.heading}]\n{passage.text}" if passage.heading else passage.text)
+        if self.links:
+            parts.append("Links:\n" + "\n".join(f"- {label}: {url}" for label, url in self.links))
+        return "\n\n".join(parts)
+
+
+_index = None
+
+
+def get_passage_index():
+    """The process-wide passage index (PASSAGE_INDEX_PATH overrides where it is stored)"""
+    global _index
+    if _index is None:
+        _index = PassageIndex(os.environ.get('PASSAGE_INDEX_PATH', DEFAULT_INDEX_PATH))
+    return _index
+
+
+def search_article(query, question=None, k=TOP_K, max_age=24 * 3600, index=None, fetch=fetch_wikipedia):
+    """
+    Find the passages of a Wikipedia article that answer a question.
+
+    The article is fetched (and indexed) only if it isn't in the index yet or
+    is older than max_age seconds.
+
+    Args:
+        query (str): Article title as the model wrote it
+        question (str, optional): What to rank passages by (default: the title)
+        k (int): Passages to return
+        max_age (float): Seconds before an indexed article is fetched again
+        index (PassageIndex, optional): Defaults to get_passage_index()
+        fetch (callable): fetch(query) -> response with status_code, text and url
+
+    Returns:
+        ArticleMatch, or None when there is no such article
+    """
+    if index is None:
+        index = get_passage_index()
+    title = normalize_title(query)
+    known = index.article(title, max_age)
+    fetched = known is None
+    if fetched:
+        response = fetch(query)
+        if response.status_code != 200:
+            return None
+        index.add_article(title, html_to_text(response.text, max_tokens=ARTICLE_TOKENS), url=response.url)
+        known = index.article(title)
+    url, links = known
+    passages = index.search(f"{query} {question or ''}", k=k, titles=[title])
+    # Only the links whose text shows up in the chosen passages
+    chosen = " ".join(passage.text for passage in passages)
+    links = [(label, link) for label, link in links if label in chosen]
+    return ArticleMatch(title, url, passages, links, fetched)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from html_text import EXAMPLE_PAGES
+
+    question = " ".join(sys.argv[1:]) or "How much is the president of France paid?"
+    with open(EXAMPLE_PAGES[0], encoding="utf-8") as f:
+        html = f.read()
+
+    class Page:
+        status_code, text, url = 200, html, "https://en.wikipedia.org/wiki/President_of_France"
+
+    index = PassageIndex(":memory:")
+    start = time.perf_counter()
+    search_article("President of France", question, index=index, fetch=lambda query: Page)
+    indexed = time.perf_counter() - start
+    start = time.perf_counter()
+    found = search_article("President of France", question, index=index, fetch=None)
+    searched = time.perf_counter() - start
+    prompt = found.prompt_text()
+
+    print(f"Question: {question}\n")
+    for passage in found.passages:
+        print(f"  {passage.score:5.2f}  [{passage.heading}] {passage.text[:90]}...")
+    print(f"\nIndex stats: {index.stats()}")
+    print(f"First search (reduce + index the page): {1000 * indexed:.1f} ms; "
+          f"repeat search (no fetch): {1000 * searched:.2f} ms")
+    print(f"Extractor prompt: raw HTML {len(html.encode('utf-8')):,} bytes -> "
+          f"reduced article {len(html_to_text(html).encode('utf-8')):,} bytes -> "
+          f"top {len(found.passages)} passages {len(prompt.encode('utf-8')):,} bytes")
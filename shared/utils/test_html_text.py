@@ -0,0 +1,76 @@
+"""
+Self-check for the HTML-to-text reducer 📰
+==========================================
+
+Runs html_to_text on a tiny hand-written page and on the saved Wikipedia
+example (week2-image-audio/class07-audio-mcp/examples/france.html), and checks
+that the junk goes, the structure and links stay, and the token budget holds.
+No network or API key needed.
+
+HOW TO RUN (from the project's ROOT folder):
+
+    python shared/utils/test_html_text.py
+
+You should see a row of ✅ PASS lines.
+"""
+
+from html_text import CHARS_PER_TOKEN, EXAMPLE_PAGES, benchmark, html_to_text
+
+
+def check(name, condition):
+    """Print a friendly PASS/FAIL line and remember the result."""
+    print(("✅ PASS" if condition else "❌ FAIL"), "-", name)
+    return condition
+
+
+PAGE = """<html><head><base href="//en.wikipedia.org/wiki/"><title>Eiffel Tower</title>
+<style>.x{color:red}</style><script>alert(1)</script></head><body>
+<h1>Eiffel Tower</h1>
+<div class="hatnote">For other uses, see <a href="./Eiffel_Tower_(disambiguation)">Eiffel Tower (disambiguation)</a>.</div>
+<p>The <b>Eiffel Tower</b> is a tower in <a href="./Paris" title="Paris">Paris</a>.<sup class="mw-ref reference"><a href="#cite_note-1">[1]</a></sup>
+It is <a href="./Metre">330&nbsp;m</a> tall.</p>
+<table class="infobox"><tr><th>Height</th><td>330 m</td></tr><tr><th>Architect</th><td><a href="./Stephen_Sauvestre">Stephen Sauvestre</a></td></tr></table>
+<h2>History</h2><ul><li>Built 1887&ndash;1889</li><li>Opened for the <a href="./Exposition_Universelle_(1889)#Tower">World's Fair</a></li></ul>
+<img src="tower.jpg"><br>
+<h2>References</h2><ol class="references"><li>Some book, <a href="https://example.com/book">p. 3</a></li></ol>
+<h2>External links</h2><ul><li><a href="https://www.toureiffel.paris/">Official site</a></li></ul>
+</body></html>"""
+
+results = []
+text = html_to_text(PAGE)
+print("\nSmall page")
+print("   " + text.replace("\n", "\n   "))
+results.append(check("scripts, styles, hatnotes and [1] markers are gone",
+                     not any(junk in text for junk in ("alert", "color:red", "other uses", "[1]"))))
+results.append(check("headings and list items keep their structure",
+                     "# Eiffel Tower" in text and "## History" in text and "- Built 1887–1889" in text))
+results.append(check("table rows keep their cells", "Height | 330 m" in text))
+results.append(check("entities are decoded and whitespace collapsed", "It is 330 m tall." in text))
+results.append(check("References and External links sections are dropped",
+                     "Some book" not in text and "Official site" not in text and "## References" not in text))
+results.append(check("links are listed once, as full URLs without #fragments",
+                     "- Paris: https://en.wikipedia.org/wiki/Paris" in text
+                     and "- World's Fair: https://en.wikipedia.org/wiki/Exposition_Universelle_(1889)" in text
+                     and "cite_note" not in text and "toureiffel" not in text))
+results.append(check("feeding the page in small chunks gives the same text",
+                     html_to_text(PAGE[i:i + 7] for i in range(0, len(PAGE), 7)) == text))
+
+print("\nWikipedia example page")
+with open(EXAMPLE_PAGES[0], encoding="utf-8") as f:
+    html = f.read()
+full = html_to_text(html, max_tokens=10 ** 6, max_links=0)
+short = html_to_text(html, max_tokens=500, max_links=0)
+results.append(check("keeps the lead, infobox facts and sections",
+                     full.startswith("# President of France") and "Salary | €182,000 per annum" in full
+                     and "## Powers" in full))
+results.append(check("drops the reference list and edit links",
+                     "Retrieved" not in full and "action=edit" not in full and "## References" not in full))
+results.append(check(f"a 500-token budget stops at a line break ({len(short):,} characters)",
+                     len(short) <= 500 * CHARS_PER_TOKEN and short.endswith("[... truncated ...]")
+                     and full.startswith(short[:-len("\n[... truncated ...]")])))
+
+name, size_in, size_out, ms = benchmark(repeats=5)[0]
+results.append(check(f"{name}: {size_in:,} bytes -> {size_out:,} bytes in {ms:.1f} ms",
+                     size_out < size_in / 4))
+
+print(f"\n{sum(results)} / {len(results)} checks passed.\n")
@@ -0,0 +1,159 @@
+"""
+Self-check for the HTTP response cache 🗄️
+========================================
+
+Starts a small stand-in "Wikipedia" on localhost (ETag + Last-Modified, answers
+304 to conditional requests) and checks that HTTPCache serves fresh entries
+without a request, revalidates stale ones, picks up changed articles, evicts
+by size and survives a restart. No network or API key needed.
+
+HOW TO RUN (from the project's ROOT folder):
+
+    python shared/utils/test_http_cache.py
+
+You should see a row of ✅ PASS lines.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import http_cache
+from http_cache import HTTPCache, fetch_wikipedia, normalize_title
+
+
+def check(name, condition):
+    """Print a friendly PASS/FAIL line and remember the result."""
+    print(("✅ PASS" if condition else "❌ FAIL"), "-", name)
+    return condition
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serves ARTICLES[title]; ETag is the version, Last-Modified only for titles in NO_ETAG"""
+
+    ARTICLES = {}
+    NO_ETAG = set()
+    requests = []  # (title, If-None-Match, If-Modified-Since)
+
+    def do_GET(self):
+        title = unquote(self.path.rsplit("/", 1)[-1])
+        StandIn.requests.append((title, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")))
+        if title not in self.ARTICLES:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        version, body = self.ARTICLES[title]
+        etag = f'"v{version}"'
+        modified = formatdate(1_700_000_000 + version, usegmt=True)
+        if title in self.NO_ETAG:
+            unchanged = self.headers.get("If-Modified-Since") == modified
+        else:
+            unchanged = self.headers.get("If-None-Match") == etag
+        self.send_response(304 if unchanged else 200)
+        if title not in self.NO_ETAG:
+            self.send_header("ETag", etag)
+        self.send_header("Last-Modified", modified)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        data = b"" if unchanged else body.encode("utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base = f"http://127.0.0.1:{server.server_address[1]}/page/"
+http_cache.WIKIPEDIA_URL = base + "{title}"
+
+results = []
+folder = tempfile.mkdtemp()
+path = os.path.join(folder, "cache.sqlite3")
+
+print("\nTitles")
+results.append(check("normalize_title joins words with _ and capitalizes the first letter",
+                     normalize_title("  eiffel   tower ") == "Eiffel_tower" == normalize_title("Eiffel_tower")))
+results.append(check("normalize_title keeps the case of later letters",
+                     normalize_title("iPhone SE") == "IPhone_SE"))
+
+print("\nFresh entries")
+StandIn.ARTICLES["Eiffel_tower"] = (1, "<p>330 m tall</p>")
+cache = HTTPCache(path, ttl=3600)
+first = fetch_wikipedia("eiffel tower", cache)
+second = fetch_wikipedia("Eiffel_tower", cache)
+results.append(check("first fetch downloads the article", first.from_cache is None and first.text == "<p>330 m tall</p>"))
+results.append(check("same title, different spelling: served from the cache with no request",
+                     second.from_cache == "hit" and second.text == first.text and len(StandIn.requests) == 1))
+results.append(check("headers are kept", second.headers.get("content-type", "").startswith("text/html")))
+
+print("\nRevalidation")
+StandIn.requests.clear()
+stale = HTTPCache(path, ttl=0)
+again = fetch_wikipedia("Eiffel tower", stale)
+results.append(check("stale entry is revalidated with If-None-Match and reused on 304",
+                     again.from_cache == "revalidated" and again.text == "<p>330 m tall</p>"
+                     and StandIn.requests == [("Eiffel_tower", '"v1"', StandIn.requests[0][2])]))
+StandIn.ARTICLES["Eiffel_tower"] = (2, "<p>330 m tall (with antennas)</p>")
+changed = fetch_wikipedia("Eiffel tower", stale)
+results.append(check("changed article is downloaded again and replaces the old copy",
+                     changed.from_cache is None and "antennas" in changed.text
+                     and "antennas" in fetch_wikipedia("Eiffel tower", HTTPCache(path)).text))
+
+StandIn.ARTICLES["Paris"] = (1, "<p>capital of France</p>")
+StandIn.NO_ETAG.add("Paris")
+fetch_wikipedia("Paris", stale)
+StandIn.requests.clear()
+paris = fetch_wikipedia("Paris", stale)
+results.append(check("without an ETag, If-Modified-Since is used",
+                     paris.from_cache == "revalidated" and StandIn.requests[0][1] is None
+                     and StandIn.requests[0][2] is not None))
+
+print("\nMisses and errors")
+missing = fetch_wikipedia("No such article", cache)
+results.append(check("404 is returned and not cached",
+                     missing.status_code == 404 and fetch_wikipedia("No such article", cache).from_cache is None))
+del StandIn.ARTICLES["Paris"]
+gone = fetch_wikipedia("Paris", stale)
+results.append(check("an article that disappeared is dropped from the cache",
+                     gone.status_code == 404 and fetch_wikipedia("Paris", cache).status_code == 404))
+
+print("\nEviction and restart")
+small = HTTPCache(os.path.join(folder, "small.sqlite3"), max_bytes=2500)
+for i in range(5):
+    StandIn.ARTICLES[f"Page_{i}"] = (1, "x" * 1000)
+fetch_wikipedia("Page 0", small)
+fetch_wikipedia("Page 1", small)
+time.sleep(0.01)
+fetch_wikipedia("Page 0", small)      # Page 0 is now the most recently used
+fetch_wikipedia("Page 2", small)
+kept = {title for title in ("Page_0", "Page_1", "Page_2")
+        if small._db.execute("SELECT 1 FROM http_cache WHERE key = ?", (f"wikipedia:{title}",)).fetchone()}
+results.append(check("over max_bytes, the least recently used entry is evicted",
+                     kept == {"Page_0", "Page_2"} and small.stats()["evicted"] == 1
+                     and small.stats()["bytes"] <= 2500))
+small.close()
+reopened = HTTPCache(os.path.join(folder, "small.sqlite3"))
+results.append(check("entries survive a restart", fetch_wikipedia("Page 2", reopened).from_cache == "hit"))
+
+print("\nThreads and stats")
+threads = [threading.Thread(target=lambda i=i: [fetch_wikipedia(f"Page {i % 5}", cache) for _ in range(20)])
+           for i in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+stats = cache.stats()
+results.append(check("parallel lookups (as in the agents' parallel tool calls) all complete",
+                     stats["hits"] + stats["revalidated"] + stats["misses"] >= 160))
+results.append(check("stats report a hit rate", 0 < stats["hit_rate"] <= 1))
+print("   ", stats)
+
+server.shutdown()
+print(f"\n{sum(results)} / {len(results)} checks passed.\n")
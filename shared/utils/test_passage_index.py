@@ -0,0 +1,107 @@
+"""
+Self-check for the passage retrieval index 🔎
+============================================
+
+Indexes the saved Wikipedia example page
+(week2-image-audio/class07-audio-mcp/examples/france.html) and checks that
+BM25 puts the passage that answers a question at the top, that the index
+survives a restart when it lives in a file, and that search_article only
+fetches an article it hasn't indexed yet. No network or API key needed.
+
+HOW TO RUN (from the project's ROOT folder):
+
+    python shared/utils/test_passage_index.py
+
+You should see a row of ✅ PASS lines.
+"""
+
+import os
+import tempfile
+
+from html_text import EXAMPLE_PAGES, html_to_text
+from passage_index import ARTICLE_TOKENS, PASSAGE_CHARS, PassageIndex, search_article, split_passages, tokenize
+
+
+def check(name, condition):
+    """Print a friendly PASS/FAIL line and remember the result."""
+    print(("✅ PASS" if condition else "❌ FAIL"), "-", name)
+    return condition
+
+
+with open(EXAMPLE_PAGES[0], encoding="utf-8") as f:
+    html = f.read()
+text = html_to_text(html, max_tokens=ARTICLE_TOKENS)
+URL = "https://en.wikipedia.org/api/rest_v1/page/mobile-html/President_of_France"
+
+
+class Page:
+    """What fetch_wikipedia hands back, for the example page"""
+    status_code, text, url = 200, html, URL
+
+
+class Missing:
+    status_code, text, url = 404, "", URL
+
+
+results = []
+print("\nSplitting and tokenizing")
+passages = split_passages(text)
+results.append(check(f"the article becomes {len(passages)} passages of at most ~{PASSAGE_CHARS} characters",
+                     len(passages) > 20 and all(len(passage) <= 2 * PASSAGE_CHARS for _, passage in passages)))
+results.append(check("each passage knows its section and the link list is left out",
+                     any(heading == "Succession and incapacity" for heading, _ in passages)
+                     and not any("https://" in passage for _, passage in passages)))
+results.append(check("tokens are lowercase, accent-free and without stopwords",
+                     tokenize("The Élysée Palace is in Paris") == ["elysee", "palace", "paris"]))
+
+print("\nSearching")
+index = PassageIndex(":memory:")
+index.add_article("President_of_France", text, url=URL)
+top = index.search("salary paid to the president", k=3)
+results.append(check(f"the pay question finds the pay section first ({top[0].heading!r})",
+                     top[0].heading == "Pay and official residences" and "pay grade" in top[0].text))
+top = index.search("who takes over if the president dies", k=3)
+results.append(check(f"the succession question finds the succession rules ({top[0].heading!r})",
+                     top[0].heading == "Succession and incapacity" and "Senate" in top[0].text))
+results.append(check("a question with no matching words falls back to the article's lead",
+                     index.search("zzyzx", k=2, titles=["President_of_France"])[0].heading == "President of France"))
+count = index.add_article("President_of_France", text, url=URL)
+results.append(check("adding an article again replaces it instead of duplicating it",
+                     index.stats()["passages"] == count))
+
+print("\nsearch_article")
+fetches = []
+
+
+def fetch(query):
+    fetches.append(query)
+    return Missing if query == "Nowhere" else Page
+
+
+index = PassageIndex(":memory:")
+first = search_article("President of France", "How much is the president paid?", index=index, fetch=fetch)
+again = search_article("president_of  France", "Where does the president live?", index=index, fetch=fetch)
+results.append(check("the first search fetches the article, the second (same article) does not",
+                     fetches == ["President of France"] and first.fetched and not again.fetched))
+prompt = first.prompt_text()
+results.append(check(f"the extractor reads {len(prompt):,} characters instead of {len(text):,}",
+                     len(prompt) < len(text) / 3 and "pay grade" in prompt and URL in prompt))
+results.append(check("only links that appear in the chosen passages are passed on",
+                     0 < len(first.links) < text.count("\n- ") and all(label in prompt for label, _ in first.links)))
+results.append(check("a missing article gives None", search_article("Nowhere", index=index, fetch=fetch) is None))
+expired = search_article("President of France", "pay", max_age=0, index=index, fetch=fetch)
+results.append(check("an article older than max_age is fetched again", expired.fetched and len(fetches) == 3))
+
+print("\nOn disk")
+with tempfile.TemporaryDirectory() as folder:
+    path = os.path.join(folder, "passages.sqlite3")
+    index = PassageIndex(path)
+    index.add_article("President_of_France", text, url=URL)
+    index.close()
+    reopened = PassageIndex(path)
+    results.append(check("a reopened index still has the article and its postings",
+                         reopened.article("President_of_France") is not None
+                         and reopened.search("salary", k=1)[0].heading == "Pay and official residences"))
+    reopened.close()
+
+print(f"\n{sum(results)} / {len(results)} checks passed.\n")
@@ -0,0 +1,131 @@
+"""
+Self-check for the shared Wordle feedback engine 🟩🟨⬜
+======================================================
+
+Checks hand-picked duplicate-letter cases, then compares the engine against a
+simple reference implementation on thousands of random word pairs (a property
+test), and finishes with a quick micro-benchmark. No API key needed.
+
+HOW TO RUN (from the project's ROOT folder):
+
+    python shared/utils/test_wordle_feedback.py
+
+You should see a row of ✅ PASS lines.
+"""
+
+import random
+from collections import Counter
+
+from word_index import load_word_index
+from wordle_feedback import (
+    ALL_GREEN, FeedbackTable, benchmark, decode_pattern, encode_pattern, feedback_emoji, score,
+)
+
+
+def check(name, condition):
+    """Print a friendly PASS/FAIL line and remember the result."""
+    print(("✅ PASS" if condition else "❌ FAIL"), "-", name)
+    return condition
+
+
+def reference_feedback(guess, answer):
+    """Textbook two-pass Wordle scoring, written for clarity rather than speed."""
+    result = ["⬜"] * 5
+    remaining = Counter()
+    for i in range(5):
+        if guess[i] == answer[i]:
+            result[i] = "🟩"
+        else:
+            remaining[answer[i]] += 1
+    for i in range(5):
+        if result[i] != "🟩" and remaining[guess[i]] > 0:
+            result[i] = "🟨"
+            remaining[guess[i]] -= 1
+    return tuple(result)
+
+
+print("\nChecking the Wordle feedback engine...\n")
+
+results = []
+
+# 1) Hand-picked cases, including the repeated-letter ones the old loop got wrong.
+cases = [
+    ("crane", "crane", "🟩🟩🟩🟩🟩"),
+    ("train", "crane", "⬜🟩🟩⬜🟨"),
+    ("speed", "abide", "⬜⬜🟨⬜🟨"),   # only ONE E is yellow: ABIDE has one E
+    ("geese", "those", "⬜⬜⬜🟩🟩"),   # the green E uses up the only spare E
+    ("eerie", "sleep", "🟨🟨⬜⬜⬜"),
+    ("allee", "eagle", "🟨🟨⬜🟨🟩"),
+    ("zzzzz", "crane", "⬜⬜⬜⬜⬜"),
+]
+for guess, answer, expected in cases:
+    got = "".join(feedback_emoji(guess, answer))
+    results.append(check(f"{guess.upper()} vs {answer.upper()} -> {expected}", got == expected))
+
+# 2) Case and whitespace don't matter.
+results.append(check("Upper-case / padded input is normalized",
+                     feedback_emoji(" CRANE ", "crane") == feedback_emoji("crane", "CRANE")))
+
+# 3) Property test: matches the reference on random pairs from the real word list.
+index = load_word_index()
+words = index.words
+rng = random.Random(2024)
+table = FeedbackTable(words)
+pairs = [(rng.choice(words), rng.choice(words)) for _ in range(20000)]
+# Add reversed-word pairs: lots of shared letters, where duplicates matter.
+pairs += [(w, w[::-1]) for w in rng.sample(words, 500)]
+mismatches = [(g, a) for g, a in pairs
+              if tuple(feedback_emoji(g, a, table)) != reference_feedback(g, a)]
+results.append(check(f"Matches the reference on {len(pairs):,} random pairs",
+                     not mismatches))
+
+# 4) Invariants that must hold for every pair.
+def invariants_hold(guess, answer):
+    states = decode_pattern(score(guess, answer))
+    greens = sum(1 for i in range(5) if guess[i] == answer[i])
+    if states.count(2) != greens:
+        return False
+    for letter in set(guess):
+        marked = sum(1 for i in range(5) if guess[i] == letter and states[i] > 0)
+        if marked != min(guess.count(letter), answer.count(letter)):
+            return False
+    return True
+
+results.append(check("Greens = exact matches; colored copies = min(count in guess, count in answer)",
+                     all(invariants_hold(g, a) for g, a in pairs[:5000])))
+results.append(check("A word scored against itself is ALL_GREEN",
+                     all(score(w, w) == ALL_GREEN for w in words)))
+results.append(check("encode_pattern undoes decode_pattern",
+                     all(encode_pattern(decode_pattern(c)) == c for c in range(243))))
+
+# 5) The NumPy matrix (if NumPy is installed) agrees with the scalar engine.
+try:
+    from feedback_matrix import INVALID, FeedbackMatrix, score_word_pairs
+except ImportError:
+    print("   (NumPy not installed — skipping the matrix comparison)")
+else:
+    fm = FeedbackMatrix(words[:400])
+    agree = all(fm.lookup(g, a) == table.score(g, a) for g in fm.guess_words[::7] for a in fm.answer_words)
+    results.append(check("FeedbackMatrix agrees with the scalar engine", agree))
+
+    guesses = [rng.choice(words) for _ in range(5000)]
+    answers = [rng.choice(words).upper() for _ in range(5000)]
+    codes = score_word_pairs(guesses, answers, index)
+    results.append(check("score_word_pairs agrees with the scalar engine on 5,000 pairs",
+                         all(code == table.score(g, a.lower()) for code, g, a in zip(codes, guesses, answers))))
+    codes = score_word_pairs(["zzzzz", "cran", " Crane ", "cr4ne"], ["slate"] * 4, index)
+    results.append(check("score_word_pairs marks non-words as INVALID",
+                         list(codes) == [INVALID, INVALID, table.score("crane", "slate"), INVALID]))
+
+    from wordle_solver import EntropySolver
+    solver = EntropySolver(fm)
+    games = [solver.play(answer, verify=True) for answer in fm.answer_words]
+    results.append(check("Entropy solver finds every answer within 6 guesses",
+                         all(g[-1] == a and len(g) <= 6 for g, a in zip(games, fm.answer_words))))
+
+print(f"\n{sum(results)} / {len(results)} checks passed.\n")
+
+print("Micro-benchmark (lower is faster):")
+for name, ns in benchmark(words, pairs=20000).items():
+    print(f"   {name:>12}: {ns:8.1f} ns/pair")
+print()
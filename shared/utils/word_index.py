@@ -0,0 +1,173 @@
+"""
+Shared Wordle word index.
+
+Loads a word list (one 5-letter word per line, like wordle.txt) exactly once and
+keeps it in three shapes:
+
+- ``words``  — the words in file order (handy for random.choice)
+- a frozenset — O(1) ``word in index`` membership checks
+- ``packed`` — every word squeezed into a 25-bit integer (5 bits per letter),
+  stored in a sorted ``array('I')``; ~4 bytes per word instead of a full str
+
+Usage:
+    from word_index import load_word_index
+
+    index = load_word_index()          # defaults to the class05 wordle.txt
+    "crane" in index                   # True
+    index.random_word()                # "SLATE"
+
+Run ``python shared/utils/word_index.py`` to benchmark it against the old
+list scan.
+"""
+
+import os
+import random
+import time
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+
+WORD_LENGTH = 5
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DEFAULT_WORD_FILE = os.path.join(
+    REPO_ROOT, "week1-foundations-text", "class05-function-calling-agents", "wordle.txt"
+)
+
+
+def pack_word(word):
+    """
+    Pack a 5-letter word into a single integer (5 bits per letter).
+
+    Args:
+        word (str): A 5-letter word, any case
+
+    Returns:
+        int: The packed value, or -1 if the word is not 5 letters a-z
+    """
+    if len(word) != WORD_LENGTH:
+        return -1
+    packed = 0
+    for letter in word.lower():
+        code = ord(letter) - 97
+        if code < 0 or code > 25:
+            return -1
+        packed = (packed << 5) | code
+    return packed
+
+
+def unpack_word(packed):
+    """Turn a packed integer back into its lowercase word."""
+    letters = []
+    for _ in range(WORD_LENGTH):
+        letters.append(chr((packed & 31) + 97))
+        packed >>= 5
+    return "".join(reversed(letters))
+
+
+class WordIndex:
+    """An immutable, loaded-once view of a Wordle word list."""
+
+    def __init__(self, words):
+        """
+        Args:
+            words (iterable[str]): 5-letter words; blanks and wrong lengths are skipped
+        """
+        cleaned = []
+        seen = set()
+        for word in words:
+            word = word.strip().lower()
+            if pack_word(word) < 0 or word in seen:
+                continue
+            seen.add(word)
+            cleaned.append(word)
+
+        self.words = tuple(cleaned)
+        self._word_set = frozenset(cleaned)
+        self.packed = array("I", sorted(pack_word(word) for word in cleaned))
+
+    def __contains__(self, word):
+        return isinstance(word, str) and word.strip().lower() in self._word_set
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def contains_packed(self, word):
+        """Membership check using only the packed array (binary search)."""
+        packed = pack_word(word.strip())
+        if packed < 0:
+            return False
+        position = bisect_left(self.packed, packed)
+        return position < len(self.packed) and self.packed[position] == packed
+
+    def random_word(self, rng=random):
+        """Return one random word from the list, upper-cased like the games expect."""
+        return rng.choice(self.words).upper()
+
+
+@lru_cache(maxsize=None)
+def _load(path):
+    with open(path, "r") as file:
+        return WordIndex(file)
+
+
+def load_word_index(path=DEFAULT_WORD_FILE):
+    """
+    Load (once) and return the WordIndex for a word file.
+
+    Repeated calls with the same file return the same cached object, so it is
+    cheap to call this from inside a request handler or a game loop.
+
+    Args:
+        path (str): Path to a word list, one word per line
+
+    Returns:
+        WordIndex: The shared index for that file
+    """
+    return _load(os.path.abspath(path))
+
+
+def benchmark(index=None, lookups=20000, seed=0):
+    """
+    Time membership checks: the old list scan vs. the set vs. the packed array.
+
+    Half the probes are real words and half are misses, so the list scan pays
+    for its worst case too.
+
+    Args:
+        index (WordIndex, optional): Index to test (defaults to the class05 list)
+        lookups (int): How many membership checks to time per strategy
+        seed (int): Seed for picking the probe words
+
+    Returns:
+        dict: Nanoseconds per lookup for "list_scan", "frozenset" and "packed_bisect"
+    """
+    index = index or load_word_index()
+    rng = random.Random(seed)
+    probes = [rng.choice(index.words) for _ in range(lookups // 2)]
+    probes += ["".join(rng.choice("qxzjv") for _ in range(WORD_LENGTH)) for _ in range(lookups // 2)]
+    as_list = list(index.words)
+
+    strategies = {
+        "list_scan": lambda word: word in as_list,
+        "frozenset": lambda word: word in index,
+        "packed_bisect": index.contains_packed,
+    }
+    results = {}
+    for name, check in strategies.items():
+        start = time.perf_counter_ns()
+        for word in probes:
+            check(word)
+        results[name] = (time.perf_counter_ns() - start) / len(probes)
+    return results
+
+
+if __name__ == "__main__":
+    index = load_word_index()
+    print(f"Loaded {len(index)} words from {DEFAULT_WORD_FILE}")
+    print(f"Packed size: {index.packed.itemsize * len(index.packed)} bytes")
+    for name, ns in benchmark(index).items():
+        print(f"{name:>14}: {ns:8.1f} ns/lookup")
@@ -0,0 +1,224 @@
+"""
+Entropy-based Wordle solver + whole-list benchmark.
+
+The solver plays like the hint engine in the web app: it keeps the answers that
+are still consistent with the feedback so far, and guesses the word whose
+feedback would split them most evenly (highest expected information, in bits).
+Everything is looked up in a cached feedback matrix (see feedback_matrix.py),
+scored with the same duplicate-letter rules as every ``validate_word``.
+
+Because the solver is deterministic, the state of a game is just the sequence
+of patterns seen so far; each process remembers the guess it picked for every
+state, so the thousands of games share most of their work.
+
+``solve_all`` plays every answer in the word list, spread across a process
+pool, and reports the average number of guesses and the time per game. Use it
+as a regression benchmark for the scoring path and as a baseline for the
+LLM-driven agents.
+
+HOW TO RUN (from the project's ROOT folder):
+
+    python shared/utils/wordle_solver.py                  # every word, all CPUs
+    python shared/utils/wordle_solver.py --workers 1 --limit 200 --verify
+    python shared/utils/wordle_solver.py --json solver_report.json
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from feedback_matrix import DEFAULT_CACHE_DIR, FeedbackMatrix, pattern_entropies
+from word_index import DEFAULT_WORD_FILE, load_word_index
+from wordle_feedback import ALL_GREEN, score
+
+MAX_GUESSES = 6      # classic Wordle gives you 6 tries
+GIVE_UP_AFTER = 20   # keep playing past 6 (counted as a loss) so averages stay finite
+
+
+class EntropySolver:
+    """Plays Wordle games against a FeedbackMatrix."""
+
+    def __init__(self, fm, opener=None):
+        """
+        Args:
+            fm (FeedbackMatrix): Guess words x answer words feedback table
+            opener (str, optional): Fixed first guess (default: the best one)
+        """
+        self.fm = fm
+        self.all_columns = np.arange(len(fm.answer_words))
+        self._is_answer = np.array([word in fm.answer_columns for word in fm.guess_words])
+        # Pattern history (tuple of codes) -> guess row chosen for that state
+        self._choices = {}
+        if opener is not None:
+            self._choices[()] = fm.guess_rows[opener.strip().lower()]
+
+    def choose(self, columns):
+        """
+        Pick the guess row for a set of remaining answer columns.
+
+        Returns:
+            int: Row of the guess with the highest expected information; near
+            ties go to words that could still be the answer
+        """
+        if len(columns) <= 2:
+            # Guessing a candidate wins now or leaves exactly one word
+            row = self.fm.guess_rows.get(self.fm.answer_words[columns[0]])
+            if row is not None:
+                return row
+        return self._best_row(columns)
+
+    def _best_row(self, columns):
+        entropies = pattern_entropies(self.fm.matrix, columns)
+        bonus = np.zeros(len(entropies))
+        candidate_rows = [self.fm.guess_rows[self.fm.answer_words[c]]
+                          for c in columns if self.fm.answer_words[c] in self.fm.guess_rows]
+        bonus[candidate_rows] = 1e-6
+        return int(np.argmax(entropies + bonus))
+
+    def play(self, answer, verify=False):
+        """
+        Play one game.
+
+        Args:
+            answer (str): The secret word (must be one of the answer words)
+            verify (bool): Also re-score every guess with wordle_feedback.score
+                and raise if the matrix disagrees
+
+        Returns:
+            list[str]: The guesses made, ending with the answer (unless it gave up)
+        """
+        column = self.fm.answer_columns[answer.strip().lower()]
+        columns = self.all_columns
+        history = ()
+        guesses = []
+        while len(guesses) < GIVE_UP_AFTER:
+            row = self._choices.get(history)
+            if row is None:
+                row = self._choices[history] = self.choose(columns)
+            guess = self.fm.guess_words[row]
+            guesses.append(guess)
+            code = int(self.fm.matrix[row, column])
+            if verify and code != score(guess, self.fm.answer_words[column]):
+                raise AssertionError(f"Matrix and scorer disagree on {guess} vs {answer}")
+            if code == ALL_GREEN:
+                break
+            columns = columns[self.fm.matrix[row, columns] == code]
+            history += (code,)
+        return guesses
+
+
+# ---------------------------------------------------------------------------
+# Process-pool benchmark
+# ---------------------------------------------------------------------------
+
+_worker_solver = None
+
+
+def _init_worker(words, cache_dir, opener):
+    """Load the cached matrix (memory-mapped, so workers share it) once per process."""
+    global _worker_solver
+    _worker_solver = EntropySolver(FeedbackMatrix.cached(words, cache_dir=cache_dir), opener)
+
+
+def _play_chunk(answers, verify):
+    results = []
+    for answer in answers:
+        start = time.perf_counter()
+        guesses = _worker_solver.play(answer, verify=verify)
+        results.append((answer, len(guesses), guesses[-1] == answer, time.perf_counter() - start))
+    return results
+
+
+def solve_all(words=None, answers=None, workers=None, chunk_size=64, opener=None,
+              verify=False, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Play every answer and summarize how the solver did.
+
+    Args:
+        words (sequence[str], optional): Guess/answer list (default: class05 wordle.txt)
+        answers (sequence[str], optional): Subset of words to play (default: all)
+        workers (int, optional): Worker processes (default: CPU count; 1 = no pool)
+        chunk_size (int): Answers sent to a worker at a time
+        opener (str, optional): Fixed first guess (default: the highest-entropy word)
+        verify (bool): Cross-check every feedback against wordle_feedback.score
+        cache_dir (str): Where the feedback matrix .npy is cached
+
+    Returns:
+        dict: games, mean_guesses, distribution, losses, timings (JSON-friendly)
+    """
+    words = tuple(words or load_word_index().words)
+    answers = list(answers or words)
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    # Builds (or loads) the cache before any worker starts, so they all just load it
+    fm = FeedbackMatrix.cached(words, cache_dir=cache_dir)
+    if opener is None:
+        opener = fm.guess_words[EntropySolver(fm).choose(np.arange(len(fm.answer_words)))]
+    setup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunks = [answers[i:i + chunk_size] for i in range(0, len(answers), chunk_size)]
+    if workers == 1:
+        _init_worker(words, cache_dir, opener)
+        results = [row for chunk in chunks for row in _play_chunk(chunk, verify)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(words, cache_dir, opener)) as pool:
+            results = [row for rows in pool.map(_play_chunk, chunks, [verify] * len(chunks)) for row in rows]
+    wall_seconds = time.perf_counter() - start
+
+    counts = [n for _, n, _, _ in results]
+    game_seconds = [t for _, _, _, t in results]
+    losses = sorted(answer for answer, n, solved, _ in results if not solved or n > MAX_GUESSES)
+    return {
+        "games": len(results),
+        "opener": opener,
+        "mean_guesses": round(float(np.mean(counts)), 4),
+        "max_guesses": max(counts),
+        "distribution": {str(n): c for n, c in sorted(Counter(counts).items())},
+        "losses": losses,
+        "workers": workers,
+        "setup_seconds": round(setup_seconds, 3),
+        "wall_seconds": round(wall_seconds, 3),
+        "wall_ms_per_game": round(1000 * wall_seconds / len(results), 3),
+        "cpu_ms_per_game": round(1000 * float(np.mean(game_seconds)), 3),
+        "verified": verify,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play every Wordle answer with the entropy solver.")
+    parser.add_argument("--words", default=DEFAULT_WORD_FILE, help="Word list file")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--limit", type=int, default=None, help="Only play the first N answers")
+    parser.add_argument("--opener", default=None, help="Force the first guess")
+    parser.add_argument("--verify", action="store_true", help="Cross-check the matrix with wordle_feedback.score")
+    parser.add_argument("--json", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    words = load_word_index(args.words).words
+    report = solve_all(words, answers=words[:args.limit] if args.limit else None,
+                       workers=args.workers, opener=args.opener, verify=args.verify)
+
+    print(f"Played {report['games']:,} games with {report['workers']} worker(s), opening with "
+          f"{report['opener'].upper()}")
+    print(f"   average guesses: {report['mean_guesses']:.3f}  (max {report['max_guesses']}, "
+          f"{len(report['losses'])} over {MAX_GUESSES})")
+    print("   distribution:    " + "  ".join(f"{n}: {c}" for n, c in report["distribution"].items()))
+    print(f"   matrix setup:    {report['setup_seconds']:.2f}s")
+    print(f"   time per game:   {report['wall_ms_per_game']:.2f} ms wall, "
+          f"{report['cpu_ms_per_game']:.2f} ms in a worker")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"   report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -230,30 +230,28 @@ def chat_with_gemini_function_calling(max_user_turns:int = 5, model:str="gemini-
 # chat_with_gemini_function_calling(max_user_turns=3, model="gemini-3.5-flash")
 
 import random
+import sys
+# The shared word index loads the file once and keeps it in memory, so picking a
+# new word (or checking if a guess is a real word) never re-reads the file.
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+from word_index import load_word_index
+from wordle_feedback import feedback_emoji
+
 def get_word_of_the_day(filename):
-    # Reservoir sampling to pick a random line without loading the whole file
-    result = None
-    with open(filename, "r") as file:
-        for i, line in enumerate(file, 1):
-            if random.randrange(i) == 0:
-                result = line.strip()
-    return result
-
-def validate_word(guess:str, correct_word:str) -> str:
+    return random.choice(load_word_index(filename).words)
+
+def validate_word(guess:str, correct_word:str, filename:str="wordle.txt") -> str:
     if not guess or len(guess.strip()) != 5:
         return "Invalid Input, ask user to try again, tell them the word must be exactly 5 letters long"
 
+    if guess not in load_word_index(filename):
+        return "Invalid Input, ask user to try again, the word is not in the dictionary"
+
     if guess.strip().lower() == correct_word.strip().lower():
         return f"User correctly guessed the word {correct_word}"
     else:
-        result = []
-        for i in range(5):
-            if guess[i].lower() == correct_word[i].lower():
-                result.append("🟩")
-            elif guess[i].lower() in correct_word.lower():
-                result.append("🟨")
-            else:
-                result.append("⬜")
+        # Two-pass scoring, so repeated letters are only yellow as often as they appear in the answer
+        result = feedback_emoji(guess, correct_word)
     return f'This is the next hint(based on the correct position of the letters): {" | ".join(result)}'
     
 
@@ -400,7 +398,7 @@ def chat_with_gemini_function_calling_with_rag(max_user_turns:int = 5, filename:
                     elif tool_call.function.name == "validate_word":
                         print("CALLING validate_word")
                         if user_input is not None:
-                            res = validate_word(user_input, word_of_the_day)
+                            res = validate_word(user_input, word_of_the_day, filename)
                             messages.append({
                                 "role": "tool",
                                 "tool_call_id": tool_call.id,
@@ -40,12 +40,21 @@ YOUR STEP-BY-STEP CHECKLIST  (search the file for "TODO")
 # --- Libraries we use -------------------------------------------------------
 import os
 import json
-import requests                    # lets us call Wikipedia over the internet
+import sys
 from dotenv import load_dotenv     # reads your GEMINI_API_KEY from the .env file
 from openai import OpenAI          # we talk to Gemini through its OpenAI-compatible endpoint
 
+# Course helpers live in shared/utils (in the project's ROOT folder)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+from http_client import get_session  # lets us call Wikipedia over the internet
+
 load_dotenv()
 
+# One reusable web connection for all our tool calls. Like requests.get, but it
+# keeps the connection open between calls (faster!), gives up after a timeout
+# and tries again if the server hiccups.
+http = get_session()
+
 MODEL = "gemini-3.5-flash"
 
 
@@ -70,7 +79,7 @@ def search_wikipedia(query):
     headers = {"User-Agent": "GSET-Vibe-Coding-Course/1.0 (classroom project)"}
 
     # 1) Find the best-matching article title for the search.
-    search = requests.get(api, headers=headers, params={
+    search = http.get(api, headers=headers, params={
         "action": "query", "list": "search", "srsearch": query,
         "format": "json", "srlimit": 1,
     }).json()
@@ -81,7 +90,7 @@ def search_wikipedia(query):
     title = hits[0]["title"]
 
     # 2) Get a clean, plain-text summary (the article's intro).
-    summary = requests.get(api, headers=headers, params={
+    summary = http.get(api, headers=headers, params={
         "action": "query", "prop": "extracts", "exintro": True,
         "explaintext": True, "titles": title, "redirects": 1, "format": "json",
     }).json()
@@ -48,12 +48,17 @@ out = validate_word("ZZZZZ", "CRANE")
 results.append(check("Letters not in word -> all gray",
                      "⬜ ⬜ ⬜ ⬜ ⬜" in out))
 
-# 4) A guess that isn't 5 letters should be rejected.
+# 4) Repeated letters: ABIDE has only ONE E, so only one E in SPEED can be yellow.
+out = validate_word("SPEED", "ABIDE")
+results.append(check("Repeated letters -> ⬜ ⬜ 🟨 ⬜ 🟨",
+                     "⬜ ⬜ 🟨 ⬜ 🟨" in out))
+
+# 5) A guess that isn't 5 letters should be rejected.
 out = validate_word("CAT", "CRANE")
 results.append(check("Too-short guess -> asks to try again",
                      "not 5 letters" in out))
 
-# 5) get_secret_word() should return a real 5-letter word.
+# 6) get_secret_word() should return a real 5-letter word.
 word = get_secret_word()
 results.append(check("get_secret_word() returns a 5-letter word",
                      isinstance(word, str) and len(word) == 5))
@@ -39,12 +39,21 @@ YOUR STEP-BY-STEP CHECKLIST  (search the file for "TODO")
 # --- Libraries we use -------------------------------------------------------
 import os
 import json
-import requests                    # lets us call the free weather API over the internet
+import sys
 from dotenv import load_dotenv     # reads your GEMINI_API_KEY from the .env file
 from openai import OpenAI          # we talk to Gemini through its OpenAI-compatible endpoint
 
+# Course helpers live in shared/utils (in the project's ROOT folder)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+from http_client import get_session  # lets us call the free weather API over the internet
+
 load_dotenv()
 
+# One reusable web connection for all our tool calls. Like requests.get, but it
+# keeps the connection open between calls (faster!), gives up after a timeout
+# and tries again if the server hiccups.
+http = get_session()
+
 MODEL = "gemini-3.5-flash"
 
 
@@ -64,7 +73,7 @@ client = OpenAI(
 def find_city(name):
     """Look up a city and return its coordinates (latitude/longitude)."""
     url = "https://geocoding-api.open-meteo.com/v1/search"
-    response = requests.get(url, params={"name": name, "count": 1})
+    response = http.get(url, params={"name": name, "count": 1})
     data = response.json()
 
     if not data.get("results"):
@@ -86,7 +95,7 @@ def find_city(name):
 def get_forecast(latitude, longitude):
     """Get a simple 3-day forecast for a latitude/longitude."""
     url = "https://api.open-meteo.com/v1/forecast"
-    response = requests.get(url, params={
+    response = http.get(url, params={
         "latitude": latitude,
         "longitude": longitude,
         "daily": "temperature_2m_max,temperature_2m_min,precipitation_probability_max",
@@ -35,11 +35,16 @@ YOUR STEP-BY-STEP CHECKLIST  (search the file for "TODO" to find each one)
 
 # --- Libraries we use -------------------------------------------------------
 import os
+import sys
 import json
-import random
 from dotenv import load_dotenv     # reads your GEMINI_API_KEY from the .env file
 from openai import OpenAI          # we talk to Gemini through its OpenAI-compatible endpoint
 
+# Our shared helpers live in shared/utils at the project's ROOT folder.
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared", "utils"))
+from word_index import load_word_index   # loads wordle.txt ONCE and keeps it in memory
+from wordle_feedback import feedback_emoji  # scores a guess with the real Wordle rules
+
 # Load your secret key from the .env file into the program.
 load_dotenv()
 
@@ -60,15 +65,16 @@ client = OpenAI(
 
 # ============================================================================
 # BUILDING BLOCK — pick a secret word (already done for you)
-# Reads a random 5-letter word from wordle.txt (which is in this folder).
+# Picks a random 5-letter word from wordle.txt (which is in this folder).
+# The word list is read from disk only the first time; after that it's cached.
 # ============================================================================
+WORD_FILE = os.path.join(os.path.dirname(__file__), "wordle.txt")   # wordle.txt in this folder
+
+
 def get_secret_word():
     """Return one random 5-letter word from wordle.txt."""
-    folder = os.path.dirname(__file__)          # the folder this file lives in
-    path = os.path.join(folder, "wordle.txt")
-    with open(path, "r") as file:
-        words = [line.strip() for line in file if line.strip()]
-    return random.choice(words).upper()
+    words = load_word_index(WORD_FILE)          # read once, then reused
+    return words.random_word()
 
 
 # ============================================================================
@@ -76,6 +82,9 @@ def get_secret_word():
 # This is a normal Python function. Later, we let the AI call it as a "tool".
 # It compares a guess to the secret word and returns colored feedback:
 #     🟩 = right letter, right spot     🟨 = right letter, wrong spot     ⬜ = not in word
+# Repeated letters follow the real Wordle rules: guessing SPEED when the word is
+# ABIDE only turns ONE E yellow, because ABIDE only has one E. The scoring itself
+# lives in shared/utils/wordle_feedback.py so every Wordle in the course agrees.
 # ============================================================================
 def validate_word(guess, secret_word):
     """Compare a 5-letter guess to the secret word and return emoji feedback."""
@@ -85,14 +94,11 @@ def validate_word(guess, secret_word):
     if len(guess) != 5:
         return "That guess is not 5 letters. Ask the player to try again."
 
-    feedback = []
-    for i in range(5):
-        if guess[i] == secret_word[i]:
-            feedback.append("🟩")        # correct letter, correct position
-        elif guess[i] in secret_word:
-            feedback.append("🟨")        # letter is in the word, wrong position
-        else:
-            feedback.append("⬜")        # letter is not in the word
+    # `in` on the word index is a set lookup, so this is instant even for a long list
+    if guess not in load_word_index(WORD_FILE):
+        return "That guess is not in the word list. Ask the player to try a real word."
+
+    feedback = feedback_emoji(guess, secret_word)   # e.g. ("⬜", "🟩", "🟩", "⬜", "🟨")
 
     result = " ".join(feedback)
     if guess == secret_word:
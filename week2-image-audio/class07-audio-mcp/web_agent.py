@@ -1,5 +1,4 @@
 
-import requests
 from pydantic import BaseModel, Field
 
 import os
@@ -10,6 +9,13 @@ load_dotenv()
 from google import genai
 from openai import OpenAI
 
+import sys
+# Shared helpers (HTTP cache, pooled HTTP client, HTML-to-text, passage index) live in shared/utils at the repo root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared', 'utils'))
+from passage_index import search_article
+from html_text import html_to_text
+from http_client import get_session
+
 from stt_web_tts import generate_gemini_response, generate_loading_message, speech_to_text_gemini, record_audio_with_spacebar
 from colorama import Fore, Back, Style
 
@@ -34,19 +40,21 @@ def generate_call_id(prefix="call_"):
      return f"{prefix}{uuid.uuid4()}"
 
 
-def web_search(query):
+def web_search(query, question=None):
     from urllib.parse import quote
     quotedquery = quote(query)
-    url = f"https://en.wikipedia.org/api/rest_v1/page/mobile-html/{quotedquery}"
-    print(Fore.YELLOW + f'Fetching url: {url}....' + Style.DIM)
-    print()
-    response = requests.get(url)
-    if response.status_code == 200:
-        summary = response.text
+    # Articles are split into passages and indexed (BM25) the first time they're fetched;
+    # searching an article that's already indexed doesn't touch the network
+    found = search_article(query, question)
+    if found is not None:
+        print(Fore.YELLOW + f'Fetched url: {found.url} ({"downloaded" if found.fetched else "indexed"})' + Style.DIM)
+        print()
+        # Only the passages that best match the question (and their links), not the whole article
+        summary = found.prompt_text()
         client = genai.Client()
         response = client.models.generate_content(
         model="gemini-3.5-flash",
-        contents=f"You are responsible for extracting the answer from the wikipedia article. The query is: {quotedquery}. You must extract the answer from the wikipedia article, do not make up any information. If the answer is not found, return the answer as 'No answer found'. Also return the links to the wikipedia article or any related articles found in the extracted text. The wikipedia article is: {summary}",
+        contents=f"You are responsible for extracting the answer from the wikipedia article. The query is: {quotedquery}. The user's question is: {question}. You must extract the answer from the passages of the wikipedia article, do not make up any information. If the answer is not found, return the answer as 'No answer found'. Also return the links to the wikipedia article or any related articles found in the extracted text. The passages of the wikipedia article are: {summary}",
         config={
             "response_mime_type": "application/json",
             "response_schema": SearchResult
@@ -56,14 +64,15 @@ def web_search(query):
             print(Fore.CYAN + response.text+ Style.DIM)
         return response.text
     else:
-        print(Fore.RED + f"Invalid search query. No articles found. Status code: {response.status_code}" + Style.DIM)
-        return  f"No articles found for {query}. Status code: {response.status_code}. Try another or rephrase."
+        print(Fore.RED + "Invalid search query. No articles found." + Style.DIM)
+        return  f"No articles found for {query}. Try another or rephrase."
 
 def web_open_link(link:str) -> str:
     client = genai.Client()
-    response = requests.get(link)
+    response = get_session().get(link)
     if response.status_code == 200:
-        summary = response.text
+        # Just the article text, headings and links (not ~100 kB of raw HTML)
+        summary = html_to_text(response.text)
         response = client.models.generate_content(
         model="gemini-3.5-flash",
         contents=f"You are responsible for extracting the answer from the wikipedia article. The query is: {query}. You must extract the answer from the wikipedia article, do not make up any information. If the answer is not found, return the answer as 'No answer found'. Also return the links to the wikipedia article or any related articles found in the extracted text. The wikipedia article is: {summary}",
@@ -118,7 +127,7 @@ def generate_search_plan(query:str) -> str:
         return "Think step by step!"
 
 from typing import Tuple
-def execute_function(tool_name: str, args) -> Tuple[bool, str]:
+def execute_function(tool_name: str, args, question: str = None) -> Tuple[bool, str]:
     print(Fore.YELLOW + "Tool call: " + Style.DIM, tool_name, args)
     if tool_name == 'open_link':
         return (False, web_open_link(args.get('link', "")))
@@ -126,14 +135,32 @@ def execute_function(tool_name: str, args) -> Tuple[bool, str]:
         return (False, generate_search_plan(args.get('query', "")))
     elif tool_name == "encyclopedia_search":
         query = args.get("query")
-        return (False, f"Query: {query}, Results: {web_search(query)}")
+        return (False, f"Query: {query}, Results: {web_search(query, question)}")
     elif tool_name == "answer_question":
         answer = args.get("answer", "")
         print(Fore.GREEN+"Breaking out of loop, answering question!")
         return (True, f"{answer}")
     else:
         return (False, "unknown function called!")
-    
+
+
+from concurrent.futures import ThreadPoolExecutor
+# Most tool calls from one model turn that run at the same time
+MAX_PARALLEL_TOOL_CALLS = 8
+
+def execute_functions(tool_calls, question: str = None) -> dict[str, Tuple[bool, str]]:
+    """Run all the tool calls from one model turn at the same time (each is a web fetch + a Gemini call).
+
+    Returns a dict of tool_call.id -> execute_function result, so the turn takes as
+    long as its slowest call instead of the sum of all of them.
+    """
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_TOOL_CALLS, len(tool_calls))) as pool:
+        futures = {
+            tool_call.id: pool.submit(execute_function, tool_call.function.name, json.loads(tool_call.function.arguments), question)
+            for tool_call in tool_calls
+        }
+        return {call_id: future.result() for call_id, future in futures.items()}
+
 
 
 from datetime import datetime
@@ -295,14 +322,18 @@ def integrate_api_calls_with_gemini(model:str="gemini-3.5-flash", max_iterations
             tool_calls = response.choices[0].message.tool_calls
             for tool_call in tool_calls:
                 tool_call.id = generate_call_id()
-                args = json.loads(tool_call.function.arguments)
-                if count%2==0 and query_style == "1":
-                    print("Generating response for voice search")
-                    if tool_call.function.name != 'answer_question':
-                        generate_loading_message(query, tool_call.function.name)
-                    else:
-                        pass
-                answer_found, content = execute_function(tool_call.function.name, args)
+            # Calls after an answer are never used, so only run up to the first answer_question
+            names = [tool_call.function.name for tool_call in tool_calls]
+            if 'answer_question' in names:
+                tool_calls = tool_calls[:names.index('answer_question') + 1]
+            lookups = [name for name in names[:len(tool_calls)] if name != 'answer_question']
+            if count%2==0 and query_style == "1" and lookups:
+                # One loading message for the whole batch of lookups
+                print("Generating response for voice search")
+                generate_loading_message(query, lookups[0])
+            results = execute_functions(tool_calls, query)
+            for tool_call in tool_calls:
+                answer_found, content = results[tool_call.id]
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,